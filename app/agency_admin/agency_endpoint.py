@@ -1,107 +1,120 @@
-import asyncio
-import json
+import base64
+import binascii
+import io
 import logging
-import os
+from typing import AsyncIterator, Optional
 
 import aiohttp
-from fastapi import APIRouter, HTTPException
-
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from starlette.datastructures import UploadFile
+from starlette.formparsers import MultiPartException, MultiPartParser
+
+from app.agency_admin.brand_codec import decode_brand
+from app.agency_admin.bulk import (
+    BulkRequest,
+    build_create_payload,
+    build_update_payload,
+    run_bulk,
+    upstream_error,
+)
+from app.agency_admin.catalog import agency_catalog, build_agency, serialize_response
+from app.agency_admin.category_tree import category_cache
+from app.agency_admin.product_mirror import content_hash, product_mirror
+from app.common.config import settings
+from app.common.http_cache import (
+    cache_headers,
+    cached_response,
+    is_not_modified,
+    not_modified_response,
+    quote_etag,
+)
+from app.common.responses import dumps
+from app.common.shared_state import shared_state
+from app.common.tracing import span
+from app.imweb.image_store import image_store
+from app.imweb.limiter import imweb_limiter
 from app.imweb.old_imweb import imweb_service
+from app.imweb.resilience import deadline
+from app.mbti.compatibility import mbti_compatibility
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-# 상수 추가
-LOCATION_MAP = {"서울": "s", "그 외": "e"}
-
-REVERSE_LOCATION_MAP = {"s": "서울", "e": "그 외"}
-
-MBTI_MAP = {
-    "ENFJ": "1",
-    "ENFP": "2",
-    "ENTJ": "3",
-    "ENTP": "4",
-    "ESFJ": "5",
-    "ESFP": "6",
-    "ESTJ": "7",
-    "ESTP": "8",
-    "INFJ": "9",
-    "INFP": "0",
-    "INTJ": "a",
-    "INTP": "b",
-    "ISFJ": "c",
-    "ISFP": "d",
-    "ISTJ": "e",
-    "ISTP": "f",
-}
+# Response 모델
+class Agency(BaseModel):
+    no: int | str | None = None
+    name: str | None = None
+    content: str | None = ""
+    category: list = []
+    brand: str | None = None
+    location: str | None = None
+    mbti: str | None = None
+    main_category: str | None = None
+    sub_categories: list = []
+    image_url: str | None = None
+    status: str | None = None
 
-REVERSE_MBTI_MAP = {v: k for k, v in MBTI_MAP.items()}
-
-CATEGORY_MAP = {
-    "웹개발": "w",
-    "디자인": "d",
-    "앱개발": "a",
-    "영상/사진": "p",
-    "브랜딩": "b",
-    "마케팅": "m",
-    "번역/통역": "t",
-    "컨설팅": "c",
-}
 
-REVERSE_CATEGORY_MAP = {v: k for k, v in CATEGORY_MAP.items()}
-
-SUB_CATEGORY_MAP = {
-    # 웹개발
-    "프론트엔드": "1",
-    "백엔드": "2",
-    "풀스택": "3",
-    "쇼핑몰": "4",
-    "랜딩페이지": "5",
-    "기타 웹개발": "6",
-    # 디자인/브랜딩 공통
-    "UI/UX": "a",
-    "그래픽": "b",
-    "3D": "c",
-    "일러스트": "d",
-    "편집": "e",
-    "CI/BI": "f",
-    "패키지": "g",
-    "네이밍": "h",
-    "브랜드전략": "i",
-    "기타 디자인": "j",
-    "기타 브랜딩": "k",
-    # 앱개발
-    "안드로이드": "l",
-    "iOS": "m",
-    "크로스플랫폼": "n",
-    "하이브리드": "o",
-    "기타 앱개발": "p",
-    # 영상/사진
-    "영상촬영": "q",
-    "영상편집": "r",
-    "사진촬영": "s",
-    "사진편집": "t",
-    "기타 영상/사진": "u",
-    # 마케팅
-    "SNS마케팅": "v",
-    "퍼포먼스": "w",
-    "콘텐츠제작": "x",
-    "PR": "y",
-    "기타 마케팅": "z",
-    # 번역/통역
-    "영어": "7",
-    "중국어": "8",
-    "일본어": "9",
-    "기타 번역/통역": "0",
-    # 컨설팅
-    "경영컨설팅": "A",
-    "IT컨설팅": "B",
-    "마케팅컨설": "C",
-    "기타 컨설팅": "D",
-}
+class AgencyDetail(Agency):
+    simple_content: str | None = ""
+
+
+class AgencyListResponse(BaseModel):
+    code: int = 200
+    message: str = "success"
+    data: list[Agency]
+
+
+class AgencyDetailResponse(BaseModel):
+    code: int = 200
+    message: str = "success"
+    data: AgencyDetail
+
+
+class AgencySearchResult(BaseModel):
+    total: int
+    page: int
+    per_page: int
+    items: list[Agency]
+    facets: dict[str, dict[str, int]]
+    version: int
+
 
-REVERSE_SUB_CATEGORY_MAP = {v: k for k, v in SUB_CATEGORY_MAP.items()}
+class AgencySearchResponse(BaseModel):
+    code: int = 200
+    message: str = "success"
+    data: AgencySearchResult
+
+
+class ImageUploadResult(BaseModel):
+    url: str
+    sha256: str
+    size: int
+    content_type: str
+    deduplicated: bool
+
+
+class ImageUploadResponse(BaseModel):
+    code: int = 200
+    message: str = "success"
+    data: ImageUploadResult
+
+
+class MBTISectionMatch(BaseModel):
+    best_match: list[str]
+    good_match: list[str]
+
+
+class MBTIMatchSummary(BaseModel):
+    section_match: MBTISectionMatch
+
+
+class MBTIMatchResult(MBTIMatchSummary):
+    mbti: str
+    scores: dict[str, int]
 
 
 # 이미지 URL 처리 함수 추가
@@ -127,330 +140,305 @@ def process_image_url(image_urls):
             # CDN URL 구성 - 이미 S20241019b5f39d60ebd35가 포함되어 있으므로 base URL만 추가
             return f"https://cdn-optimized.imweb.me/upload/{image_urls}"
     except Exception as e:
-        logger.error(f"이미지 URL 처리 오류: {str(e)}")
+        logger.error("이미지 URL 처리 오류: %s", e)
         return None
 
 
-@router.get("/list")
-async def get_agencies():
-    """에이전시 목록 조회"""
+@router.get("/list", response_model=AgencyListResponse)
+async def get_agencies(request: Request):
+    """에이전시 목록 조회 (메모리 스냅샷에서 응답, 변경 없으면 304)"""
     try:
-        # 토큰 재시도 로직
-        for attempt in range(3):
-            access_token = await imweb_service.get_access_token()
-            logger.info(
-                f"액세스 토큰 발급 시도 {attempt + 1}: {access_token is not None}"
-            )
-
-            if access_token:
-                break
-
-            await asyncio.sleep(1)
-
-        if not access_token:
-            logger.error("토큰 발급 3회 시도 실패")
-            raise HTTPException(status_code=401, detail="토큰 발급 실패")
-
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30)
-        ) as session:
-            headers = {"Content-Type": "application/json", "access-token": access_token}
-            products_url = f"{imweb_service.base_url}/shop/products"
-            params = {"per_page": 100, "page": 1}
-
-            async with session.get(
-                products_url,
-                headers=headers,
-                params=params,
-                timeout=aiohttp.ClientTimeout(total=30),
-            ) as response:
-                logger.info(f"상품 목록 조회 상태 코드: {response.status}")
-                result = await response.json()
-
-                if result.get("code") != 200:
-                    logger.error(f"API 응답 에러: {result}")
-                    if result.get("code") == 401:
-                        await imweb_service.refresh_token()
-                        raise HTTPException(
-                            status_code=401, detail="토큰 만료, 재시도 필요"
-                        )
-
-                products = result.get("data", {}).get("list", [])
-                logger.info(f"조회된 전체 상품 수: {len(products)}")
-
-                agencies = []
-                for item in products:
-                    try:
-                        # 이미지 URL 처리
-                        image_urls = item.get("image_url", {})
-                        logger.info(f"상품 {item.get('name')} 이미지 URL: {image_urls}")
-                        first_image_url = (
-                            next(iter(image_urls.values()), None)
-                            if image_urls
-                            else None
-                        )
-
-                        # brand 데이터 파싱
-                        brand_data = json.loads(item.get("brand", "[]"))
-                        logger.info(
-                            f"상품 {item.get('name')} brand 데이터: {brand_data}"
-                        )
-
-                        if isinstance(brand_data, list) and len(brand_data) >= 4:
-                            location = REVERSE_LOCATION_MAP.get(brand_data[0], "서울")
-                            mbti = REVERSE_MBTI_MAP.get(brand_data[1], "ENFJ")
-                            main_category = brand_data[2]
-                            sub_categories = brand_data[3]
-                        else:
-                            location = "서울"
-                            mbti = "ENFJ"
-                            main_category = ""
-                            sub_categories = []
-
-                        agency = {
-                            "no": item.get("no"),
-                            "name": item.get("name"),
-                            "content": item.get("simple_content_plain", ""),
-                            "category": item.get("categories", []),
-                            "brand": item.get("brand"),
-                            "location": location,
-                            "mbti": mbti,
-                            "main_category": main_category,
-                            "sub_categories": sub_categories,
-                            "image_url": first_image_url,
-                            "status": item.get("prod_status"),
-                        }
-                        logger.info(f"파싱된 에이전시 데이터: {agency}")
-                        agencies.append(agency)
-
-                    except Exception as e:
-                        logger.error(f"데이터 처리 중 오류 발생: {str(e)}")
-                        logger.error(f"문제가 된 데이터: {item.get('brand')}")
-                        continue
-
-                logger.info(f"최종 처리된 에이전시 수: {len(agencies)}")
-                return {"code": 200, "message": "success", "data": agencies}
+        snapshot = await agency_catalog.get()
+        return cached_response(
+            request,
+            snapshot.body,
+            settings.AGENCY_LIST_CACHE_CONTROL,
+            etag=snapshot.etag,
+            last_modified=snapshot.modified_at,
+            compressed=snapshot.compressed,
+        )
 
     except aiohttp.ClientError as e:
-        logger.error(f"API 요청 실패: {str(e)}")
+        logger.error("API 요청 실패: %s", e)
         raise HTTPException(status_code=500, detail="API 요청 실패")
 
 
-@router.patch("/{agency_id}")
-async def update_agency(agency_id: str, data: dict):
-    """에이전시 정보 업데이트"""
+def _split_values(values: Optional[list[str]]) -> list[str]:
+    """반복 파라미터와 콤마 구분 값 모두 지원"""
+    if not values:
+        return []
+    return [value for raw in values for value in raw.split(",") if value.strip()]
+
+
+@router.get("/search", response_model=AgencySearchResponse)
+async def search_agencies(
+    location: Optional[list[str]] = Query(None),
+    mbti: Optional[list[str]] = Query(None),
+    main_category: Optional[list[str]] = Query(None),
+    sub_categories: Optional[list[str]] = Query(None),
+    status: Optional[list[str]] = Query(None),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(20, ge=1, le=100),
+):
+    """에이전시 필터 검색 (위치 / MBTI / 메인 카테고리 / 서브 카테고리 / 상태)"""
     try:
-        logger.info(f"에이전시 업데이트 시작 - agency_id: {agency_id}")
-        logger.info(f"요청 데이터: {data}")
-
-        access_token = await imweb_service.get_access_token()
-        if not access_token:
-            logger.error("토큰 발급 실패")
-            raise HTTPException(status_code=401, detail="토큰 발급 실패")
-        image_url = None
-        if "image" in data:
-            image_data = data["image"]
-            image_url = await imweb_service.upload_image(access_token, image_data)
-            if image_url:
-                logger.info(f"이미지 업로드 성공: {image_url}")
-        update_data = {
-            "no": data.get("no"),  # 상품번호
-            "name": data.get("name"),  # 상품명
-            "content": data.get("content"),  # 상세설명
-            "simple_content": data.get("simple_content"),  # 요약설명이 누락되어 있었음
-            "category": data.get("category", []),  # 카테고리 코드
-            "brand": data.get("brand"),  # 브랜드 정보
-            "location": data.get("location"),  # 위치 정보
-            "mbti": data.get("mbti"),  # MBTI 정보
-            "main_category": data.get("main_category"),  # 메인 카테고리
-            "sub_categories": data.get("sub_categories", []),  # 서브 카테고리 목록
-            "image_url": image_url if image_url else data.get("image_url"),
-            "status": data.get("status", "sale"),  # 상태
-            "display_status": "VISIBLE",  # 노출 상태 추가
+        snapshot = await agency_catalog.get()
+        filters = {
+            "location": _split_values(location),
+            "mbti": _split_values(mbti),
+            "main_category": _split_values(main_category),
+            "sub_categories": _split_values(sub_categories),
+            "status": _split_values(status),
         }
+        with span("search"):
+            result = snapshot.search_index.search(filters, page=page, per_page=per_page)
+        result["version"] = snapshot.version
+        return {"code": 200, "message": "success", "data": result}
 
-        logger.info(f"구성된 업데이트 데이터: {update_data}")
-
-        async with aiohttp.ClientSession() as session:
-            headers = {"Content-Type": "application/json", "access-token": access_token}
-            url = f"{imweb_service.base_url}/shop/products/{agency_id}"
-
-            async with session.patch(
-                url, headers=headers, json=update_data
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    logger.info(f"아임웹 API 응답: {result}")
-                    return {"code": 200, "message": "업데이트 성공", "data": result}
-                else:
-                    error_data = await response.text()
-                    logger.error(f"아임웹 API 오류 응답: {error_data}")
-                    raise HTTPException(status_code=response.status, detail=error_data)
-
-    except Exception as e:
-        logger.error(f"에이전시 업데이트 중 예외 발생: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
-
+    except aiohttp.ClientError as e:
+        logger.error("API 요청 실패: %s", e)
+        raise HTTPException(status_code=500, detail="API 요청 실패")
 
-@router.post("/create")
-async def create_agency(data: dict):
-    """새 에이전시 추가"""
-    try:
-        access_token = await imweb_service.get_access_token()
-        if not access_token:
-            raise HTTPException(status_code=401, detail="토큰 발급 실패")
 
-        # 상품 데이터 준비
-        product_data = {
-            "name": data["name"],
-            "content": data["content"],
-            "simple_content": data["simple_content"],
-            "brand": data["brand"],
-            "prod_status": "sale",
-            "price": 0,
-            "price_tax": False,
-            "stock_use": False,
-            "categories": [os.getenv("IMWEB_AGENCY_CATEGORY")],
-            "display_status": "VISIBLE",
-            "images": [
-                {
-                    "url": "https://cdn.imweb.me/upload/S202411023d3941ab4335b/6b53a30e8b45a.png",
-                    "thumb_url": "https://cdn.imweb.me/upload/S202411023d3941ab4335b/6b53a30e8b45a.png",
-                    "caption": "",
+@router.get("/catalog/stats")
+async def get_catalog_stats():
+    """에이전시 목록 스냅샷 상태 조회"""
+    data = agency_catalog.stats()
+    data["mirror"] = product_mirror.stats()
+    return {"code": 200, "message": "success", "data": data}
+
+
+@router.get("/upstream/stats")
+async def get_upstream_stats():
+    """아임웹 호출 상태 조회 (동시 호출 한도 / 대기열 / 대기 시간, 서킷 상태)"""
+    return {
+        "code": 200,
+        "message": "success",
+        "data": {
+            "limiter": imweb_limiter.stats(),
+            "breaker": imweb_service.breaker.stats(),
+            "images": image_store.stats(),
+            "categories": category_cache.stats(),
+            "shared_state": shared_state.stats(),
+        },
+    }
+
+
+# multipart 경계 / 파트 헤더 / 다른 필드 여유분
+MULTIPART_OVERHEAD = 64 * 1024
+
+IMAGE_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {"file": {"type": "string", "format": "binary"}},
                 }
-            ],
-        }
-
-        logger.info(f"아임웹 전송 데이터: {product_data}")
-
-        async with aiohttp.ClientSession() as session:
-            headers = {"Content-Type": "application/json", "access-token": access_token}
-            url = f"{imweb_service.base_url}/shop/products"
-
-            async with session.post(
-                url, headers=headers, json=product_data
-            ) as response:
-                result = await response.json()
-                logger.info(f"에이전시 생성 결과: {result}")
-                return {"code": 200, "data": result}
+            }
+        },
+    }
+}
 
-    except Exception as e:
-        logger.error(f"에이전시 생성 실패: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
 
+def _decode_image(value: str) -> io.BytesIO:
+    """JSON으로 받은 base64 이미지 (data URL 허용) 디코딩"""
+    _, _, encoded = value.rpartition("base64,")
+    if len(encoded) * 3 // 4 > image_store.max_bytes:
+        raise HTTPException(
+            status_code=413,
+            detail=f"이미지 크기는 {image_store.max_bytes} bytes 이하여야 합니다",
+        )
+    try:
+        return io.BytesIO(base64.b64decode(encoded, validate=True))
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="올바르지 않은 이미지 데이터입니다")
+
+
+async def _limited_stream(
+    stream: AsyncIterator[bytes], limit: int
+) -> AsyncIterator[bytes]:
+    """요청 본문을 읽으면서 크기 제한 확인 (Content-Length 없는 요청 포함)"""
+    received = 0
+    async for chunk in stream:
+        received += len(chunk)
+        if received > limit:
+            raise HTTPException(status_code=413, detail="업로드 크기 제한 초과")
+        yield chunk
+
+
+@router.post(
+    "/image", response_model=ImageUploadResponse, openapi_extra=IMAGE_UPLOAD_OPENAPI
+)
+async def upload_agency_image(request: Request):
+    """에이전시 이미지 업로드 (multipart file 필드, 이미 올린 이미지는 기존 URL 반환)
+
+    파일은 메모리 대신 임시 파일로 받아 청크 단위로 검사/전송
+    """
+    limit = image_store.max_bytes + MULTIPART_OVERHEAD
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > limit:
+        raise HTTPException(status_code=413, detail="업로드 크기 제한 초과")
+    if not request.headers.get("content-type", "").startswith("multipart/form-data"):
+        raise HTTPException(status_code=415, detail="multipart/form-data로 보내주세요")
+
+    parser = MultiPartParser(
+        request.headers,
+        _limited_stream(request.stream(), limit),
+        max_files=1,
+        max_fields=10,
+    )
+    try:
+        form = await parser.parse()
+    except MultiPartException as e:
+        raise HTTPException(status_code=400, detail=e.message)
 
-@router.get("/{agency_id}")
-async def get_agency(agency_id: str):
-    """개별 에이전시 정보 조회"""
     try:
-        access_token = await imweb_service.get_access_token()
-        if not access_token:
-            raise HTTPException(status_code=401, detail="토큰 발급 실패")
+        upload = form.get("file")
+        if not isinstance(upload, UploadFile):
+            raise HTTPException(status_code=400, detail="file 필드가 필요합니다")
+        result = await image_store.upload(upload.file, upload.filename or "image")
+        return {"code": 200, "message": "success", "data": result}
+    finally:
+        await form.close()
 
-        async with aiohttp.ClientSession() as session:
-            headers = {"Content-Type": "application/json", "access-token": access_token}
-            url = f"{imweb_service.base_url}/shop/products/{agency_id}"
-
-            async with session.get(url, headers=headers) as response:
-                if response.status != 200:
-                    error_data = await response.text()
-                    logger.error(f"아임웹 API 응답: {error_data}")
-                    raise HTTPException(
-                        status_code=response.status, detail="에이전시 정보 조회 실패"
-                    )
-
-                data = await response.json()
-                item = data.get("data", {})
-
-                try:
-                    # 이미지 URL 처리
-                    image_urls = item.get("image_url", {})
-                    first_image_url = (
-                        next(iter(image_urls.values()), None) if image_urls else None
-                    )
-
-                    # brand 데이터 파싱
-                    brand_data = json.loads(item.get("brand", "[]"))
-                    if isinstance(brand_data, list) and len(brand_data) >= 4:
-                        location = REVERSE_LOCATION_MAP.get(brand_data[0], "서")
-                        mbti = REVERSE_MBTI_MAP.get(brand_data[1], "ENFJ")
-                        main_category = brand_data[2]
-                        sub_categories = brand_data[3]
-                    else:
-                        location = "서울"
-                        mbti = "ENFJ"
-                        main_category = ""
-                        sub_categories = []
-
-                    agency = {
-                        "no": item.get("no"),
-                        "name": item.get("name"),
-                        "content": item.get("content", ""),  # HTML 형식의 상세 설명
-                        "simple_content": item.get("simple_content", ""),
-                        "category": item.get("categories", []),
-                        "brand": item.get("brand"),
-                        "location": location,
-                        "mbti": mbti,
-                        "main_category": main_category,
-                        "sub_categories": sub_categories,
-                        "image_url": first_image_url,
-                        "status": item.get("prod_status"),
-                    }
-
-                    return {"code": 200, "message": "success", "data": agency}
-
-                except Exception as e:
-                    logger.error(f"데이터 처리 중 오류 발생: {str(e)}")
-                    logger.error(f"문제가 된 데이터: {item.get('brand')}")
-                    raise HTTPException(
-                        status_code=500, detail="데이터 처리 중 오류 발생"
-                    )
 
+@router.patch("/{agency_id}")
+async def update_agency(agency_id: str, data: dict):
+    """에이전시 정보 업데이트"""
+    try:
+        # 토큰 / 이미지 업로드 / 수정 요청 전체에 하나의 제한 시간 적용
+        with deadline(settings.IMWEB_REQUEST_DEADLINE):
+            logger.info("에이전시 업데이트 시작 - agency_id: %s", agency_id)
+            logger.debug("요청 데이터: %s", data)
+
+            image_url = None
+            if data.get("image"):
+                # base64 이미지 (큰 이미지는 /agency/image로 업로드 후 image_url 사용)
+                image = await image_store.upload(_decode_image(data["image"]), "image")
+                image_url = image["url"]
+            update_data = build_update_payload(data, image_url)
+
+            logger.debug("구성된 업데이트 데이터: %s", update_data)
+
+            response = await imweb_service.request(
+                "PATCH", f"/shop/products/{agency_id}", json=update_data
+            )
+            error = upstream_error(response)
+            if error is None:
+                result = response.data
+                logger.debug("아임웹 API 응답: %s", result)
+                # 변경 내용을 미러와 목록 스냅샷에 반영
+                product_mirror.invalidate(agency_id)
+                agency_catalog.schedule_rebuild()
+                return {"code": 200, "message": "업데이트 성공", "data": result}
+            else:
+                status_code, error_data = error
+                logger.error("아임웹 API 오류 응답: %s", error_data)
+                raise HTTPException(status_code=status_code, detail=error_data)
+
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"에이전시 정보 조회 실패: {str(e)}")
+        logger.error("에이전시 업데이트 중 예외 발생: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/mbti-results")
-async def get_mbti_matching_data():
-    """MBTI 매칭 데이터 조회"""
+@router.post("/create")
+async def create_agency(data: dict):
+    """새 에이전시 추가"""
     try:
-        results = await get_all_mbti_results()
-        logger.info(f"가져온 MBTI 결과 데이터: {results}")  # 초기 데이터 로깅 추가
-
-        # 결과를 MBTI를 키로 하는 딕셔너리로 변환
-        mbti_data = {}
-        for result in results:
-            mbti = result["mbti"]
-            # best_match와 good_match를 리스트로 변환
-            best_matches = result["section_match"]["best_match"].split(", ")
-            good_matches = result["section_match"]["good_match"].split(", ")
-
-            mbti_data[mbti] = {
-                "section_match": {
-                    "best_match": best_matches,
-                    "good_match": good_matches,
-                }
-            }
-
-        logger.info(f"변환된 MBTI 매칭 데이터: {mbti_data}")  # 변환된 데이터 로깅
-        return mbti_data
+        # 상품 데이터 준비
+        product_data = build_create_payload(data)
+
+        logger.debug("아임웹 전송 데이터: %s", product_data)
+
+        response = await imweb_service.request(
+            "POST", "/shop/products", json=product_data
+        )
+        error = upstream_error(response)
+        if error is not None:
+            status_code, error_data = error
+            logger.error("아임웹 API 오류 응답: %s", error_data)
+            raise HTTPException(status_code=status_code, detail=error_data)
+        result = response.data
+        logger.debug("에이전시 생성 결과: %s", result)
+        # 변경 내용을 목록 스냅샷에 반영
+        agency_catalog.schedule_rebuild()
+        return {"code": 200, "data": result}
+
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"MBTI 매칭 데이터 조회 실패: {str(e)}")
+        logger.error("에이전시 생성 실패: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/mbti-result/{mbti}")
-async def get_single_mbti_result(mbti: str):
+def _bulk_summary(total: int, results: list[dict]) -> dict:
+    succeeded = sum(1 for result in results if result["status"] == "ok")
+    return {"total": total, "succeeded": succeeded, "failed": len(results) - succeeded}
+
+
+async def _bulk_lines(request: BulkRequest) -> AsyncIterator[bytes]:
+    """항목이 끝날 때마다 결과 한 줄, 마지막에 요약 한 줄"""
+    results = []
+    async for result in run_bulk(request.operations):
+        results.append(result)
+        yield dumps(result) + b"\n"
+    summary = _bulk_summary(len(request.operations), results)
+    yield dumps({"summary": summary}) + b"\n"
+
+
+@router.post("/bulk")
+async def bulk_agencies(
+    request: BulkRequest,
+    format: str = Query("json", pattern="^(json|ndjson)$"),
+):
+    """에이전시 일괄 생성/수정 (모든 항목을 먼저 검증, 일부 실패해도 나머지는 처리)
+
+    format=ndjson이면 진행 상황을 항목별 한 줄씩 스트리밍
+    """
+    logger.info(
+        "에이전시 일괄 처리 시작 - %s건, 형식: %s", len(request.operations), format
+    )
+    if format == "ndjson":
+        return StreamingResponse(
+            _bulk_lines(request), media_type="application/x-ndjson"
+        )
+
+    results = [result async for result in run_bulk(request.operations)]
+    results.sort(key=lambda result: result["index"])
+    summary = _bulk_summary(len(request.operations), results)
+    return {"code": 200, "message": "success", "data": {**summary, "results": results}}
+
+
+@router.get("/mbti-results", response_model=dict[str, MBTIMatchSummary])
+async def get_mbti_matching_data(request: Request):
+    """MBTI 매칭 데이터 조회 (미리 직렬화된 응답, 변경 없으면 304)"""
+    return cached_response(
+        request,
+        mbti_compatibility.all_body,
+        settings.MBTI_RESULT_CACHE_CONTROL,
+        etag=mbti_compatibility.all_etag,
+        compressed=mbti_compatibility.all_compressed,
+    )
+
+
+@router.get("/mbti-result/{mbti}", response_model=MBTIMatchResult)
+async def get_single_mbti_result(mbti: str, request: Request):
     """특정 MBTI 결과 조회"""
-    try:
-        result = await get_mbti_result(mbti)
-        if not result:
-            raise HTTPException(status_code=404, detail="MBTI 결과를 찾을 수 없습니다")
-        return result
-    except Exception as e:
-        logger.error(f"MBTI 결과 조회 실패: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    mbti_type = mbti_compatibility.normalize(mbti)
+    if not mbti_type:
+        raise HTTPException(status_code=404, detail="MBTI 결과를 찾을 수 없습니다")
+    return cached_response(
+        request,
+        mbti_compatibility.bodies[mbti_type],
+        settings.MBTI_RESULT_CACHE_CONTROL,
+        etag=mbti_compatibility.etags[mbti_type],
+        compressed=mbti_compatibility.compressed[mbti_type],
+    )
 
 
 @router.get("/token")
@@ -468,28 +456,88 @@ async def get_token():
                 "access_token": access_token  # 여기에 토큰을 넣어줌
             },
         }
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"토큰 발급 중 오류 발생: {str(e)}")
+        logger.error("토큰 발급 중 오류 발생: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/categories")
-async def get_categories():
-    """아임웹 카테고리 목록 조회"""
+async def get_categories(request: Request):
+    """아임웹 카테고리 목록 조회 (메모리 캐시에서 응답, 변경 없으면 304)"""
+    if not category_cache.is_loaded:
+        # 요청 중에는 아임웹을 기다리지 않고 백그라운드 조회만 요청
+        category_cache.schedule_refresh()
+        raise HTTPException(
+            status_code=503,
+            detail="카테고리 정보를 불러오는 중입니다",
+            headers={"Retry-After": "5"},
+        )
+    tree = category_cache.tree
+    return cached_response(
+        request,
+        tree.body,
+        settings.CATEGORY_CACHE_CONTROL,
+        etag=tree.etag,
+        last_modified=tree.modified_at,
+        compressed=tree.compressed,
+    )
+
+
+# 개별 조회는 고정 경로(/token, /categories 등) 뒤에 등록해야 가려지지 않음
+@router.get("/{agency_id}", response_model=AgencyDetailResponse)
+async def get_agency(agency_id: str, request: Request):
+    """개별 에이전시 정보 조회 (상품 미러 → 아임웹 순, 변경 없으면 304)"""
     try:
-        access_token = await imweb_service.get_access_token()
-        if not access_token:
-            raise HTTPException(status_code=401, detail="토큰 발급 실패")
-
-        async with aiohttp.ClientSession() as session:
-            headers = {"Content-Type": "application/json", "access-token": access_token}
-            url = f"{imweb_service.base_url}/shop/categories"
+        entry = product_mirror.get_entry(agency_id)
+        if entry is not None and "content" in entry[0]:
+            item, digest = entry
+        else:
+            response = await imweb_service.request(
+                "GET", f"/shop/products/{agency_id}"
+            )
+            if response.status != 200:
+                error_data = response.text
+                logger.error("아임웹 API 응답: %s", error_data)
+                raise HTTPException(
+                    status_code=response.status, detail="에이전시 정보 조회 실패"
+                )
+
+            data = response.data or {}
+            item = data.get("data", {})
+            digest = content_hash(item)
+
+        # 응답에 쓰이는 필드의 해시가 같으면 변환/직렬화 없이 304
+        etag = quote_etag(digest)
+        cache_control = settings.AGENCY_DETAIL_CACHE_CONTROL
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, cache_control)
+
+        try:
+            # brand 데이터 파싱
+            with span("transform"):
+                agency = build_agency(item, decode_brand(item.get("brand", "[]")))
+            agency["content"] = item.get("content", "")  # HTML 형식의 상세 설명
+            agency["simple_content"] = item.get("simple_content", "")
+
+            return Response(
+                content=serialize_response(
+                    {"code": 200, "message": "success", "data": agency}
+                ),
+                media_type="application/json",
+                headers=cache_headers(etag, cache_control),
+            )
 
-            async with session.get(url, headers=headers) as response:
-                result = await response.json()
-                logger.info(f"카테고리 조회 결과: {result}")
-                return {"code": 200, "data": result}
+        except Exception as e:
+            logger.error("데이터 처리 중 오류 발생: %s", e)
+            logger.error("문제가 된 데이터: %s", item.get("brand"))
+            raise HTTPException(
+                status_code=500, detail="데이터 처리 중 오류 발생"
+            )
 
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"카테고리 조회 실패: {str(e)}")
+        logger.error("에이전시 정보 조회 실패: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
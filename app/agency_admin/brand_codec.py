@@ -0,0 +1,151 @@
+import json
+from typing import Iterable, Optional
+
+from app.agency_admin.constants import (
+    CATEGORY_MAP,
+    LOCATION_MAP,
+    MBTI_MAP,
+    REVERSE_LOCATION_MAP,
+    REVERSE_MBTI_MAP,
+    SUB_CATEGORY_MAP,
+)
+
+# 디코딩 결과 캐시 최대 크기 (brand 문자열 기준)
+BRAND_CACHE_SIZE = 131072
+
+DEFAULT_LOCATION = "서울"
+DEFAULT_MBTI = "ENFJ"
+
+
+class BrandRecord:
+    """brand 필드 디코딩 결과 (위치 / MBTI / 메인 카테고리 / 서브 카테고리)"""
+
+    __slots__ = (
+        "location_code",
+        "mbti_code",
+        "location",
+        "mbti",
+        "main_category",
+        "sub_categories",
+    )
+
+    def __init__(
+        self,
+        location_code: Optional[str],
+        mbti_code: Optional[str],
+        main_category: str,
+        sub_categories: tuple,
+    ):
+        self.location_code = location_code
+        self.mbti_code = mbti_code
+        self.location = REVERSE_LOCATION_MAP.get(location_code, DEFAULT_LOCATION)
+        self.mbti = REVERSE_MBTI_MAP.get(mbti_code, DEFAULT_MBTI)
+        self.main_category = main_category
+        self.sub_categories = sub_categories
+
+    def __eq__(self, other):
+        if not isinstance(other, BrandRecord):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self):
+        return (
+            f"BrandRecord({self.location!r}, {self.mbti!r}, "
+            f"{self.main_category!r}, {list(self.sub_categories)!r})"
+        )
+
+
+# brand 값이 형식에 맞지 않을 때의 기본값
+DEFAULT_RECORD = BrandRecord(None, None, "", ())
+
+_cache: dict[str, BrandRecord] = {}
+
+
+def _to_record(brand_data) -> BrandRecord:
+    if not isinstance(brand_data, list) or len(brand_data) < 4:
+        return DEFAULT_RECORD
+    sub_categories = brand_data[3]
+    if isinstance(sub_categories, list):
+        sub_categories = tuple(sub_categories)
+    return BrandRecord(brand_data[0], brand_data[1], brand_data[2], sub_categories)
+
+
+def _looks_like_array(brand: str) -> bool:
+    brand = brand.strip()
+    return brand.startswith("[") and brand.endswith("]")
+
+
+def _remember(brand: str, record: BrandRecord):
+    if len(_cache) >= BRAND_CACHE_SIZE:
+        # 가장 오래된 항목부터 제거
+        del _cache[next(iter(_cache))]
+    _cache[brand] = record
+
+
+def decode_brand(brand: str) -> BrandRecord:
+    """brand 문자열 디코딩 (결과 캐시, 잘못된 JSON이면 ValueError)"""
+    record = _cache.get(brand)
+    if record is not None:
+        return record
+    if not isinstance(brand, str):
+        raise ValueError(f"brand 값이 문자열이 아닙니다: {brand!r}")
+    record = _to_record(json.loads(brand))
+    _remember(brand, record)
+    return record
+
+
+def decode_brands(brands: Iterable[str]) -> list[Optional[BrandRecord]]:
+    """brand 문자열 일괄 디코딩 (실패한 항목은 None)"""
+    brands = list(brands)
+    records = {}
+    missing = []
+    for brand in brands:
+        if not isinstance(brand, str) or brand in records:
+            continue
+        record = _cache.get(brand)
+        if record is None:
+            missing.append(brand)
+        records[brand] = record
+
+    # JSON 배열 형태인 값들은 하나의 배열로 묶어 한 번에 파싱
+    batch = [brand for brand in missing if _looks_like_array(brand)]
+    if batch:
+        try:
+            decoded = json.loads("[" + ",".join(batch) + "]")
+            if len(decoded) != len(batch):
+                raise ValueError("brand 일괄 디코딩 결과 개수 불일치")
+            for brand, brand_data in zip(batch, decoded):
+                records[brand] = _to_record(brand_data)
+                _remember(brand, records[brand])
+        except ValueError:
+            pass
+
+    # 일괄 처리되지 않은 값은 항목별로 디코딩
+    for brand in missing:
+        if records[brand] is None:
+            try:
+                records[brand] = decode_brand(brand)
+            except ValueError:
+                pass
+
+    return [records.get(brand) if isinstance(brand, str) else None for brand in brands]
+
+
+def encode_brand(
+    location: str, mbti: str, main_category: str, sub_categories: Iterable[str]
+) -> str:
+    """brand 문자열 생성 (이름/코드 모두 허용)"""
+    brand_data = [
+        LOCATION_MAP.get(location, location),
+        MBTI_MAP.get(mbti.upper(), mbti) if mbti else mbti,
+        CATEGORY_MAP.get(main_category, main_category),
+        [SUB_CATEGORY_MAP.get(sub, sub) for sub in sub_categories or []],
+    ]
+    return json.dumps(brand_data, ensure_ascii=False, separators=(",", ":"))
+
+
+def clear_cache():
+    """디코딩 캐시 초기화"""
+    _cache.clear()
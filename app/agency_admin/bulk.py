@@ -0,0 +1,248 @@
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Literal, Optional
+
+from fastapi import HTTPException
+from pydantic import BaseModel, Field, model_validator
+
+from app.agency_admin.brand_codec import encode_brand
+from app.agency_admin.catalog import agency_catalog
+from app.agency_admin.category_tree import category_cache
+from app.agency_admin.constants import (
+    CATEGORY_MAP,
+    LOCATION_MAP,
+    MBTI_MAP,
+    REVERSE_CATEGORY_MAP,
+    REVERSE_LOCATION_MAP,
+    REVERSE_MBTI_MAP,
+    REVERSE_SUB_CATEGORY_MAP,
+    SUB_CATEGORY_MAP,
+)
+from app.agency_admin.product_mirror import product_mirror
+from app.common.config import settings
+from app.imweb.limiter import Priority, priority
+from app.imweb.old_imweb import ImwebResponse, imweb_service
+from app.imweb.resilience import deadline
+
+logger = logging.getLogger(__name__)
+
+# 새 에이전시 기본 이미지
+DEFAULT_AGENCY_IMAGE = (
+    "https://cdn.imweb.me/upload/S202411023d3941ab4335b/6b53a30e8b45a.png"
+)
+
+# 생성 시 필수 필드
+CREATE_REQUIRED_FIELDS = ("name", "content", "simple_content")
+
+
+def request_brand(data: dict) -> Optional[str]:
+    """요청의 brand 값 (없으면 위치/MBTI/카테고리 필드로 생성)"""
+    if data.get("brand"):
+        return data["brand"]
+    if any(data.get(key) for key in ("location", "mbti", "main_category")):
+        return encode_brand(
+            data.get("location"),
+            data.get("mbti"),
+            data.get("main_category"),
+            data.get("sub_categories", []),
+        )
+    return data.get("brand")
+
+
+def build_update_payload(data: dict, image_url: Optional[str] = None) -> dict:
+    """에이전시 수정 요청 → 아임웹 상품 수정 데이터"""
+    return {
+        "no": data.get("no"),  # 상품번호
+        "name": data.get("name"),  # 상품명
+        "content": data.get("content"),  # 상세설명
+        "simple_content": data.get("simple_content"),  # 요약설명이 누락되어 있었음
+        # 카테고리 코드 (이름으로 보내도 코드로 변환)
+        "category": category_cache.resolve_all(data.get("category", [])),
+        "brand": request_brand(data),  # 브랜드 정보
+        "location": data.get("location"),  # 위치 정보
+        "mbti": data.get("mbti"),  # MBTI 정보
+        "main_category": data.get("main_category"),  # 메인 카테고리
+        "sub_categories": data.get("sub_categories", []),  # 서브 카테고리 목록
+        "image_url": image_url if image_url else data.get("image_url"),
+        "status": data.get("status", "sale"),  # 상태
+        "display_status": "VISIBLE",  # 노출 상태 추가
+    }
+
+
+def build_create_payload(data: dict) -> dict:
+    """에이전시 생성 요청 → 아임웹 상품 생성 데이터"""
+    return {
+        "name": data["name"],
+        "content": data["content"],
+        "simple_content": data["simple_content"],
+        "brand": request_brand(data),
+        "prod_status": "sale",
+        "price": 0,
+        "price_tax": False,
+        "stock_use": False,
+        # 카테고리 이름/코드 (없으면 기본 에이전시 카테고리)
+        "categories": category_cache.resolve_all(
+            data.get("category") or [settings.IMWEB_AGENCY_CATEGORY]
+        ),
+        "display_status": "VISIBLE",
+        "images": [
+            {
+                "url": DEFAULT_AGENCY_IMAGE,
+                "thumb_url": DEFAULT_AGENCY_IMAGE,
+                "caption": "",
+            }
+        ],
+    }
+
+
+def validate_agency_data(op: str, data: dict) -> list[str]:
+    """에이전시 데이터 검증 (오류 메시지 목록, 없으면 빈 목록)"""
+    errors = []
+    if op == "create":
+        errors += [
+            f"{field} 필드가 필요합니다"
+            for field in CREATE_REQUIRED_FIELDS
+            if not data.get(field)
+        ]
+    if data.get("image"):
+        errors.append(
+            "일괄 처리에서는 image 대신 /agency/image로 올린 image_url을 사용하세요"
+        )
+
+    # 이름 또는 코드 모두 허용 (encode_brand와 동일)
+    mbti = data.get("mbti")
+    if isinstance(mbti, str):
+        mbti = mbti.upper()
+    checks = [
+        ("location", data.get("location"), LOCATION_MAP, REVERSE_LOCATION_MAP),
+        ("mbti", mbti, MBTI_MAP, REVERSE_MBTI_MAP),
+        ("main_category", data.get("main_category"), CATEGORY_MAP, REVERSE_CATEGORY_MAP),
+    ]
+    checks += [
+        ("sub_categories", sub, SUB_CATEGORY_MAP, REVERSE_SUB_CATEGORY_MAP)
+        for sub in data.get("sub_categories") or []
+    ]
+    for field, value, names, codes in checks:
+        if value and value not in names and value not in codes:
+            errors.append(f"알 수 없는 {field}: {value}")
+
+    # 카테고리 트리를 불러온 경우에만 아임웹 카테고리 확인
+    if category_cache.is_loaded:
+        errors += [
+            f"알 수 없는 category: {value}"
+            for value in data.get("category") or []
+            if category_cache.resolve(value) is None
+        ]
+    return errors
+
+
+def upstream_error(response: ImwebResponse) -> Optional[tuple[int, str]]:
+    """아임웹 생성/수정 응답의 오류 (성공이면 None, 실패면 (상태 코드, 메시지))
+
+    HTTP 상태가 2xx여도 본문 code가 200이 아니면 실패 (단건 / 일괄 처리 공통 기준)
+    """
+    data = response.data if isinstance(response.data, dict) else {}
+    if response.ok and data.get("code", 200) == 200:
+        return None
+    status_code = response.status if not response.ok else 502
+    return status_code, data.get("msg") or response.text
+
+
+class BulkOperation(BaseModel):
+    op: Literal["create", "update"]
+    id: Optional[str] = Field(None, description="수정할 에이전시(상품) 번호")
+    data: dict
+
+    @model_validator(mode="after")
+    def _validate(self) -> "BulkOperation":
+        if self.op == "update" and not self.id:
+            raise ValueError("update에는 id가 필요합니다")
+        errors = validate_agency_data(self.op, self.data)
+        if errors:
+            raise ValueError(", ".join(errors))
+        return self
+
+
+class BulkRequest(BaseModel):
+    operations: list[BulkOperation] = Field(
+        ..., min_length=1, max_length=settings.AGENCY_BULK_MAX_ITEMS
+    )
+
+
+async def _run_operation(index: int, operation: BulkOperation) -> dict:
+    result = {"index": index, "op": operation.op, "id": operation.id}
+    try:
+        # 항목마다 별도의 제한 시간 적용
+        with deadline(settings.IMWEB_REQUEST_DEADLINE):
+            if operation.op == "create":
+                response = await imweb_service.request(
+                    "POST",
+                    "/shop/products",
+                    json=build_create_payload(operation.data),
+                )
+            else:
+                response = await imweb_service.request(
+                    "PATCH",
+                    f"/shop/products/{operation.id}",
+                    json=build_update_payload(operation.data),
+                )
+        error = upstream_error(response)
+        if error is None:
+            data = response.data if isinstance(response.data, dict) else {}
+            result.update(status="ok", status_code=200, data=data.get("data"))
+        else:
+            status_code, message = error
+            result.update(status="error", status_code=status_code, error=message[:200])
+    except HTTPException as e:
+        result.update(
+            status="error", status_code=e.status_code, error=str(e.detail)
+        )
+    except Exception as e:
+        result.update(status="error", status_code=500, error=str(e) or repr(e))
+    return result
+
+
+async def run_bulk(
+    operations: list[BulkOperation],
+    concurrency: int = settings.AGENCY_BULK_CONCURRENCY,
+) -> AsyncIterator[dict]:
+    """일괄 생성/수정 실행 (동시 concurrency개, 끝나는 순서대로 항목별 결과 반환)
+
+    아임웹 호출은 공용 세션/토큰과 대량 작업 우선순위를 사용하고,
+    실패한 항목이 있어도 나머지는 계속 처리
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    started = time.perf_counter()
+
+    async def guarded(index: int, operation: BulkOperation) -> dict:
+        async with semaphore:
+            return await _run_operation(index, operation)
+
+    # 대량 작업 우선순위는 생성되는 작업에도 그대로 전달
+    with priority(Priority.BULK):
+        tasks = [
+            asyncio.create_task(guarded(index, operation))
+            for index, operation in enumerate(operations)
+        ]
+    succeeded = 0
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if result["status"] == "ok":
+                succeeded += 1
+                if result["op"] == "update":
+                    product_mirror.invalidate(result["id"])
+            yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+        # 변경이 있으면 목록 스냅샷은 한 번만 갱신
+        if succeeded:
+            agency_catalog.schedule_rebuild()
+        logger.info(
+            "에이전시 일괄 처리 완료 - 전체: %s건, 성공: %s건, 소요: %.2fs",
+            len(operations),
+            succeeded,
+            time.perf_counter() - started,
+        )
@@ -0,0 +1,312 @@
+import asyncio
+import contextvars
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app.agency_admin.brand_codec import BrandRecord, decode_brands
+from app.agency_admin.product_mirror import product_mirror
+from app.agency_admin.search_index import AgencySearchIndex
+from app.common.config import settings
+from app.common.http_cache import make_etag
+from app.common.metrics import registry
+from app.common.tracing import span
+from app.common.responses import dumps
+from app.imweb.limiter import Priority, priority
+from app.imweb.old_imweb import imweb_service
+
+logger = logging.getLogger(__name__)
+
+
+def build_agency(item: dict, brand: BrandRecord) -> dict:
+    """아임웹 상품 + 디코딩된 brand로 에이전시 목록 항목 생성"""
+    # 이미지 URL 처리
+    image_urls = item.get("image_url", {})
+    first_image_url = next(iter(image_urls.values()), None) if image_urls else None
+    sub_categories = brand.sub_categories
+
+    return {
+        "no": item.get("no"),
+        "name": item.get("name"),
+        "content": item.get("simple_content_plain", ""),
+        "category": item.get("categories", []),
+        "brand": item.get("brand"),
+        "location": brand.location,
+        "mbti": brand.mbti,
+        "main_category": brand.main_category,
+        "sub_categories": (
+            list(sub_categories)
+            if isinstance(sub_categories, tuple)
+            else sub_categories
+        ),
+        "image_url": first_image_url,
+        "status": item.get("prod_status"),
+    }
+
+
+def transform_products(products: list) -> list:
+    """아임웹 상품 목록을 에이전시 목록으로 변환"""
+    # brand 데이터 일괄 파싱
+    brands = decode_brands(item.get("brand", "[]") for item in products)
+
+    agencies = []
+    skipped = 0
+    for item, brand in zip(products, brands):
+        if brand is None:
+            skipped += 1
+            logger.debug("문제가 된 데이터: %s", item.get("brand"))
+            continue
+        try:
+            agencies.append(build_agency(item, brand))
+        except Exception as e:
+            skipped += 1
+            logger.debug("데이터 처리 중 오류 발생: %s - %s", e, item.get("brand"))
+            continue
+
+    # 상품별 오류는 DEBUG로만 남기고 건수를 한 번에 기록
+    if skipped:
+        logger.warning("변환하지 못한 상품 %s건 제외", skipped)
+    return agencies
+
+
+def serialize_response(payload: dict) -> bytes:
+    """JSON 응답 바이트로 직렬화 (FastAPI 기본 JSONResponse와 동일한 형식)"""
+    with span("serialize"):
+        return dumps(payload)
+
+
+@dataclass
+class CatalogSnapshot:
+    """에이전시 목록 스냅샷 (변환 + 직렬화 완료 상태)"""
+
+    agencies: list
+    body: bytes
+    version: int
+    built_at: float
+    search_index: AgencySearchIndex
+    # 본문 기준 ETag와 본문이 마지막으로 바뀐 시각 (조건부 요청용)
+    etag: str = ""
+    modified_at: float = 0.0
+    # 인코딩별 압축된 본문 (요청 시 한 번만 압축)
+    compressed: dict = field(default_factory=dict)
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.built_at
+
+
+class AgencyCatalog:
+    """에이전시 목록 메모리 캐시 (백그라운드 갱신, stale-while-revalidate)"""
+
+    def __init__(
+        self,
+        refresh_interval: float = settings.AGENCY_CATALOG_REFRESH_INTERVAL,
+        stale_after: float = settings.AGENCY_CATALOG_STALE_AFTER,
+    ):
+        self.refresh_interval = refresh_interval
+        self.stale_after = stale_after
+        self.snapshot: Optional[CatalogSnapshot] = None
+        self._rebuild: Optional[asyncio.Future] = None
+        self._rebuild_pending = False
+        self._refresher_task: Optional[asyncio.Task] = None
+
+        # 통계
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.rebuilds = 0
+        self.rebuild_errors = 0
+        self.last_rebuild_duration: Optional[float] = None
+
+    async def _load_products(self) -> tuple[Optional[list], int]:
+        """상품 목록과 카탈로그 버전 (미러 사용 시 바뀐 게 없으면 목록은 None)"""
+        if not product_mirror.is_open:
+            products = await imweb_service.get_all_products()
+            return products, self.snapshot.version + 1 if self.snapshot else 1
+
+        try:
+            version = await product_mirror.sync()
+        except Exception as e:
+            # 아임웹 장애 중에는 마지막으로 동기화된 미러 내용 사용
+            version = await asyncio.to_thread(product_mirror.current_version)
+            if not version:
+                raise
+            logger.warning("상품 미러 동기화 실패, 저장된 목록 사용: %s", e)
+        if self.snapshot is not None and self.snapshot.version == version:
+            return None, version
+        with span("mirror"):
+            return await asyncio.to_thread(product_mirror.products), version
+
+    async def _build(self) -> CatalogSnapshot:
+        started = time.perf_counter()
+        products, version = await self._load_products()
+        if products is None:
+            # 카탈로그 버전이 그대로면 기존 스냅샷 재사용
+            self.snapshot.built_at = time.time()
+            return self.snapshot
+
+        with span("transform"):
+            agencies = transform_products(products)
+        body = serialize_response({"code": 200, "message": "success", "data": agencies})
+        etag = make_etag(body)
+        now = time.time()
+        previous = self.snapshot
+        self.snapshot = CatalogSnapshot(
+            agencies=agencies,
+            body=body,
+            version=version,
+            built_at=now,
+            search_index=AgencySearchIndex(agencies),
+            etag=etag,
+            # 미러 없이 다시 만든 경우 내용이 같으면 수정 시각 유지
+            modified_at=(
+                previous.modified_at
+                if previous is not None and previous.etag == etag
+                else now
+            ),
+        )
+        self.rebuilds += 1
+        self.last_rebuild_duration = time.perf_counter() - started
+        logger.info(
+            "에이전시 목록 스냅샷 갱신 - 버전: %s, 에이전시 수: %s, 소요: %.3fs",
+            version,
+            len(agencies),
+            self.last_rebuild_duration,
+        )
+        return self.snapshot
+
+    async def _run_rebuild(self) -> CatalogSnapshot:
+        # 갱신 도중 변경 요청이 들어오면 한 번 더 갱신
+        while True:
+            self._rebuild_pending = False
+            try:
+                snapshot = await self._build()
+            except Exception:
+                self.rebuild_errors += 1
+                raise
+            if not self._rebuild_pending:
+                return snapshot
+
+    def _clear_rebuild(self, future: asyncio.Future):
+        if self._rebuild is future:
+            self._rebuild = None
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("에이전시 목록 스냅샷 갱신 실패: %s", future.exception())
+
+    async def rebuild(self) -> CatalogSnapshot:
+        """스냅샷 갱신 (동시 호출 시 하나의 갱신을 공유)"""
+        if self._rebuild is None:
+            self._rebuild = asyncio.ensure_future(self._run_rebuild())
+            self._rebuild.add_done_callback(self._clear_rebuild)
+        return await asyncio.shield(self._rebuild)
+
+    def _start_background_rebuild(self):
+        # 백그라운드 갱신은 사용자 요청보다 낮은 우선순위로 아임웹 호출
+        with priority(Priority.BULK):
+            self._rebuild = asyncio.ensure_future(self._run_rebuild())
+        self._rebuild.add_done_callback(self._clear_rebuild)
+
+    def schedule_rebuild(self):
+        """백그라운드 갱신 요청 (진행 중인 갱신이 있으면 끝난 뒤 다시 갱신)"""
+        if self._rebuild is not None:
+            self._rebuild_pending = True
+            return
+        # 요청의 제한 시간(deadline) / 추적 정보를 물려받지 않도록 빈 컨텍스트에서 시작
+        contextvars.Context().run(self._start_background_rebuild)
+
+    async def get(self) -> CatalogSnapshot:
+        """스냅샷 조회 (오래된 스냅샷은 그대로 반환하고 백그라운드에서 갱신)"""
+        snapshot = self.snapshot
+        if snapshot is None:
+            self.misses += 1
+            return await self.rebuild()
+
+        if snapshot.age > self.stale_after:
+            self.stale_hits += 1
+            if self._rebuild is None:
+                self.schedule_rebuild()
+        else:
+            self.hits += 1
+        return snapshot
+
+    async def _refresh_loop(self):
+        while True:
+            try:
+                with priority(Priority.BULK):
+                    await self.rebuild()
+            except Exception as e:
+                logger.error("에이전시 목록 주기 갱신 실패: %s", e)
+            await asyncio.sleep(self.refresh_interval)
+
+    def start(self):
+        """주기 갱신 작업 시작"""
+        if self._refresher_task is None or self._refresher_task.done():
+            self._refresher_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """주기 갱신 작업 종료 (진행 중인 갱신은 끝까지 정리된 뒤 반환)"""
+        if self._refresher_task is not None:
+            self._refresher_task.cancel()
+            try:
+                await self._refresher_task
+            except asyncio.CancelledError:
+                pass
+            self._refresher_task = None
+        # 종료 직후 상품 미러를 닫으므로 갱신이 미러를 건드리지 않도록 대기
+        rebuild = self._rebuild
+        if rebuild is not None:
+            rebuild.cancel()
+            try:
+                await rebuild
+            except (asyncio.CancelledError, Exception):
+                pass  # 실패는 _clear_rebuild에서 기록
+
+    def stats(self) -> dict:
+        """스냅샷 상태 및 캐시 통계"""
+        snapshot = self.snapshot
+        requests = self.hits + self.stale_hits + self.misses
+        return {
+            "version": snapshot.version if snapshot else None,
+            "agency_count": len(snapshot.agencies) if snapshot else 0,
+            "size_bytes": len(snapshot.body) if snapshot else 0,
+            "age_seconds": round(snapshot.age, 3) if snapshot else None,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.stale_hits) / requests if requests else None,
+            "rebuilds": self.rebuilds,
+            "rebuild_errors": self.rebuild_errors,
+            "last_rebuild_seconds": self.last_rebuild_duration,
+        }
+
+
+# 카탈로그 인스턴스 생성
+agency_catalog = AgencyCatalog()
+
+registry.callback(
+    "agency_catalog_lookups_total",
+    "에이전시 목록 스냅샷 조회 수",
+    lambda: {
+        ("hit",): agency_catalog.hits,
+        ("stale",): agency_catalog.stale_hits,
+        ("miss",): agency_catalog.misses,
+    },
+    ("result",),
+    type="counter",
+)
+registry.callback(
+    "agency_catalog_rebuilds_total",
+    "에이전시 목록 스냅샷 갱신 수",
+    lambda: {
+        ("success",): agency_catalog.rebuilds,
+        ("error",): agency_catalog.rebuild_errors,
+    },
+    ("result",),
+    type="counter",
+)
+registry.callback(
+    "agency_catalog_age_seconds",
+    "에이전시 목록 스냅샷 경과 시간",
+    lambda: agency_catalog.snapshot.age if agency_catalog.snapshot else None,
+)
@@ -0,0 +1,259 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from app.agency_admin.catalog import serialize_response
+from app.common.config import settings
+from app.common.http_cache import make_etag
+from app.common.shared_state import SharedEntry, SharedState, shared_state
+from app.imweb.limiter import Priority, priority
+from app.imweb.old_imweb import imweb_service
+
+logger = logging.getLogger(__name__)
+
+# 워커 간 공유 상태에 저장하는 카테고리 응답 키
+SHARED_CATEGORIES_KEY = "imweb:categories"
+
+# 하위 카테고리 목록 키 (응답 형식에 따라 다름)
+CHILDREN_KEYS = ("subcategories", "children", "sub_categories")
+
+
+@dataclass(eq=False)
+class CategoryNode:
+    """카테고리 트리 노드"""
+
+    no: str
+    name: str
+    parent: Optional["CategoryNode"] = None
+    children: list["CategoryNode"] = field(default_factory=list)
+    depth: int = 0
+
+    def path(self) -> list[str]:
+        """최상위부터 이 노드까지의 이름 목록"""
+        names = []
+        node = self
+        while node is not None:
+            names.append(node.name)
+            node = node.parent
+        return names[::-1]
+
+    def descendants(self) -> Iterable["CategoryNode"]:
+        for child in self.children:
+            yield child
+            yield from child.descendants()
+
+
+def _category_items(payload) -> list:
+    """아임웹 응답에서 카테고리 목록 추출"""
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict):
+        for key in ("data", "categories", "list"):
+            if key in payload:
+                return _category_items(payload[key])
+    return []
+
+
+class CategoryTree:
+    """카테고리 트리 (번호 → 노드 / 이름 → 번호 색인)"""
+
+    def __init__(self, payload, version: int = 0):
+        self.payload = payload
+        self.version = version
+        self.roots: list[CategoryNode] = []
+        self.by_no: dict[str, CategoryNode] = {}
+        self.by_name: dict[str, str] = {}
+
+        # 이름이 겹치면 상위 단계 카테고리 우선 (너비 우선으로 색인)
+        queue = [(item, None) for item in _category_items(payload)]
+        while queue:
+            item, parent = queue.pop(0)
+            if not isinstance(item, dict):
+                continue
+            no = item.get("code") or item.get("no")
+            if no is None:
+                continue
+            node = CategoryNode(
+                no=str(no),
+                name=item.get("name", ""),
+                parent=parent,
+                depth=parent.depth + 1 if parent else 0,
+            )
+            (parent.children if parent else self.roots).append(node)
+            self.by_no[node.no] = node
+            self.by_name.setdefault(node.name, node.no)
+            children = next(
+                (item[key] for key in CHILDREN_KEYS if item.get(key)), []
+            )
+            queue.extend((child, node) for child in children)
+
+        self.body = serialize_response(
+            {"code": 200, "version": version, "data": payload}
+        )
+        self.etag = make_etag(self.body)
+        self.modified_at = self.loaded_at = time.time()
+        # 인코딩별 압축된 본문 (요청 시 한 번만 압축)
+        self.compressed: dict = {}
+
+    def get(self, no: str) -> Optional[CategoryNode]:
+        return self.by_no.get(str(no))
+
+    def resolve(self, value) -> Optional[str]:
+        """카테고리 번호 또는 이름 → 번호 (없으면 None)"""
+        if value is None:
+            return None
+        value = str(value)
+        if value in self.by_no:
+            return value
+        return self.by_name.get(value)
+
+    def children(self, no: str) -> list[CategoryNode]:
+        node = self.get(no)
+        return list(node.children) if node else []
+
+    def parent(self, no: str) -> Optional[CategoryNode]:
+        node = self.get(no)
+        return node.parent if node else None
+
+    def __len__(self) -> int:
+        return len(self.by_no)
+
+
+class CategoryCache:
+    """아임웹 카테고리 트리 메모리 캐시 (시작 준비 작업에서 조회, 이후 백그라운드 갱신)
+
+    요청 처리 중에는 아임웹을 호출하지 않고 마지막으로 조회한 트리만 사용.
+    공유 상태가 열려 있으면 한 워커만 조회하고, 버전(ETag)도 모든 워커가 같은 값 사용
+    """
+
+    def __init__(
+        self,
+        refresh_interval: float = settings.CATEGORY_REFRESH_INTERVAL,
+        state: SharedState = shared_state,
+    ):
+        self.refresh_interval = refresh_interval
+        self.state = state
+        self.tree = CategoryTree(None)
+        self._refresh: Optional[asyncio.Future] = None
+        self._refresher_task: Optional[asyncio.Task] = None
+
+        # 통계
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.tree.payload is not None
+
+    async def _fetch(self) -> tuple[dict, None]:
+        response = await imweb_service.request("GET", "/shop/categories")
+        data = response.data if isinstance(response.data, dict) else {}
+        if not response.ok or data.get("code", 200) != 200:
+            raise RuntimeError(f"카테고리 조회 실패: {response.text[:200]}")
+        return response.data, None
+
+    def _shared_fresh(self, entry: SharedEntry) -> bool:
+        # 갱신 주기 안에 다른 워커가 조회한 트리는 그대로 사용
+        return entry.age < self.refresh_interval
+
+    async def _load(self) -> CategoryTree:
+        version = None
+        if self.state.is_open:
+            entry = await self.state.coordinate(
+                SHARED_CATEGORIES_KEY, self._fetch, self._shared_fresh
+            )
+            payload, version = entry.value, entry.version or None
+        else:
+            payload, _ = await self._fetch()
+
+        current = self.tree
+        if (
+            current.payload is not None
+            and payload == current.payload
+            and version in (None, current.version)
+        ):
+            # 내용이 같으면 버전/ETag 유지
+            current.loaded_at = time.time()
+            return current
+        self.tree = CategoryTree(payload, version=version or current.version + 1)
+        self.refreshes += 1
+        logger.info(
+            "카테고리 트리 갱신 - 버전: %s, 카테고리 수: %s",
+            self.tree.version,
+            len(self.tree),
+        )
+        return self.tree
+
+    def _clear_refresh(self, future: asyncio.Future):
+        if self._refresh is future:
+            self._refresh = None
+        if not future.cancelled() and future.exception() is not None:
+            self.refresh_errors += 1
+            logger.error("카테고리 트리 갱신 실패: %s", future.exception())
+
+    def _start_refresh(self) -> asyncio.Future:
+        if self._refresh is None:
+            # 백그라운드 갱신은 사용자 요청보다 낮은 우선순위로 아임웹 호출
+            with priority(Priority.BULK):
+                self._refresh = asyncio.ensure_future(self._load())
+            self._refresh.add_done_callback(self._clear_refresh)
+        return self._refresh
+
+    async def refresh(self) -> CategoryTree:
+        """트리 갱신 (동시 호출 시 하나의 조회를 공유)"""
+        return await asyncio.shield(self._start_refresh())
+
+    def schedule_refresh(self):
+        """백그라운드 갱신 요청 (기다리지 않음)"""
+        self._start_refresh()
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception:
+                pass  # _clear_refresh에서 기록
+
+    def start(self):
+        """주기 갱신 작업 시작"""
+        if self._refresher_task is None or self._refresher_task.done():
+            self._refresher_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """주기 갱신 작업 종료"""
+        if self._refresh is not None:
+            self._refresh.cancel()
+        if self._refresher_task is not None:
+            self._refresher_task.cancel()
+            try:
+                await self._refresher_task
+            except asyncio.CancelledError:
+                pass
+            self._refresher_task = None
+
+    def resolve(self, value) -> Optional[str]:
+        return self.tree.resolve(value)
+
+    def resolve_all(self, values: Iterable) -> list:
+        """카테고리 이름/번호 목록 → 번호 목록 (트리에 없는 값은 그대로 전달)"""
+        return [self.tree.resolve(value) or value for value in values if value]
+
+    def stats(self) -> dict:
+        tree = self.tree
+        return {
+            "loaded": self.is_loaded,
+            "version": tree.version,
+            "category_count": len(tree),
+            "age_seconds": (
+                round(time.time() - tree.loaded_at, 3) if self.is_loaded else None
+            ),
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+        }
+
+
+# 카테고리 캐시 인스턴스 생성
+category_cache = CategoryCache()
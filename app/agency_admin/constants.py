@@ -0,0 +1,90 @@
+# 에이전시 brand 필드 코드 매핑 (위치 / MBTI / 메인 카테고리 / 서브 카테고리)
+LOCATION_MAP = {"서울": "s", "그 외": "e"}
+
+REVERSE_LOCATION_MAP = {"s": "서울", "e": "그 외"}
+
+MBTI_MAP = {
+    "ENFJ": "1",
+    "ENFP": "2",
+    "ENTJ": "3",
+    "ENTP": "4",
+    "ESFJ": "5",
+    "ESFP": "6",
+    "ESTJ": "7",
+    "ESTP": "8",
+    "INFJ": "9",
+    "INFP": "0",
+    "INTJ": "a",
+    "INTP": "b",
+    "ISFJ": "c",
+    "ISFP": "d",
+    "ISTJ": "e",
+    "ISTP": "f",
+}
+
+REVERSE_MBTI_MAP = {v: k for k, v in MBTI_MAP.items()}
+
+CATEGORY_MAP = {
+    "웹개발": "w",
+    "디자인": "d",
+    "앱개발": "a",
+    "영상/사진": "p",
+    "브랜딩": "b",
+    "마케팅": "m",
+    "번역/통역": "t",
+    "컨설팅": "c",
+}
+
+REVERSE_CATEGORY_MAP = {v: k for k, v in CATEGORY_MAP.items()}
+
+SUB_CATEGORY_MAP = {
+    # 웹개발
+    "프론트엔드": "1",
+    "백엔드": "2",
+    "풀스택": "3",
+    "쇼핑몰": "4",
+    "랜딩페이지": "5",
+    "기타 웹개발": "6",
+    # 디자인/브랜딩 공통
+    "UI/UX": "a",
+    "그래픽": "b",
+    "3D": "c",
+    "일러스트": "d",
+    "편집": "e",
+    "CI/BI": "f",
+    "패키지": "g",
+    "네이밍": "h",
+    "브랜드전략": "i",
+    "기타 디자인": "j",
+    "기타 브랜딩": "k",
+    # 앱개발
+    "안드로이드": "l",
+    "iOS": "m",
+    "크로스플랫폼": "n",
+    "하이브리드": "o",
+    "기타 앱개발": "p",
+    # 영상/사진
+    "영상촬영": "q",
+    "영상편집": "r",
+    "사진촬영": "s",
+    "사진편집": "t",
+    "기타 영상/사진": "u",
+    # 마케팅
+    "SNS마케팅": "v",
+    "퍼포먼스": "w",
+    "콘텐츠제작": "x",
+    "PR": "y",
+    "기타 마케팅": "z",
+    # 번역/통역
+    "영어": "7",
+    "중국어": "8",
+    "일본어": "9",
+    "기타 번역/통역": "0",
+    # 컨설팅
+    "경영컨설팅": "A",
+    "IT컨설팅": "B",
+    "마케팅컨설": "C",
+    "기타 컨설팅": "D",
+}
+
+REVERSE_SUB_CATEGORY_MAP = {v: k for k, v in SUB_CATEGORY_MAP.items()}
@@ -0,0 +1,287 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import (
+    Float,
+    Integer,
+    String,
+    Text,
+    create_engine,
+    delete,
+    event,
+    select,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from app.common.config import settings
+from app.imweb.old_imweb import imweb_service
+
+logger = logging.getLogger(__name__)
+
+# 변경 여부 판단에 사용하는 상품 필드 (목록/상세 응답에 쓰이는 필드)
+HASH_FIELDS = (
+    "no",
+    "name",
+    "brand",
+    "content",
+    "simple_content",
+    "simple_content_plain",
+    "categories",
+    "image_url",
+    "prod_status",
+)
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class MirroredProduct(Base):
+    """아임웹 상품 사본"""
+
+    __tablename__ = "products"
+
+    no: Mapped[str] = mapped_column(String, primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, index=True)
+    data: Mapped[str] = mapped_column(Text)
+    content_hash: Mapped[str] = mapped_column(String(32))
+    version: Mapped[int] = mapped_column(Integer)
+    synced_at: Mapped[float] = mapped_column(Float)
+
+
+class MirrorState(Base):
+    """카탈로그 버전 등 동기화 상태"""
+
+    __tablename__ = "mirror_state"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    value: Mapped[float] = mapped_column(Float)
+
+
+def content_hash(product: dict) -> str:
+    """상품 내용 해시 (HASH_FIELDS 기준)"""
+    fields = {field: product.get(field) for field in HASH_FIELDS}
+    body = json.dumps(fields, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.md5(body.encode("utf-8")).hexdigest()
+
+
+class ProductMirror:
+    """로컬 SQLite 상품 미러 (해시 비교로 바뀐 상품만 저장, 변경 시 카탈로그 버전 증가)
+
+    같은 호스트의 모든 워커가 같은 파일을 사용하므로 카탈로그 버전은 DB 값이 기준
+    """
+
+    def __init__(self, path: str = settings.PRODUCT_MIRROR_PATH):
+        self.path = path
+        self._engine: Optional[Engine] = None
+        self._sync: Optional[asyncio.Future] = None
+        self.version = 0
+        self.last_sync: Optional[float] = None
+
+        # 통계
+        self.syncs = 0
+        self.last_sync_changes = 0
+
+    def open(self):
+        """DB 열기 (재시작 시 이전 카탈로그 버전 복원)"""
+        if self._engine is not None:
+            return
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._engine = create_engine(f"sqlite:///{self.path}")
+
+        @event.listens_for(self._engine, "connect")
+        def _set_pragmas(connection, record):
+            cursor = connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.close()
+
+        Base.metadata.create_all(self._engine)
+        self.current_version()
+
+    def close(self):
+        if self._sync is not None:
+            self._sync.cancel()
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._engine is not None
+
+    def current_version(self) -> int:
+        """DB에 저장된 카탈로그 버전 (다른 워커가 반영한 변경 포함)"""
+        with Session(self._engine) as session:
+            state = session.get(MirrorState, "catalog_version")
+        self.version = int(state.value) if state else 0
+        return self.version
+
+    @staticmethod
+    def _next_version(session: Session) -> int:
+        statement = insert(MirrorState).values(name="catalog_version", value=1)
+        statement = statement.on_conflict_do_update(
+            index_elements=[MirrorState.name],
+            set_={"value": MirrorState.value + 1},
+        ).returning(MirrorState.value)
+        return int(session.execute(statement).scalar_one())
+
+    def apply(self, products: list[dict], now: Optional[float] = None) -> int:
+        """전체 상품 목록 반영 (바뀐 상품만 저장, 변경 건수 반환)"""
+        now = now or time.time()
+        with Session(self._engine) as session:
+            # 버전 증가를 첫 문장으로 실행해 쓰기 잠금을 먼저 잡음
+            # (동시에 반영하는 다른 워커는 이 트랜잭션이 끝난 뒤 결과를 보고 비교)
+            version = self._next_version(session)
+            existing = {
+                no: (position, digest)
+                for no, position, digest in session.execute(
+                    select(
+                        MirroredProduct.no,
+                        MirroredProduct.position,
+                        MirroredProduct.content_hash,
+                    )
+                )
+            }
+            rows = []
+            moved = []
+            seen = set()
+            for position, product in enumerate(products):
+                no = str(product.get("no"))
+                if no in seen:
+                    continue
+                seen.add(no)
+                digest = content_hash(product)
+                current = existing.get(no)
+                if current is not None and current[1] == digest:
+                    if current[0] != position:
+                        # 내용은 같고 순서만 바뀐 상품은 위치만 갱신
+                        moved.append({"no": no, "position": position})
+                    continue
+                rows.append(
+                    {
+                        "no": no,
+                        "position": position,
+                        "data": json.dumps(product, ensure_ascii=False, default=str),
+                        "content_hash": digest,
+                        "version": version,
+                        "synced_at": now,
+                    }
+                )
+
+            removed = [no for no in existing if no not in seen]
+            if rows:
+                statement = insert(MirroredProduct)
+                session.execute(
+                    statement.on_conflict_do_update(
+                        index_elements=[MirroredProduct.no],
+                        set_={
+                            column: statement.excluded[column]
+                            for column in (
+                                "position",
+                                "data",
+                                "content_hash",
+                                "version",
+                                "synced_at",
+                            )
+                        },
+                    ),
+                    rows,
+                )
+            if moved:
+                session.execute(update(MirroredProduct), moved)
+            if removed:
+                session.execute(
+                    delete(MirroredProduct).where(MirroredProduct.no.in_(removed))
+                )
+
+            changes = len(rows) + len(moved) + len(removed)
+            if changes:
+                session.commit()
+                self.version = version
+            else:
+                # 바뀐 게 없으면 버전 증가도 취소
+                session.rollback()
+                self.version = version - 1
+            return changes
+
+    async def _run_sync(self) -> int:
+        started = time.time()
+        products = await imweb_service.get_all_products()
+        changes = await asyncio.to_thread(self.apply, products, started)
+        self.syncs += 1
+        self.last_sync = started
+        self.last_sync_changes = changes
+        logger.info(
+            "상품 미러 동기화 완료 - 버전: %s, 변경: %s건, 소요: %.2fs",
+            self.version,
+            changes,
+            time.time() - started,
+        )
+        return self.version
+
+    def _clear_sync(self, future: asyncio.Future):
+        if self._sync is future:
+            self._sync = None
+
+    async def sync(self) -> int:
+        """아임웹 상품 목록과 동기화 후 카탈로그 버전 반환 (동시 호출 시 하나를 공유)"""
+        if self._sync is None:
+            self._sync = asyncio.ensure_future(self._run_sync())
+            self._sync.add_done_callback(self._clear_sync)
+        return await asyncio.shield(self._sync)
+
+    def products(self) -> list[dict]:
+        """저장된 전체 상품 (아임웹 목록 순서)"""
+        with Session(self._engine) as session:
+            return [
+                json.loads(data)
+                for data in session.scalars(
+                    select(MirroredProduct.data).order_by(MirroredProduct.position)
+                )
+            ]
+
+    def get(self, no: str) -> Optional[dict]:
+        """상품 번호로 조회 (없으면 None)"""
+        entry = self.get_entry(no)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, no: str) -> Optional[tuple[dict, str]]:
+        """상품 번호로 조회 (상품, 내용 해시)"""
+        if self._engine is None:
+            return None
+        with Session(self._engine) as session:
+            row = session.execute(
+                select(MirroredProduct.data, MirroredProduct.content_hash).where(
+                    MirroredProduct.no == str(no)
+                )
+            ).first()
+        return (json.loads(row.data), row.content_hash) if row is not None else None
+
+    def invalidate(self, no: str):
+        """수정된 상품 삭제 (다음 동기화에서 다시 저장)"""
+        if self._engine is None:
+            return
+        with Session(self._engine) as session, session.begin():
+            session.execute(delete(MirroredProduct).where(MirroredProduct.no == str(no)))
+
+    def stats(self) -> dict:
+        return {
+            "version": self.version,
+            "last_sync": self.last_sync,
+            "syncs": self.syncs,
+            "last_sync_changes": self.last_sync_changes,
+        }
+
+
+# 상품 미러 인스턴스 생성
+product_mirror = ProductMirror()
@@ -0,0 +1,147 @@
+import re
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+from app.agency_admin.constants import (
+    CATEGORY_MAP,
+    LOCATION_MAP,
+    MBTI_MAP,
+    REVERSE_LOCATION_MAP,
+    REVERSE_MBTI_MAP,
+    SUB_CATEGORY_MAP,
+)
+
+# 검색 가능한 필터 항목
+FACETS = ("location", "mbti", "main_category", "sub_categories", "status")
+
+# 입력값(이름 또는 코드)을 코드로 변환하는 매핑
+_VALUE_TO_CODE = {
+    "location": LOCATION_MAP,
+    "mbti": MBTI_MAP,
+    "main_category": CATEGORY_MAP,
+    "sub_categories": SUB_CATEGORY_MAP,
+    "status": {},
+}
+
+# 응답용 표시값 (에이전시 목록 응답과 같은 형식)
+_CODE_TO_DISPLAY = {
+    "location": REVERSE_LOCATION_MAP,
+    "mbti": REVERSE_MBTI_MAP,
+}
+
+_ONE_BIT = re.compile("1")
+
+
+def _bits_from_positions(positions: list, size: int) -> int:
+    """위치 목록으로 비트셋(int) 생성"""
+    buffer = bytearray((size + 7) // 8)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def _iter_positions(bits: int) -> Iterator[int]:
+    """비트셋에서 켜진 비트 위치를 오름차순으로 반환"""
+    for match in _ONE_BIT.finditer(format(bits, "b")[::-1]):
+        yield match.start()
+
+
+def _agency_codes(agency: dict) -> dict:
+    """에이전시의 필터 항목별 코드 목록"""
+    sub_categories = agency.get("sub_categories") or []
+    if not isinstance(sub_categories, list):
+        sub_categories = [sub_categories]
+    return {
+        "location": [LOCATION_MAP.get(agency.get("location"))],
+        "mbti": [MBTI_MAP.get(agency.get("mbti"))],
+        "main_category": [agency.get("main_category")],
+        "sub_categories": sub_categories,
+        "status": [agency.get("status")],
+    }
+
+
+def normalize_value(facet: str, value: str) -> str:
+    """필터 입력값(이름 또는 코드)을 코드로 변환"""
+    value = value.strip()
+    mapping = _VALUE_TO_CODE[facet]
+    if facet == "mbti":
+        value = value.upper()
+    return mapping.get(value, value)
+
+
+class AgencySearchIndex:
+    """에이전시 목록 역색인 (필터 값별 비트셋)"""
+
+    def __init__(self, agencies: list):
+        self.agencies = agencies
+        self.size = len(agencies)
+        self.all_bits = (1 << self.size) - 1
+
+        positions: dict[str, dict[str, list]] = {facet: {} for facet in FACETS}
+        for index, agency in enumerate(agencies):
+            for facet, codes in _agency_codes(agency).items():
+                for code in codes:
+                    if code is None or code == "":
+                        continue
+                    positions[facet].setdefault(str(code), []).append(index)
+
+        self.bitsets: dict[str, dict[str, int]] = {
+            facet: {
+                code: _bits_from_positions(found, self.size)
+                for code, found in values.items()
+            }
+            for facet, values in positions.items()
+        }
+
+    def _facet_mask(self, facet: str, codes: Iterable[str]) -> int:
+        """같은 항목 안의 값은 합집합"""
+        mask = 0
+        bitsets = self.bitsets[facet]
+        for code in codes:
+            mask |= bitsets.get(code, 0)
+        return mask
+
+    def _facet_counts(self, facet: str, base: int) -> dict:
+        display = _CODE_TO_DISPLAY.get(facet, {})
+        counts = {}
+        for code, bits in self.bitsets[facet].items():
+            count = (base & bits).bit_count()
+            if count:
+                counts[display.get(code, code)] = count
+        return counts
+
+    def search(
+        self,
+        filters: Optional[dict] = None,
+        page: int = 1,
+        per_page: int = 20,
+    ) -> dict:
+        """필터 조건 검색 (항목 간 교집합) + 페이지네이션 + 항목별 건수"""
+        masks = {}
+        for facet, values in (filters or {}).items():
+            if values:
+                codes = [normalize_value(facet, value) for value in values]
+                masks[facet] = self._facet_mask(facet, codes)
+
+        result = self.all_bits
+        for mask in masks.values():
+            result &= mask
+
+        # 항목별 건수는 해당 항목 필터를 제외한 나머지 조건 기준
+        facets = {}
+        for facet in FACETS:
+            base = self.all_bits
+            for other, mask in masks.items():
+                if other != facet:
+                    base &= mask
+            facets[facet] = self._facet_counts(facet, base)
+
+        offset = (page - 1) * per_page
+        positions = islice(_iter_positions(result), offset, offset + per_page)
+        return {
+            "total": result.bit_count(),
+            "page": page,
+            "per_page": per_page,
+            "items": [self.agencies[position] for position in positions],
+            "facets": facets,
+        }
@@ -0,0 +1,21 @@
+import hmac
+from typing import Optional
+
+from fastapi import HTTPException, Security
+from fastapi.security import APIKeyHeader
+
+from app.common.config import settings
+
+admin_key_header = APIKeyHeader(name="X-Admin-Key", auto_error=False)
+
+
+async def require_admin_key(api_key: Optional[str] = Security(admin_key_header)):
+    """관리자 전용 엔드포인트 인증 (ADMIN_API_KEY가 설정되지 않으면 사용 불가)"""
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(status_code=403, detail="관리자 기능이 비활성화되어 있습니다")
+    if not api_key or not hmac.compare_digest(api_key, settings.ADMIN_API_KEY):
+        raise HTTPException(
+            status_code=401,
+            detail="관리자 키가 올바르지 않습니다",
+            headers={"WWW-Authenticate": "X-Admin-Key"},
+        )
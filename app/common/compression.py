@@ -0,0 +1,182 @@
+import gzip
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.common.config import settings
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip만 사용
+    brotli = None
+
+# 서버 선호 순서
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# 압축 대상 Content-Type (이미지 등 이미 압축된 형식은 제외)
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Accept-Encoding에서 사용할 압축 방식 선택 (q=0은 제외, 같은 q면 서버 선호 순서)"""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                continue
+        weights[name.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def weak_etag(etag: str) -> str:
+    """압축된 표현은 원본과 바이트가 다르므로 약한 ETag로 표시"""
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+
+class _StreamCompressor:
+    """스트리밍 응답용 압축기 (청크마다 flush해서 바로 전송)"""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(
+                quality=settings.COMPRESSION_BROTLI_QUALITY
+            )
+        else:
+            self._compressor = zlib.compressobj(
+                settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31
+            )
+        self.encoding = encoding
+
+    def chunk(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+class CompressionMiddleware:
+    """응답 압축 (brotli / gzip 협상, minimum_size 미만이나 이미 인코딩된 응답은 그대로)"""
+
+    def __init__(
+        self, app: ASGIApp, minimum_size: int = settings.COMPRESSION_MIN_SIZE
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self._start: Optional[Message] = None
+        self._passthrough = False
+        self._stream: Optional[_StreamCompressor] = None
+
+    def _mark_encoded(self, headers: MutableHeaders):
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if "etag" in headers:
+            headers["ETag"] = weak_etag(headers["etag"])
+
+    async def send(self, message: Message):
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self._start = message
+            self._passthrough = (
+                message["status"] < 200
+                or message["status"] in (204, 304)
+                or "content-encoding" in headers
+                or not is_compressible(headers.get("content-type"))
+            )
+            if self._passthrough:
+                await self._send(message)
+            return
+
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._stream is not None:
+            data = self._stream.chunk(body) if body else b""
+            if not more_body:
+                data += self._stream.finish()
+            await self._send(
+                {"type": "http.response.body", "body": data, "more_body": more_body}
+            )
+            return
+
+        headers = MutableHeaders(scope=self._start)
+        if not more_body:
+            # 한 번에 전송되는 응답
+            if len(body) >= self.minimum_size:
+                body = compress(body, self.encoding)
+                self._mark_encoded(headers)
+                headers["Content-Length"] = str(len(body))
+            await self._send(self._start)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        # 스트리밍 응답 (전체 크기를 알 수 없으므로 항상 압축)
+        self._stream = _StreamCompressor(self.encoding)
+        self._mark_encoded(headers)
+        del headers["Content-Length"]
+        await self._send(self._start)
+        await self._send(
+            {
+                "type": "http.response.body",
+                "body": self._stream.chunk(body),
+                "more_body": True,
+            }
+        )
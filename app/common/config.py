@@ -7,6 +7,111 @@ class Settings(BaseSettings):
     IMWEB_AGENCY_CATEGORY: str | None = None
     IMWEB_BASE_URL: str = "https://api.imweb.me/v2"
     ENVIRONMENT: str = "development"
+    # 관리자 전용 엔드포인트 키 (X-Admin-Key 헤더, 설정하지 않으면 관리자 기능 비활성화)
+    ADMIN_API_KEY: str | None = None
+
+    # 아임웹 HTTP 커넥션 풀 설정
+    IMWEB_HTTP_POOL_LIMIT: int = 100
+    IMWEB_HTTP_POOL_LIMIT_PER_HOST: int = 30
+    IMWEB_HTTP_KEEPALIVE_TIMEOUT: float = 30.0
+    IMWEB_HTTP_DNS_CACHE_TTL: int = 300
+    IMWEB_HTTP_TIMEOUT: float = 30.0
+    IMWEB_HTTP_CONNECT_TIMEOUT: float = 5.0
+
+    # 아임웹 호출 재시도 / 요청당 전체 제한 시간 / 서킷 브레이커
+    IMWEB_RETRY_MAX_ATTEMPTS: int = 3
+    IMWEB_RETRY_BASE_DELAY: float = 0.2
+    IMWEB_RETRY_MAX_DELAY: float = 2.0
+    IMWEB_REQUEST_DEADLINE: float = 10.0
+    IMWEB_BREAKER_FAILURE_THRESHOLD: int = 5
+    IMWEB_BREAKER_RESET_TIMEOUT: float = 15.0
+
+    # 아임웹 동시 호출 수 자동 조절 (초기 / 최소 / 최대 한도, 지연 판단 배수)
+    IMWEB_CONCURRENCY_INITIAL: int = 10
+    IMWEB_CONCURRENCY_MIN: int = 2
+    IMWEB_CONCURRENCY_MAX: int = 50
+    IMWEB_CONCURRENCY_LATENCY_TOLERANCE: float = 3.0
+
+    # 에이전시 목록 스냅샷 갱신 주기 / 만료 기준 (초)
+    AGENCY_CATALOG_REFRESH_INTERVAL: float = 60.0
+    AGENCY_CATALOG_STALE_AFTER: float = 120.0
+
+    # 카테고리 트리 백그라운드 갱신 주기 (초)
+    CATEGORY_REFRESH_INTERVAL: float = 300.0
+
+    # 조회 응답 Cache-Control (브라우저는 매번 ETag로 재검증, CDN은 s-maxage 동안 재사용)
+    AGENCY_LIST_CACHE_CONTROL: str = (
+        "public, max-age=0, s-maxage=30, stale-while-revalidate=60"
+    )
+    AGENCY_DETAIL_CACHE_CONTROL: str = (
+        "public, max-age=0, s-maxage=60, stale-while-revalidate=300"
+    )
+    CATEGORY_CACHE_CONTROL: str = "public, max-age=300, stale-while-revalidate=3600"
+    MBTI_RESULT_CACHE_CONTROL: str = "public, max-age=300, stale-while-revalidate=3600"
+
+    # 응답 압축 (이 크기 미만은 압축하지 않음, brotli는 설치된 경우에만 사용)
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+
+    # 로컬 상품 미러 (에이전시 목록 / 상세 조회용)
+    PRODUCT_MIRROR_ENABLED: bool = True
+    PRODUCT_MIRROR_PATH: str = "data/product_mirror.sqlite3"
+
+    # 이메일 → 회원 정보 캐시 (크기 / 유효시간 / '회원 없음' 유효시간)
+    MEMBER_CACHE_SIZE: int = 10000
+    MEMBER_CACHE_TTL: float = 300.0
+    MEMBER_CACHE_NEGATIVE_TTL: float = 10.0
+
+    # 로컬 회원 미러 (증분 / 전체 동기화 주기, 이 시간 동안 동기화 못하면 사용 안 함)
+    MEMBER_MIRROR_ENABLED: bool = True
+    MEMBER_MIRROR_PATH: str = "data/member_mirror.sqlite3"
+    MEMBER_MIRROR_SYNC_INTERVAL: float = 60.0
+    MEMBER_MIRROR_FULL_SYNC_INTERVAL: float = 3600.0
+    MEMBER_MIRROR_STALE_AFTER: float = 600.0
+    # 여러 워커 중 한 워커만 동기화 (동기화가 이 시간보다 오래 걸리면 다른 워커도 시작)
+    MEMBER_MIRROR_SYNC_LEASE_TTL: float = 600.0
+
+    # MBTI 결과 저장 write-behind 큐
+    MBTI_WRITE_BEHIND: bool = True
+    MBTI_WRITE_JOURNAL_PATH: str = "data/mbti_write_journal.sqlite3"
+    MBTI_WRITE_WORKERS: int = 4
+    MBTI_WRITE_MAX_ATTEMPTS: int = 8
+    MBTI_WRITE_RETRY_BASE: float = 1.0
+    MBTI_WRITE_RETRY_MAX: float = 60.0
+    MBTI_WRITE_DRAIN_TIMEOUT: float = 10.0
+    # 처리 중 표시(claim) 유효시간 (워커가 종료되면 이 시간 뒤 다른 워커가 처리)
+    MBTI_WRITE_CLAIM_TTL: float = 60.0
+
+    # 이미지 업로드 (최대 크기, 읽기 청크 크기, SHA-256 → URL 색인 경로)
+    IMAGE_UPLOAD_MAX_BYTES: int = 10 * 1024 * 1024
+    IMAGE_UPLOAD_CHUNK_SIZE: int = 64 * 1024
+    IMAGE_INDEX_PATH: str = "data/image_index.sqlite3"
+
+    # 에이전시 일괄 처리 (한 요청 최대 항목 수 / 아임웹 동시 호출 수)
+    AGENCY_BULK_MAX_ITEMS: int = 1000
+    AGENCY_BULK_CONCURRENCY: int = 8
+
+    # 워커 간 공유 상태 (토큰 / 카테고리 / 회원 미러 동기화 / 회원 캐시 무효화, lease 유효시간 / 대기 중 확인 간격 / 잠금 대기)
+    SHARED_STATE_ENABLED: bool = True
+    SHARED_STATE_PATH: str = "data/shared_state.sqlite3"
+    SHARED_STATE_LEASE_TTL: float = 30.0
+    SHARED_STATE_POLL_INTERVAL: float = 0.1
+    SHARED_STATE_BUSY_TIMEOUT: float = 5.0
+
+    # 시작 준비 작업 재시도 간격 (초, 지수 백오프)
+    WARMUP_RETRY_BASE: float = 1.0
+    WARMUP_RETRY_MAX: float = 30.0
+
+    # 요청 추적 (Server-Timing 헤더 / 이 시간 이상 걸린 요청은 구간별 기록)
+    TRACE_SERVER_TIMING: bool = True
+    TRACE_SLOW_REQUEST_SECONDS: float = 1.0
+
+    # 로깅 설정 (DEBUG/INFO는 호출 위치별로 interval초당 burst개까지만 기록)
+    LOG_LEVEL: str = "INFO"
+    LOG_JSON: bool = True
+    LOG_RATE_LIMIT_BURST: int = 20
+    LOG_RATE_LIMIT_INTERVAL: float = 1.0
 
     class Config:
         env_file = ".env"
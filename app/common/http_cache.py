@@ -0,0 +1,104 @@
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+from app.common.compression import compress, negotiate_encoding, weak_etag
+from app.common.config import settings
+
+# 응답 본문이 Accept-Encoding에 따라 달라지므로 캐시 키에 포함
+VARY = "Accept-Encoding"
+
+
+def make_etag(body: bytes) -> str:
+    """응답 본문으로 강한 ETag 생성"""
+    return f'"{hashlib.md5(body).hexdigest()}"'
+
+
+def quote_etag(tag: str) -> str:
+    """이미 계산된 해시(상품 content_hash 등)를 ETag 형식으로"""
+    return f'"{tag}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match는 약한 비교 (W/ 접두사 무시)
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _not_modified_since(if_modified_since: str, last_modified: float) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    # HTTP 날짜는 초 단위
+    return int(last_modified) <= since
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: Optional[float] = None
+) -> bool:
+    """조건부 요청 확인 (If-None-Match가 있으면 If-Modified-Since는 무시)"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        return _not_modified_since(if_modified_since, last_modified)
+    return False
+
+
+def cache_headers(
+    etag: str, cache_control: str, last_modified: Optional[float] = None
+) -> dict:
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": VARY}
+    if last_modified is not None:
+        headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+    return headers
+
+
+def not_modified_response(
+    etag: str, cache_control: str, last_modified: Optional[float] = None
+) -> Response:
+    """304 응답 (본문 없이 캐시 헤더만)"""
+    return Response(
+        status_code=304, headers=cache_headers(etag, cache_control, last_modified)
+    )
+
+
+def cached_response(
+    request: Request,
+    body: bytes,
+    cache_control: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[float] = None,
+    media_type: str = "application/json",
+    compressed: Optional[dict] = None,
+) -> Response:
+    """직렬화된 응답 본문을 캐시 헤더와 함께 반환 (클라이언트에 최신본이 있으면 304)
+
+    compressed를 넘기면 압축 결과를 인코딩별로 저장해두고 재사용
+    """
+    etag = etag or make_etag(body)
+    encoding = None
+    if compressed is not None and len(body) >= settings.COMPRESSION_MIN_SIZE:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        if encoding is not None:
+            etag = weak_etag(etag)
+
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, cache_control, last_modified)
+
+    headers = cache_headers(etag, cache_control, last_modified)
+    if encoding is not None:
+        if encoding not in compressed:
+            compressed[encoding] = compress(body, encoding)
+        body = compressed[encoding]
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type=media_type, headers=headers)
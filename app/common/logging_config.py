@@ -0,0 +1,175 @@
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import re
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.common.config import settings
+
+# 로그에 남기지 않을 값의 키 이름
+SECRET_KEYS = re.compile(
+    r"(access[-_]?token|refresh[-_]?token|secret|api[-_]?key|password|authorization)",
+    re.IGNORECASE,
+)
+# 문자열 안의 'key': 'value' / key=value 형태 비밀 값
+_SECRET_PAIR = re.compile(
+    r"""(?P<key>["']?[\w-]*(?:access[-_]?token|refresh[-_]?token|secret|api[-_]?key"""
+    r"""|password|authorization)[\w-]*["']?\s*[:=]\s*)(?P<quote>["']?)[^"'\s,}&]+""",
+    re.IGNORECASE,
+)
+REDACTED = "***"
+
+# LogRecord 기본 속성 (그 외 속성은 extra 필드로 출력)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message",
+    "asctime",
+    "taskName",
+}
+
+_handler: Optional[logging.Handler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def redact(value):
+    """비밀 값 가리기 (dict/list는 재귀적으로, 문자열은 key=value 패턴)"""
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if isinstance(key, str) and SECRET_KEYS.search(key) else redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return type(value)(redact(item) for item in value)
+    if isinstance(value, str):
+        return _SECRET_PAIR.sub(rf"\g<key>\g<quote>{REDACTED}", value)
+    return value
+
+
+def render_message(record: logging.LogRecord) -> str:
+    """인자의 비밀 값을 가린 뒤 메시지 포맷팅"""
+    if isinstance(record.args, dict):
+        args = redact(record.args)
+    else:
+        args = tuple(redact(arg) for arg in record.args or ())
+    return str(record.msg) % args if args else str(record.msg)
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 로그 (직렬화와 출력은 리스너 스레드에서 수행)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = render_message(record)
+
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": redact(message),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = REDACTED if SECRET_KEYS.search(key) else redact(value)
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # 큐 핸들러가 호출 스레드에서 미리 만든 트레이스백
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """사람이 읽기 쉬운 형식 (개발용, 비밀 값 가리기 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return redact(super().format(record))
+
+
+class RateLimitFilter(logging.Filter):
+    """호출 위치별 DEBUG/INFO 로그 개수 제한 (WARNING 이상은 항상 기록)
+
+    interval초 동안 위치별로 최대 burst개만 통과, 버려진 개수는 다음 로그에 suppressed로 표시
+    """
+
+    def __init__(self, burst: int, interval: float):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self._windows: dict[tuple, list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.burst <= 0:
+            return True
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= self.interval:
+            suppressed = window[2] if window else 0
+            window = self._windows[key] = [now, 0, 0]
+            if suppressed:
+                record.suppressed = suppressed
+        if window[1] >= self.burst:
+            window[2] += 1
+            return False
+        window[1] += 1
+        return True
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """레코드를 큐에 넣는 핸들러 (JSON 직렬화와 출력은 리스너 스레드에서 수행)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 인자 / 트레이스백은 객체가 바뀌기 전에 호출 스레드에서 문자열로 고정
+        record = copy.copy(record)
+        record.msg = render_message(record)
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+def setup_logging(
+    level: str = settings.LOG_LEVEL,
+    json_format: bool = settings.LOG_JSON,
+    burst: int = settings.LOG_RATE_LIMIT_BURST,
+    interval: float = settings.LOG_RATE_LIMIT_INTERVAL,
+    stream=None,
+) -> logging.handlers.QueueListener:
+    """루트 로거 설정 (큐 핸들러 → 백그라운드 리스너 스레드에서 출력)"""
+    global _handler, _listener
+    shutdown_logging()
+
+    output = logging.StreamHandler(stream)
+    output.setFormatter(
+        JsonFormatter()
+        if json_format
+        else TextFormatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _handler = DeferredQueueHandler(log_queue)
+    _handler.addFilter(RateLimitFilter(burst, interval))
+
+    root = logging.getLogger()
+    root.addHandler(_handler)
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, output, respect_handler_level=True
+    )
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """남은 로그를 모두 출력하고 리스너 종료"""
+    global _handler, _listener
+    if _handler is not None:
+        logging.getLogger().removeHandler(_handler)
+        _handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
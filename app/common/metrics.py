@@ -0,0 +1,255 @@
+import time
+from bisect import bisect_left
+from typing import Callable, Iterable, Union
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Prometheus 텍스트 노출 형식
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 지연 시간 히스토그램 기본 구간 (초)
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# 라우트를 찾지 못한 요청은 경로 대신 이 값으로 집계 (라벨 수 제한)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+
+    def samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """누적 카운터 (라벨 값은 위치 인자로 전달, 호출당 dict 조회 한 번)"""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *labels, amount: float = 1.0):
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def get(self, *labels) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self._values.items())
+        ]
+
+
+class Gauge(Counter):
+    """현재 값 (증가/감소/설정)"""
+
+    type = "gauge"
+
+    def dec(self, *labels, amount: float = 1.0):
+        self._values[labels] = self._values.get(labels, 0.0) - amount
+
+    def set(self, value: float, *labels):
+        self._values[labels] = value
+
+
+class Histogram(_Metric):
+    """구간별 누적 개수 + 합계 히스토그램"""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: tuple = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 값 → [구간별 개수..., +Inf 개수, 합계]
+        self._values: dict[tuple, list] = {}
+
+    def observe(self, value: float, *labels):
+        state = self._values.get(labels)
+        if state is None:
+            state = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def count(self, *labels) -> int:
+        state = self._values.get(labels)
+        return sum(state[:-1]) if state else 0
+
+    def samples(self) -> list[str]:
+        lines = []
+        for labels, state in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), state):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket"
+                    f"{_format_labels(self.labelnames, labels, le)} {cumulative}"
+                )
+            suffix = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{suffix} {_format_value(state[-1])}")
+            lines.append(f"{self.name}_count{suffix} {cumulative}")
+        return lines
+
+
+class CallbackMetric(_Metric):
+    """수집 시점에 함수로 읽는 지표 (기존 통계 값 노출용, 요청 처리 비용 없음)
+
+    func는 숫자 또는 {라벨 값 튜플: 숫자}를 반환
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        func: Callable[[], Union[float, dict]],
+        labelnames: Iterable[str] = (),
+        type: str = "gauge",
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.func = func
+        self.type = type
+
+    def samples(self) -> list[str]:
+        values = self.func()
+        if not isinstance(values, dict):
+            values = {(): values}
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in values.items()
+            if value is not None
+        ]
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        # 같은 이름은 처음 등록한 지표를 그대로 사용 (모듈 재로딩 대비)
+        return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(
+        self, name: str, documentation: str, func, labelnames=(), type="gauge"
+    ) -> CallbackMetric:
+        return self.register(CallbackMetric(name, documentation, func, labelnames, type))
+
+    def render(self) -> bytes:
+        """Prometheus 텍스트 형식으로 출력"""
+        lines = []
+        for metric in self._metrics.values():
+            lines += metric.header()
+            lines += metric.samples()
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+# 지표 저장소 인스턴스 생성
+registry = Registry()
+
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+)
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route")
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "처리 중인 HTTP 요청 수"
+)
+
+
+class MetricsMiddleware:
+    """라우트별 요청 수 / 처리 시간 / 처리 중 요청 수 집계
+
+    라벨은 실제 경로 대신 라우트 경로(/agency/{agency_id})를 사용
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec()
+            route = scope.get("route")
+            path = getattr(route, "path", UNMATCHED_ROUTE)
+            method = scope["method"]
+            http_request_duration.observe(time.perf_counter() - started, method, path)
+            http_requests_total.inc(method, path, status)
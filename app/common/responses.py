@@ -0,0 +1,22 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+from app.common.tracing import span
+
+# dict 키가 숫자인 경우(MBTI 점수 등)도 직렬화
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps(payload: Any) -> bytes:
+    """JSON 바이트로 직렬화 (공백 없는 UTF-8, 기본 JSONResponse와 같은 형식)"""
+    return orjson.dumps(payload, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 JSON 응답 (앱 기본 응답 클래스)"""
+
+    def render(self, content: Any) -> bytes:
+        with span("serialize"):
+            return dumps(content)
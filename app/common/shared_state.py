@@ -0,0 +1,320 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+from app.common.config import settings
+from app.common.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+shared_refreshes = registry.counter(
+    "shared_state_refreshes_total",
+    "공유 상태 갱신 요청 결과 (reused: 다른 워커 값 사용, fetched: 직접 조회)",
+    ("key", "result"),
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    expires_at REAL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS leases (
+    name TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS invalidations (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    topic TEXT NOT NULL,
+    key TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class SharedEntry:
+    """공유 상태 값 (내용이 바뀔 때만 version 증가)"""
+
+    value: Any
+    version: int
+    expires_at: Optional[float]
+    updated_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.updated_at
+
+    def ttl(self) -> float:
+        """만료까지 남은 시간 (만료 없음이면 inf)"""
+        if self.expires_at is None:
+            return float("inf")
+        return self.expires_at - time.time()
+
+
+class SharedState:
+    """같은 호스트의 워커 프로세스들이 함께 쓰는 상태 저장소 (SQLite WAL)
+
+    토큰 / 캐시 응답을 버전과 함께 보관하고, 갱신은 lease를 얻은 워커 하나만 수행
+    파일에 남으므로 재시작(reload, 순차 배포) 후에도 그대로 재사용
+    """
+
+    def __init__(
+        self,
+        path: str = settings.SHARED_STATE_PATH,
+        lease_ttl: float = settings.SHARED_STATE_LEASE_TTL,
+        poll_interval: float = settings.SHARED_STATE_POLL_INTERVAL,
+    ):
+        self.path = path
+        self.lease_ttl = lease_ttl
+        self.poll_interval = poll_interval
+        # 프로세스 번호가 재사용되어도 이전 프로세스의 lease와 구분
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._db: Optional[sqlite3.Connection] = None
+        # 연결 하나를 루프와 to_thread 스레드가 함께 쓰므로 한 번에 하나씩 사용
+        self._lock = threading.Lock()
+
+        # 통계
+        self.reused = 0
+        self.fetched = 0
+        self.waits = 0
+        self.errors = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self._db is not None
+
+    def open(self):
+        """저장소 열기 (토큰이 들어가므로 소유자만 읽을 수 있게 생성)"""
+        if self._db is not None:
+            return
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            Path(self.path).touch(mode=0o600, exist_ok=True)
+        db = sqlite3.connect(
+            self.path,
+            isolation_level=None,
+            check_same_thread=False,
+            timeout=settings.SHARED_STATE_BUSY_TIMEOUT,
+        )
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(_SCHEMA)
+        with self._lock:
+            self._db = db
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.execute("DELETE FROM leases WHERE owner = ?", (self.owner,))
+                self._db.close()
+                self._db = None
+
+    def get(self, key: str) -> Optional[SharedEntry]:
+        with self._lock:
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT value, version, expires_at, updated_at "
+                "FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return SharedEntry(json.loads(row[0]), row[1], row[2], row[3])
+
+    def put(
+        self, key: str, value: Any, expires_at: Optional[float] = None
+    ) -> SharedEntry:
+        """값 저장 (내용이 같으면 버전 유지, 다르면 버전 + 1)"""
+        now = time.time()
+        body = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+        # 한 문장으로 비교/증가하므로 다른 워커와 동시에 써도 버전이 어긋나지 않음
+        with self._lock:
+            (version,) = self._db.execute(
+                """
+                INSERT INTO entries (key, value, version, expires_at, updated_at)
+                VALUES (?, ?, 1, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    version = entries.version + (entries.value != excluded.value),
+                    value = excluded.value,
+                    expires_at = excluded.expires_at,
+                    updated_at = excluded.updated_at
+                RETURNING version
+                """,
+                (key, body, expires_at, now),
+            ).fetchone()
+        # 다른 워커가 읽는 값과 키 순서까지 같도록 저장한 내용으로 반환
+        return SharedEntry(json.loads(body), version, expires_at, now)
+
+    def acquire(self, name: str, ttl: Optional[float] = None) -> bool:
+        """lease 획득 (다른 워커가 유효한 lease를 갖고 있으면 False)"""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                """
+                INSERT INTO leases (name, owner, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    owner = excluded.owner,
+                    expires_at = excluded.expires_at
+                WHERE leases.owner = excluded.owner OR leases.expires_at < ?
+                RETURNING owner
+                """,
+                (name, self.owner, now + (ttl or self.lease_ttl), now),
+            ).fetchone()
+        return row is not None
+
+    def release(self, name: str):
+        with self._lock:
+            if self._db is not None:
+                self._db.execute(
+                    "DELETE FROM leases WHERE name = ? AND owner = ?",
+                    (name, self.owner),
+                )
+
+    def publish(self, topic: str, key: str, retain: float):
+        """다른 워커의 프로세스 캐시에서 key를 지우도록 기록 (retain초 지난 기록은 정리)"""
+        now = time.time()
+        with self._lock:
+            if self._db is None:
+                return
+            self._db.execute(
+                "INSERT INTO invalidations (topic, key, owner, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (topic, key, self.owner, now),
+            )
+            self._db.execute(
+                "DELETE FROM invalidations WHERE created_at < ?", (now - retain,)
+            )
+
+    def changes(
+        self, topic: str, since: Optional[int]
+    ) -> tuple[list[str], Optional[int]]:
+        """since 이후 다른 워커가 기록한 key 목록과 마지막 순번 (since가 None이면 현재 순번만)"""
+        with self._lock:
+            if self._db is None:
+                return [], since
+            if since is None:
+                (last,) = self._db.execute(
+                    "SELECT COALESCE(MAX(seq), 0) FROM invalidations"
+                ).fetchone()
+                return [], last
+            rows = self._db.execute(
+                "SELECT seq, key, owner FROM invalidations "
+                "WHERE seq > ? AND topic = ? ORDER BY seq",
+                (since, topic),
+            ).fetchall()
+        if not rows:
+            return [], since
+        return [key for _, key, owner in rows if owner != self.owner], rows[-1][0]
+
+    def _reuse(self, key: str, entry: SharedEntry) -> SharedEntry:
+        self.reused += 1
+        shared_refreshes.inc(key, "reused")
+        return entry
+
+    async def _lead(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[tuple[Any, Optional[float]]]],
+        usable: Callable[[SharedEntry], bool],
+    ) -> SharedEntry:
+        try:
+            # lease를 얻기 직전에 다른 워커가 갱신했을 수 있음
+            entry = await asyncio.to_thread(self.get, key)
+            if entry is not None and usable(entry):
+                return self._reuse(key, entry)
+            value, expires_at = await fetch()
+            self.fetched += 1
+            shared_refreshes.inc(key, "fetched")
+            try:
+                return await asyncio.to_thread(self.put, key, value, expires_at)
+            except sqlite3.Error as e:
+                self.errors += 1
+                logger.warning("공유 상태 저장 실패 - %s: %s", key, e)
+                return SharedEntry(value, 0, expires_at, time.time())
+        finally:
+            try:
+                await asyncio.to_thread(self.release, key)
+            except sqlite3.Error:
+                pass  # lease는 만료되면 다른 워커가 가져감
+
+    async def coordinate(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[tuple[Any, Optional[float]]]],
+        usable: Callable[[SharedEntry], bool],
+        lease_ttl: Optional[float] = None,
+    ) -> SharedEntry:
+        """공유 값 갱신 (lease를 얻은 워커만 fetch, 나머지는 그 결과를 읽음)
+
+        fetch는 (값, 만료 시각)을 반환. 조회한 워커가 실패하거나 종료되면
+        lease가 풀리거나 만료된 뒤 기다리던 워커가 이어서 조회.
+        fetch가 오래 걸리면 lease_ttl을 그보다 길게 지정.
+        저장소를 쓸 수 없으면 직접 조회 (version 0)
+        """
+        waited = False
+        while True:
+            try:
+                entry = await asyncio.to_thread(self.get, key)
+                if entry is not None and usable(entry):
+                    return self._reuse(key, entry)
+                leader = await asyncio.to_thread(self.acquire, key, lease_ttl)
+            except sqlite3.Error as e:
+                self.errors += 1
+                logger.warning("공유 상태 저장소 사용 실패, 직접 조회 - %s: %s", key, e)
+                value, expires_at = await fetch()
+                return SharedEntry(value, 0, expires_at, time.time())
+            if leader:
+                return await self._lead(key, fetch, usable)
+            if not waited:
+                waited = True
+                self.waits += 1
+                logger.debug("다른 워커의 공유 상태 갱신 대기 - %s", key)
+            await asyncio.sleep(self.poll_interval)
+
+    def stats(self) -> dict:
+        entries = {}
+        with self._lock:
+            rows = (
+                self._db.execute(
+                    "SELECT key, version, expires_at, updated_at FROM entries"
+                ).fetchall()
+                if self._db is not None
+                else []
+            )
+        for key, version, expires_at, updated_at in rows:
+            entries[key] = {
+                "version": version,
+                "age_seconds": round(time.time() - updated_at, 3),
+                "ttl_seconds": (
+                    round(expires_at - time.time(), 3)
+                    if expires_at is not None
+                    else None
+                ),
+            }
+        return {
+            "enabled": self.is_open,
+            "owner": self.owner,
+            "entries": entries,
+            "reused": self.reused,
+            "fetched": self.fetched,
+            "waits": self.waits,
+            "errors": self.errors,
+        }
+
+
+# 공유 상태 저장소 인스턴스 생성
+shared_state = SharedState()
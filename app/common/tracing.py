@@ -0,0 +1,175 @@
+import contextvars
+import logging
+import time
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.common.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 느린 요청 기록에 남길 최대 구간 수 (대량 처리 요청 대비)
+MAX_RECORDED_SPANS = 50
+
+
+class Trace:
+    """요청 하나의 구간별 소요 시간"""
+
+    __slots__ = ("started", "spans", "totals", "finished")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        # (이름, 요청 시작 기준 시작 시각, 소요 시간, 설명)
+        self.spans: list[tuple] = []
+        # 이름 → [합계, 횟수] (Server-Timing용)
+        self.totals: dict[str, list] = {}
+        self.finished = False
+
+    def add(self, name: str, started: float, duration: float, detail: Optional[str]):
+        # 요청이 끝난 뒤 백그라운드 작업에서 들어온 구간은 무시
+        if self.finished:
+            return
+        total = self.totals.get(name)
+        if total is None:
+            self.totals[name] = [duration, 1]
+        else:
+            total[0] += duration
+            total[1] += 1
+        if len(self.spans) < MAX_RECORDED_SPANS:
+            self.spans.append((name, started - self.started, duration, detail))
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self, total: float) -> str:
+        """Server-Timing 헤더 값 (같은 이름의 구간은 합산, 단위 ms)"""
+        entries = []
+        for name, (duration, count) in self.totals.items():
+            entry = f"{name};dur={duration * 1000:.1f}"
+            if count > 1:
+                entry += f';desc="{count}x"'
+            entries.append(entry)
+        entries.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(entries)
+
+    def record(self) -> list[dict]:
+        return [
+            {
+                "name": name,
+                "start_ms": round(offset * 1000, 3),
+                "duration_ms": round(duration * 1000, 3),
+                **({"detail": detail} if detail else {}),
+            }
+            for name, offset, duration, detail in self.spans
+        ]
+
+
+_current_trace: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar(
+    "current_trace", default=None
+)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+def record_span(name: str, duration: float, detail: Optional[str] = None):
+    """이미 측정한 구간 기록 (진행 중인 요청이 없으면 무시)"""
+    trace = _current_trace.get()
+    if trace is not None:
+        now = time.perf_counter()
+        trace.add(name, now - duration, duration, detail)
+
+
+class span:
+    """구간 시간 측정 (with / async with 모두 사용 가능, 요청 밖에서는 측정하지 않음)
+
+    with span("transform"):
+        agencies = transform_products(products)
+    """
+
+    __slots__ = ("name", "detail", "_trace", "_started")
+
+    def __init__(self, name: str, detail: Optional[str] = None):
+        self.name = name
+        self.detail = detail
+
+    def __enter__(self) -> "span":
+        self._trace = _current_trace.get()
+        if self._trace is not None:
+            self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._trace is not None:
+            self._trace.add(
+                self.name,
+                self._started,
+                time.perf_counter() - self._started,
+                self.detail,
+            )
+
+    async def __aenter__(self) -> "span":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.__exit__(exc_type, exc, tb)
+
+
+class TracingMiddleware:
+    """요청별 구간 측정 (Server-Timing 헤더 + 느린 요청 기록)"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        slow_threshold: float = settings.TRACE_SLOW_REQUEST_SECONDS,
+        server_timing: bool = settings.TRACE_SERVER_TIMING,
+    ):
+        self.app = app
+        self.slow_threshold = slow_threshold
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace = Trace()
+        token = _current_trace.set(trace)
+        status = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", trace.server_timing(trace.elapsed))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            trace.finished = True
+            _current_trace.reset(token)
+            elapsed = trace.elapsed
+            if elapsed >= self.slow_threshold:
+                route = scope.get("route")
+                logger.warning(
+                    "느린 요청 - %s %s %s %.1fms",
+                    scope["method"],
+                    scope["path"],
+                    status,
+                    elapsed * 1000,
+                    extra={
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "route": getattr(route, "path", None),
+                        "status": status,
+                        "duration_ms": round(elapsed * 1000, 3),
+                        "spans": trace.record(),
+                    },
+                )
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Optional
+
+from app.common.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Warmup:
+    """시작 시 준비 작업 (서비스 시작을 막지 않고 백그라운드에서 동시에 실행)
+
+    실패한 작업은 성공할 때까지 백오프 후 재시도하고, 모두 끝나면 준비 완료
+    """
+
+    def __init__(
+        self,
+        steps: dict[str, Callable[[], Awaitable]],
+        retry_base: float = settings.WARMUP_RETRY_BASE,
+        retry_max: float = settings.WARMUP_RETRY_MAX,
+    ):
+        self.steps = steps
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.started_at: Optional[float] = None
+        self.ready_at: Optional[float] = None
+        self.status = {
+            name: {"state": "pending", "attempts": 0, "seconds": None, "error": None}
+            for name in steps
+        }
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.ready_at is not None
+
+    @property
+    def time_to_ready(self) -> Optional[float]:
+        """시작부터 준비 완료까지 걸린 시간 (초)"""
+        if self.ready_at is None or self.started_at is None:
+            return None
+        return self.ready_at - self.started_at
+
+    async def _run_step(self, name: str, func: Callable[[], Awaitable]):
+        status = self.status[name]
+        while True:
+            status["attempts"] += 1
+            status["state"] = "running"
+            started = time.perf_counter()
+            try:
+                await func()
+            except Exception as e:
+                # 지수 백오프 + full jitter
+                delay = random.uniform(
+                    0, min(self.retry_max, self.retry_base * 2 ** status["attempts"])
+                )
+                status["state"] = "retrying"
+                status["error"] = f"{type(e).__name__}: {e}"
+                logger.warning(
+                    "시작 준비 작업 실패 - %s, %.1f초 후 재시도 (%s회): %s",
+                    name,
+                    delay,
+                    status["attempts"],
+                    e,
+                )
+                await asyncio.sleep(delay)
+                continue
+            status["state"] = "done"
+            status["seconds"] = round(time.perf_counter() - started, 3)
+            status["error"] = None
+            return
+
+    async def _run(self):
+        await asyncio.gather(
+            *(self._run_step(name, func) for name, func in self.steps.items())
+        )
+        self.ready_at = time.monotonic()
+        logger.info(
+            "서비스 준비 완료 - %.2fs (%s)",
+            self.time_to_ready,
+            ", ".join(
+                f"{name}: {status['seconds']}s" for name, status in self.status.items()
+            ),
+        )
+
+    def start(self):
+        """준비 작업 시작 (기다리지 않음)"""
+        if self._task is None or self._task.done():
+            self.started_at = time.monotonic()
+            self.ready_at = None
+            self._task = asyncio.create_task(self._run())
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """준비 완료까지 대기 (timeout 내에 끝나지 않으면 False)"""
+        if self._task is None:
+            return self.ready
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return self.ready
+
+    async def stop(self):
+        """진행 중인 준비 작업 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "time_to_ready_seconds": (
+                round(self.time_to_ready, 3) if self.ready else None
+            ),
+            "elapsed_seconds": (
+                round(time.monotonic() - self.started_at, 3)
+                if self.started_at is not None and not self.ready
+                else None
+            ),
+            "steps": self.status,
+        }
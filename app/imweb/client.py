@@ -0,0 +1,125 @@
+import logging
+import time
+from functools import lru_cache
+from typing import Optional
+
+import aiohttp
+
+from app.common.config import settings
+from app.common.metrics import registry
+from app.common.tracing import record_span
+
+logger = logging.getLogger(__name__)
+
+upstream_duration = registry.histogram(
+    "imweb_request_duration_seconds", "아임웹 API 호출 시간", ("method", "endpoint")
+)
+upstream_errors = registry.counter(
+    "imweb_request_errors_total",
+    "아임웹 API 오류 응답/예외 수 (reason: 상태 코드 또는 예외 이름)",
+    ("method", "endpoint", "reason"),
+)
+upstream_in_flight = registry.gauge(
+    "imweb_requests_in_flight", "응답을 기다리는 아임웹 API 호출 수"
+)
+
+
+@lru_cache(maxsize=1024)
+def endpoint_label(path: str) -> str:
+    """지표 라벨용 경로 (상품 번호 / 회원 코드처럼 숫자가 든 구간은 {id}로)"""
+    path = path.split("?", 1)[0]
+    return "/".join(
+        "{id}" if any(char.isdigit() for char in segment) else segment
+        for segment in path.split("/")
+    )
+
+
+class UpstreamCall:
+    """아임웹 호출 하나의 지연 시간 / 오류 집계 (요청 추적 구간으로도 기록)
+
+    aiohttp 요청을 감싸서 사용하고, 응답 상태는 record_status로 기록
+    """
+
+    __slots__ = ("method", "endpoint", "status", "_started")
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.endpoint = endpoint_label(path)
+        self.status = 0
+        self._started = 0.0
+
+    def record_status(self, status: int):
+        self.status = status
+
+    async def __aenter__(self) -> "UpstreamCall":
+        upstream_in_flight.inc()
+        self._started = time.perf_counter()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        upstream_in_flight.dec()
+        duration = time.perf_counter() - self._started
+        upstream_duration.observe(duration, self.method, self.endpoint)
+        record_span("upstream", duration, f"{self.method} {self.endpoint}")
+        if exc_type is not None:
+            upstream_errors.inc(self.method, self.endpoint, exc_type.__name__)
+        elif self.status >= 400:
+            upstream_errors.inc(self.method, self.endpoint, str(self.status))
+
+
+class ImwebClient:
+    """아임웹 API 공용 HTTP 클라이언트 (커넥션 풀 재사용)"""
+
+    def __init__(
+        self,
+        limit: int = settings.IMWEB_HTTP_POOL_LIMIT,
+        limit_per_host: int = settings.IMWEB_HTTP_POOL_LIMIT_PER_HOST,
+        keepalive_timeout: float = settings.IMWEB_HTTP_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int = settings.IMWEB_HTTP_DNS_CACHE_TTL,
+        timeout: float = settings.IMWEB_HTTP_TIMEOUT,
+        connect_timeout: float = settings.IMWEB_HTTP_CONNECT_TIMEOUT,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+
+    async def start(self):
+        """세션 생성 (앱 시작 시 호출)"""
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+            logger.info(
+                "아임웹 HTTP 클라이언트 시작 - limit: %s, limit_per_host: %s",
+                self.limit,
+                self.limit_per_host,
+            )
+
+    async def close(self):
+        """세션 종료 (앱 종료 시 호출)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("아임웹 HTTP 클라이언트 종료")
+        self._session = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """공용 세션 반환 (lifespan 밖에서 호출되면 지연 생성)"""
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+
+# 클라이언트 인스턴스 생성
+imweb_client = ImwebClient()
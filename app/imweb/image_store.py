@@ -0,0 +1,204 @@
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from fastapi import HTTPException
+
+from app.common.config import settings
+from app.imweb.old_imweb import imweb_service
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    sha256 TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    content_type TEXT NOT NULL,
+    uploaded_at REAL NOT NULL
+);
+"""
+
+# 허용 이미지 형식 (파일 앞부분 시그니처로 확인)
+IMAGE_SIGNATURES = {
+    "image/jpeg": (b"\xff\xd8\xff",),
+    "image/png": (b"\x89PNG\r\n\x1a\n",),
+    "image/gif": (b"GIF87a", b"GIF89a"),
+    "image/webp": (b"RIFF",),
+}
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    """파일 앞부분으로 이미지 형식 판별 (허용 형식이 아니면 None)"""
+    for content_type, signatures in IMAGE_SIGNATURES.items():
+        if head.startswith(signatures):
+            if content_type == "image/webp" and head[8:12] != b"WEBP":
+                continue
+            return content_type
+    return None
+
+
+class ImageStore:
+    """이미지 업로드 (청크 단위 검사 + SHA-256 → CDN URL 색인으로 중복 업로드 방지)"""
+
+    def __init__(
+        self,
+        path: str = settings.IMAGE_INDEX_PATH,
+        max_bytes: int = settings.IMAGE_UPLOAD_MAX_BYTES,
+        chunk_size: int = settings.IMAGE_UPLOAD_CHUNK_SIZE,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self._db: Optional[sqlite3.Connection] = None
+        # 같은 이미지 동시 업로드는 하나의 업로드를 공유
+        self._uploads: dict[str, asyncio.Future] = {}
+
+        # 통계
+        self.uploads = 0
+        self.dedup_hits = 0
+        self.rejected = 0
+        self.bytes_uploaded = 0
+        self.bytes_saved = 0
+
+    def open(self):
+        """색인 DB 열기"""
+        if self._db is not None:
+            return
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def get(self, digest: str) -> Optional[str]:
+        """해시로 업로드된 이미지 URL 조회"""
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT url FROM images WHERE sha256 = ?", (digest,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, digest: str, url: str, size: int, content_type: str):
+        if self._db is None:
+            return
+        self._db.execute(
+            """
+            INSERT INTO images (sha256, url, size, content_type, uploaded_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(sha256) DO UPDATE SET url = excluded.url
+            """,
+            (digest, url, size, content_type, time.time()),
+        )
+
+    def _reject(self, status_code: int, detail: str):
+        self.rejected += 1
+        raise HTTPException(status_code=status_code, detail=detail)
+
+    def scan(self, file: BinaryIO) -> tuple[str, int, str]:
+        """청크 단위로 읽으며 SHA-256 / 크기 / 형식 확인 (파일 위치는 처음으로 되돌림)"""
+        file.seek(0)
+        digest = hashlib.sha256()
+        size = 0
+        content_type = None
+        while chunk := file.read(self.chunk_size):
+            if content_type is None:
+                content_type = sniff_image_type(chunk)
+                if content_type is None:
+                    self._reject(
+                        415, "지원하지 않는 이미지 형식입니다 (jpeg/png/gif/webp)"
+                    )
+            size += len(chunk)
+            if size > self.max_bytes:
+                self._reject(
+                    413, f"이미지 크기는 {self.max_bytes} bytes 이하여야 합니다"
+                )
+            digest.update(chunk)
+        if content_type is None:
+            self._reject(400, "빈 파일입니다")
+        file.seek(0)
+        return digest.hexdigest(), size, content_type
+
+    async def _upload(
+        self, file: BinaryIO, filename: str, digest: str, size: int, content_type: str
+    ) -> str:
+        url = await imweb_service.upload_image(file, filename, content_type)
+        if not url:
+            raise HTTPException(status_code=502, detail="이미지 업로드 실패")
+        await asyncio.to_thread(self.put, digest, url, size, content_type)
+        self.uploads += 1
+        self.bytes_uploaded += size
+        return url
+
+    def _clear_upload(self, digest: str, future: asyncio.Future):
+        if self._uploads.get(digest) is future:
+            del self._uploads[digest]
+
+    async def upload(self, file: BinaryIO, filename: str) -> dict:
+        """이미지 업로드 (이미 올린 이미지면 아임웹 호출 없이 기존 URL 반환)"""
+        digest, size, content_type = await asyncio.to_thread(self.scan, file)
+
+        url = await asyncio.to_thread(self.get, digest)
+        deduplicated = url is not None
+        if deduplicated:
+            self.dedup_hits += 1
+            self.bytes_saved += size
+        else:
+            future = self._uploads.get(digest)
+            if future is None:
+                future = asyncio.ensure_future(
+                    self._upload(file, filename, digest, size, content_type)
+                )
+                future.add_done_callback(
+                    lambda done: self._clear_upload(digest, done)
+                )
+                self._uploads[digest] = future
+            else:
+                deduplicated = True
+                self.dedup_hits += 1
+                self.bytes_saved += size
+            url = await asyncio.shield(future)
+
+        logger.info(
+            "이미지 업로드 - sha256: %s, 크기: %s bytes, 중복: %s",
+            digest[:12],
+            size,
+            deduplicated,
+        )
+        return {
+            "url": url,
+            "sha256": digest,
+            "size": size,
+            "content_type": content_type,
+            "deduplicated": deduplicated,
+        }
+
+    def stats(self) -> dict:
+        indexed = 0
+        if self._db is not None:
+            indexed = self._db.execute("SELECT COUNT(*) FROM images").fetchone()[0]
+        return {
+            "indexed": indexed,
+            "uploads": self.uploads,
+            "dedup_hits": self.dedup_hits,
+            "rejected": self.rejected,
+            "bytes_uploaded": self.bytes_uploaded,
+            "bytes_saved": self.bytes_saved,
+        }
+
+
+# 이미지 업로드 인스턴스 생성
+image_store = ImageStore()
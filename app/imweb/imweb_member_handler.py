@@ -1,127 +1,105 @@
+import asyncio
 import logging
 from typing import Optional
 
 import aiohttp
 from fastapi import HTTPException
 
+from app.common.config import settings
+from app.imweb.limiter import Priority, priority
+from app.imweb.member_cache import MemberEntry, member_cache
+from app.imweb.member_mirror import member_mirror
 from app.imweb.old_imweb import imweb_service
+from app.imweb.resilience import deadline
 
 logger = logging.getLogger(__name__)
 
 
 class ImwebMemberHandler:
+    async def _search_member(self, email: str) -> MemberEntry:
+        """회원 검색 후 캐시에 저장 (미러가 최신이면 미러에서, 없으면 아임웹에서)"""
+        if member_mirror.is_warm():
+            member = member_mirror.get(email)
+            if member is not None:
+                return member_cache.put(email, member)
+
+        logger.debug("회원 검색 요청: %s", email)
+        try:
+            member = await imweb_service.get_member_by_email(email)
+        except HTTPException as e:
+            # 아임웹 장애 중에는 동기화가 늦은 미러 데이터라도 사용
+            member = member_mirror.get(email) if e.status_code >= 500 else None
+            if member is None:
+                raise
+            logger.warning("아임웹 장애로 회원 미러 데이터 사용: %s", email)
+        else:
+            if member is not None:
+                member_mirror.upsert_members([member])
+        return member_cache.put(email, member)
+
     async def get_mbti_result(self, email: str) -> Optional[str]:
-        """회원의 MBTI 결과 조회"""
+        """회원의 MBTI 결과 조회 (회원/결과가 없으면 None, 아임웹 장애는 HTTPException)"""
         try:
-            # 액세스 토큰 얻기
-            access_token = await imweb_service.get_access_token()
-            if not access_token:
-                logger.error("토큰 발급 실패")
+            entry = member_cache.get(email)
+            if entry is None:
+                with (
+                    deadline(settings.IMWEB_REQUEST_DEADLINE),
+                    priority(Priority.MBTI),
+                ):
+                    entry = await self._search_member(email)
+
+            if not entry.found:
+                logger.error("검색된 회원 없음")
                 return None
 
-            # 아임웹 API로 회원 정보 조회
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "Content-Type": "application/json",
-                    "access-token": access_token,
-                }
-
-                # 이메일로 회원 검색
-                search_url = f"{imweb_service.base_url}/member/members"
-                params = {"search_type": "email", "search_value": email, "limit": 1}
-
-                logger.info(f"회원 검색 요청: {search_url} - {params}")
-
-                async with session.get(
-                    search_url, headers=headers, params=params
-                ) as response:
-                    if response.status == 404:
-                        logger.error("회원을 찾을 수 없음")
-                        return None
-
-                    if not response.ok:
-                        error_text = await response.text()
-                        logger.error(f"회원 검색 실패: {error_text}")
-                        return None
-
-                    data = await response.json()
-                    members = data.get("data", {}).get("list", [])
-
-                    if not members:
-                        logger.error("검색된 회원 없음")
-                        return None
+            # home_page 필드에서 MBTI 결과 추출
+            mbti_result = entry.home_page
+            logger.debug("MBTI 결과: %s", mbti_result)
 
-                    # home_page 필드에서 MBTI 결과 추출
-                    member = members[0]
-                    mbti_result = member.get("home_page")
-
-                    logger.info(f"조회된 회원 정보: {member}")
-                    logger.info(f"MBTI 결과: {mbti_result}")
-
-                    if mbti_result and len(mbti_result) == 4:  # MBTI는 4글자
-                        return mbti_result
-                    return None
-
-        except Exception as e:
-            logger.error(f"MBTI 결과 조회 실패: {str(e)}")
+            if mbti_result and len(mbti_result) == 4:  # MBTI는 4글자
+                return mbti_result
             return None
 
+        except HTTPException:
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # 재시도 후에도 실패한 네트워크 오류는 '결과 없음'과 구분
+            logger.error("MBTI 결과 조회 실패: %s", e)
+            raise HTTPException(status_code=502, detail="회원 정보 조회 실패")
+
     async def save_mbti_result(self, email: str, mbti_result: str) -> bool:
-        """회원의 MBTI 결과 저장"""
+        """회원의 MBTI 결과 저장 (검색 + 저장 전체에 하나의 제한 시간 적용)"""
         try:
-            # 액세스 토큰 얻기
-            access_token = await imweb_service.get_access_token()
-            if not access_token:
-                raise HTTPException(status_code=401, detail="토큰 발급 실패")
-
-            # 회원 검색
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "Content-Type": "application/json",
-                    "access-token": access_token,
-                }
-
-                # 이메일로 회원 검색
-                search_url = f"{imweb_service.base_url}/member/members"
-                params = {"search_type": "email", "search_value": email, "limit": 1}
-
-                async with session.get(
-                    search_url, headers=headers, params=params
-                ) as response:
-                    if not response.ok:
-                        error_text = await response.text()
-                        logger.error(f"회원 검색 실패: {error_text}")
-                        raise HTTPException(
-                            status_code=404, detail="회원을 찾을 수 없습니다"
-                        )
-
-                    data = await response.json()
-                    members = data.get("data", {}).get("list", [])
-
-                    if not members:
-                        raise HTTPException(
-                            status_code=404, detail="회원을 찾을 수 없습니다"
-                        )
-
-                    member = members[0]
-                    member_code = member.get("member_code")
-
-                    # MBTI 결과 저장
-                    update_url = f"{imweb_service.base_url}/member/member/{member_code}"
-                    update_data = {"home_page": mbti_result}
-
-                    async with session.patch(
-                        update_url, headers=headers, json=update_data
-                    ) as update_response:
-                        if update_response.status == 200:
-                            return True
-                        logger.error(
-                            f"MBTI 결과 저장 실패: {await update_response.text()}"
-                        )
-                        return False
+            with deadline(settings.IMWEB_REQUEST_DEADLINE), priority(Priority.MBTI):
+                # 캐시된 member_code가 있으면 검색 없이 바로 저장
+                # (가입 직후일 수 있으므로 '회원 없음' 캐시는 무시)
+                entry = member_cache.get(email)
+                if entry is None or not entry.found:
+                    entry = await self._search_member(email)
+
+                if not entry.found:
+                    raise HTTPException(status_code=404, detail="회원을 찾을 수 없습니다")
+
+                # MBTI 결과 저장
+                update_data = {"home_page": mbti_result}
+
+                update_response = await imweb_service.request(
+                    "PATCH", f"/member/member/{entry.member_code}", json=update_data
+                )
+            if update_response.status == 200:
+                member_cache.update_home_page(email, mbti_result)
+                member_mirror.update_home_page(email, mbti_result)
+                return True
+
+            if update_response.status == 404:
+                # 캐시된 member_code가 더 이상 유효하지 않음
+                member_cache.invalidate(email)
+                member_mirror.delete(email)
+            logger.error("MBTI 결과 저장 실패: %s", update_response.text)
+            return False
 
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"MBTI 결과 저장 중 오류 발생: {str(e)}")
+            logger.error("MBTI 결과 저장 중 오류 발생: %s", e)
             return False
@@ -0,0 +1,247 @@
+import asyncio
+import contextvars
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from enum import IntEnum
+from typing import Optional
+
+from app.common.config import settings
+from app.common.metrics import registry
+from app.imweb.client import endpoint_label
+from app.imweb.resilience import is_retryable_error, is_retryable_status
+
+logger = logging.getLogger(__name__)
+
+limiter_wait = registry.histogram(
+    "imweb_limiter_wait_seconds",
+    "아임웹 호출이 동시 호출 슬롯을 기다린 시간 (우선순위별)",
+    ("lane",),
+)
+
+
+class Priority(IntEnum):
+    """아임웹 호출 우선순위 (값이 작을수록 먼저 처리)"""
+
+    MBTI = 0  # 사용자 MBTI 결과 조회/저장
+    ADMIN = 1  # 관리자 에이전시 조회/수정
+    BULK = 2  # 백그라운드 목록 갱신 / 대량 작업
+
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "imweb_priority", default=Priority.ADMIN
+)
+
+
+@contextmanager
+def priority(lane: Priority):
+    """블록 안의 아임웹 호출에 적용할 우선순위"""
+    token = _priority.set(lane)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+class LimiterSlot:
+    """호출 결과 기록용 (과부하 응답이면 동시 호출 수를 줄임)"""
+
+    __slots__ = ("overloaded",)
+
+    def __init__(self):
+        # None이면 결과를 알 수 없음 (취소 등) → 한도 조정 안 함
+        self.overloaded: Optional[bool] = None
+
+    def record_status(self, status: int):
+        self.overloaded = is_retryable_status(status)
+
+
+class AdaptiveLimiter:
+    """AIMD 방식 동시 호출 수 제한 + 우선순위별 대기열
+
+    - 정상 응답: 한도를 1/한도 만큼 증가 (왕복 1회당 약 +1)
+    - 429/5xx, 네트워크 오류, 기준보다 크게 늘어난 응답 시간: 한도 감소
+
+    기준 응답 시간은 엔드포인트별로 관리 (토큰 발급처럼 빠른 호출 때문에
+    파일 업로드 / 큰 목록 조회가 지연으로 판단되지 않도록)
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = settings.IMWEB_CONCURRENCY_INITIAL,
+        min_limit: int = settings.IMWEB_CONCURRENCY_MIN,
+        max_limit: int = settings.IMWEB_CONCURRENCY_MAX,
+        latency_tolerance: float = settings.IMWEB_CONCURRENCY_LATENCY_TOLERANCE,
+        backoff_ratio: float = 0.5,
+        latency_backoff_ratio: float = 0.9,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self.latency_backoff_ratio = latency_backoff_ratio
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._lanes: dict[Priority, deque] = {lane: deque() for lane in Priority}
+        # 엔드포인트별 기준 응답 시간 (최소값을 따라가되 천천히 올라감)
+        self._baselines: dict[str, float] = {}
+        self._last_decrease = 0.0
+
+        # 통계
+        self.acquired = {lane: 0 for lane in Priority}
+        self.wait_total = {lane: 0.0 for lane in Priority}
+        self.wait_max = {lane: 0.0 for lane in Priority}
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def queue_depth(self, lane: Optional[Priority] = None) -> int:
+        if lane is not None:
+            return len(self._lanes[lane])
+        return sum(len(waiters) for waiters in self._lanes.values())
+
+    async def acquire(self, lane: Optional[Priority] = None) -> float:
+        """호출 슬롯 확보 (대기한 시간 반환)"""
+        lane = current_priority() if lane is None else lane
+        started = time.monotonic()
+        if self._in_flight < self.limit and not self.queue_depth():
+            self._in_flight += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            self._lanes[lane].append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # 슬롯을 받은 직후 취소됨 → 다음 대기자에게 넘김
+                    self._in_flight -= 1
+                    self._wake()
+                else:
+                    self._lanes[lane].remove(waiter)
+                raise
+
+        waited = time.monotonic() - started
+        self.acquired[lane] += 1
+        self.wait_total[lane] += waited
+        self.wait_max[lane] = max(self.wait_max[lane], waited)
+        limiter_wait.observe(waited, lane.name.lower())
+        return waited
+
+    def _wake(self):
+        """우선순위 순서대로 빈 슬롯 배정"""
+        for lane in Priority:
+            waiters = self._lanes[lane]
+            while waiters and self._in_flight < self.limit:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    self._in_flight += 1
+                    waiter.set_result(None)
+            if self._in_flight >= self.limit:
+                return
+
+    def _decrease(self, ratio: float, reason: str, window: Optional[float]):
+        now = time.monotonic()
+        # 한 번의 장애로 동시에 실패한 호출들이 한도를 연속으로 깎지 않도록
+        if now - self._last_decrease < (window or 0.1):
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self._limit = max(float(self.min_limit), self._limit * ratio)
+        self.decreases += 1
+        if self.limit != previous:
+            logger.warning(
+                "아임웹 동시 호출 한도 감소 (%s): %s → %s", reason, previous, self.limit
+            )
+
+    def release(self, latency: float, overloaded: Optional[bool], endpoint: str = ""):
+        """호출 종료 (응답 시간과 과부하 여부로 한도 조정)"""
+        self._in_flight -= 1
+        baseline = self._baselines.get(endpoint)
+        if overloaded:
+            self._decrease(self.backoff_ratio, "과부하 응답", baseline)
+        elif overloaded is not None:
+            if baseline is None or latency < baseline:
+                baseline = latency
+            else:
+                baseline += (latency - baseline) * 0.01
+            self._baselines[endpoint] = baseline
+            if latency > baseline * self.latency_tolerance:
+                self._decrease(
+                    self.latency_backoff_ratio, f"응답 지연 {endpoint}", baseline
+                )
+            elif self._in_flight + 1 >= self.limit:
+                # 한도까지 사용 중일 때만 증가 (여유가 있으면 늘릴 근거가 없음)
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(self, lane: Optional[Priority] = None, endpoint: str = ""):
+        """async with limiter.slot(endpoint=...) as slot: ... slot.record_status(status)"""
+        await self.acquire(lane)
+        started = time.monotonic()
+        slot = LimiterSlot()
+        try:
+            yield slot
+        except Exception as e:
+            if is_retryable_error(e):
+                slot.overloaded = True
+            raise
+        finally:
+            self.release(time.monotonic() - started, slot.overloaded, endpoint)
+
+    def stats(self) -> dict:
+        """현재 한도 / 대기열 / 대기 시간"""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth(),
+            "baseline_latency": dict(self._baselines),
+            "decreases": self.decreases,
+            "lanes": {
+                lane.name.lower(): {
+                    "queue_depth": len(self._lanes[lane]),
+                    "acquired": self.acquired[lane],
+                    "wait_avg": (
+                        self.wait_total[lane] / self.acquired[lane]
+                        if self.acquired[lane]
+                        else None
+                    ),
+                    "wait_max": self.wait_max[lane],
+                }
+                for lane in Priority
+            },
+        }
+
+
+# 아임웹 호출 제한기 인스턴스 생성
+imweb_limiter = AdaptiveLimiter()
+
+registry.callback(
+    "imweb_concurrency_limit", "아임웹 동시 호출 한도", lambda: imweb_limiter.limit
+)
+registry.callback(
+    "imweb_limiter_in_flight",
+    "동시 호출 슬롯을 사용 중인 아임웹 호출 수",
+    lambda: imweb_limiter.stats()["in_flight"],
+)
+registry.callback(
+    "imweb_limiter_queue_depth",
+    "슬롯을 기다리는 아임웹 호출 수 (우선순위별)",
+    lambda: {
+        (lane,): stats["queue_depth"]
+        for lane, stats in imweb_limiter.stats()["lanes"].items()
+    },
+    ("lane",),
+)
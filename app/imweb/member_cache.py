@@ -0,0 +1,173 @@
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from app.common.config import settings
+from app.common.metrics import registry
+from app.common.shared_state import SharedState, shared_state
+
+logger = logging.getLogger(__name__)
+
+# 워커 간 공유 상태의 캐시 무효화 주제
+INVALIDATION_TOPIC = "member"
+
+
+@dataclass
+class MemberEntry:
+    """캐시된 회원 정보 (member_code가 없으면 '회원 없음' 캐시)"""
+
+    member_code: Optional[str]
+    home_page: Optional[str]
+    expires_at: float
+
+    @property
+    def found(self) -> bool:
+        return self.member_code is not None
+
+
+def normalize_email(email: str) -> str:
+    """캐시 키용 이메일 정규화"""
+    return email.strip().lower()
+
+
+class MemberCache:
+    """이메일 → 회원 정보 LRU + TTL 캐시
+
+    캐시는 프로세스별이므로 저장/삭제는 공유 상태에 기록하고, 조회 전에 다른 워커가
+    기록한 이메일을 지움 (다른 워커에서 저장한 값도 바로 읽을 수 있도록)
+    """
+
+    def __init__(
+        self,
+        max_size: int = settings.MEMBER_CACHE_SIZE,
+        ttl: float = settings.MEMBER_CACHE_TTL,
+        negative_ttl: float = settings.MEMBER_CACHE_NEGATIVE_TTL,
+        state: SharedState = shared_state,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.state = state
+        self._entries: OrderedDict[str, MemberEntry] = OrderedDict()
+        # 마지막으로 확인한 무효화 순번
+        self._seen: Optional[int] = None
+
+        # 통계
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.invalidated = 0
+
+    def _apply_invalidations(self):
+        """다른 워커가 저장/삭제한 이메일을 캐시에서 제거 (WAL 읽기라 대기 없음)"""
+        if not self.state.is_open:
+            return
+        try:
+            keys, self._seen = self.state.changes(INVALIDATION_TOPIC, self._seen)
+        except sqlite3.Error as e:
+            logger.warning("회원 캐시 무효화 확인 실패: %s", e)
+            return
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                self.invalidated += 1
+
+    def _publish(self, key: str):
+        if not self.state.is_open:
+            return
+        try:
+            # 캐시 항목은 ttl이 지나면 만료되므로 그 이상 기록을 남길 필요 없음
+            self.state.publish(INVALIDATION_TOPIC, key, retain=self.ttl)
+        except sqlite3.Error as e:
+            logger.warning("회원 캐시 무효화 기록 실패 - %s: %s", key, e)
+
+    def get(self, email: str) -> Optional[MemberEntry]:
+        """캐시 조회 (없거나 만료되면 None)"""
+        self._apply_invalidations()
+        key = normalize_email(email)
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        if entry.found:
+            self.hits += 1
+        else:
+            self.negative_hits += 1
+        return entry
+
+    def put(self, email: str, member: Optional[dict]) -> MemberEntry:
+        """아임웹 회원 검색 결과 저장 (None이면 짧은 시간 동안 '회원 없음' 캐시)"""
+        if member and member.get("member_code"):
+            entry = MemberEntry(
+                member_code=member["member_code"],
+                home_page=member.get("home_page"),
+                expires_at=time.monotonic() + self.ttl,
+            )
+        else:
+            entry = MemberEntry(
+                member_code=None,
+                home_page=None,
+                expires_at=time.monotonic() + self.negative_ttl,
+            )
+
+        key = normalize_email(email)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return entry
+
+    def update_home_page(self, email: str, home_page: str):
+        """저장 성공 시 캐시에 반영 (write-through, 다른 워커 캐시는 무효화)"""
+        key = normalize_email(email)
+        entry = self._entries.get(key)
+        if entry is not None and entry.found:
+            entry.home_page = home_page
+        self._publish(key)
+
+    def invalidate(self, email: str):
+        """캐시 항목 삭제 (다른 워커 캐시 포함)"""
+        key = normalize_email(email)
+        self._entries.pop(key, None)
+        self._publish(key)
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "invalidated": self.invalidated,
+            "hit_rate": (self.hits + self.negative_hits) / lookups if lookups else None,
+        }
+
+
+# 캐시 인스턴스 생성
+member_cache = MemberCache()
+
+registry.callback(
+    "member_cache_lookups_total",
+    "이메일 → 회원 캐시 조회 수",
+    lambda: {
+        ("hit",): member_cache.hits,
+        ("negative_hit",): member_cache.negative_hits,
+        ("miss",): member_cache.misses,
+    },
+    ("result",),
+    type="counter",
+)
+registry.callback(
+    "member_cache_entries", "회원 캐시 항목 수", lambda: member_cache.stats()["size"]
+)
@@ -0,0 +1,369 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from contextlib import aclosing
+from pathlib import Path
+from typing import Iterable, Optional
+
+from sqlalchemy import (
+    Float,
+    String,
+    Text,
+    create_engine,
+    delete,
+    event,
+    func,
+    select,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from app.common.config import settings
+from app.common.shared_state import SharedEntry, SharedState, shared_state
+from app.imweb.member_cache import normalize_email
+from app.imweb.old_imweb import MEMBERS_PER_PAGE, imweb_service
+
+logger = logging.getLogger(__name__)
+
+# 워커 간 공유 상태에 기록하는 동기화 결과 키
+SHARED_SYNC_KEY = "imweb:member_sync"
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class MirroredMember(Base):
+    """아임웹 회원 사본 (이메일 / member_code 인덱스)"""
+
+    __tablename__ = "members"
+
+    member_code: Mapped[str] = mapped_column(String, primary_key=True)
+    email: Mapped[Optional[str]] = mapped_column(String, index=True)
+    home_page: Mapped[Optional[str]] = mapped_column(String)
+    data: Mapped[str] = mapped_column(Text)
+    data_hash: Mapped[str] = mapped_column(String(32))
+    synced_at: Mapped[float] = mapped_column(Float, index=True)
+
+
+class MirrorState(Base):
+    """동기화 상태 (마지막 동기화 시각 등)"""
+
+    __tablename__ = "mirror_state"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    value: Mapped[float] = mapped_column(Float)
+
+
+def _member_hash(member: dict) -> str:
+    body = json.dumps(member, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.md5(body.encode("utf-8")).hexdigest()
+
+
+def _to_member(row: MirroredMember) -> dict:
+    member = json.loads(row.data)
+    member["member_code"] = row.member_code
+    member["home_page"] = row.home_page
+    return member
+
+
+class MemberMirror:
+    """로컬 SQLite 회원 미러 (주기 증분 동기화 + 앱에서 저장한 값 즉시 반영)
+
+    같은 호스트의 모든 워커가 같은 파일을 사용. 공유 상태가 열려 있으면 주기마다
+    한 워커만 동기화하고, 나머지는 DB에 기록된 동기화 상태만 다시 읽음
+    """
+
+    def __init__(
+        self,
+        path: str = settings.MEMBER_MIRROR_PATH,
+        sync_interval: float = settings.MEMBER_MIRROR_SYNC_INTERVAL,
+        full_sync_interval: float = settings.MEMBER_MIRROR_FULL_SYNC_INTERVAL,
+        stale_after: float = settings.MEMBER_MIRROR_STALE_AFTER,
+        sync_lease_ttl: float = settings.MEMBER_MIRROR_SYNC_LEASE_TTL,
+        state: SharedState = shared_state,
+    ):
+        self.path = path
+        self.sync_interval = sync_interval
+        self.full_sync_interval = full_sync_interval
+        self.stale_after = stale_after
+        self.sync_lease_ttl = sync_lease_ttl
+        self.state = state
+
+        self._engine: Optional[Engine] = None
+        self._sync_task: Optional[asyncio.Task] = None
+        self._state: dict[str, float] = {}
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.syncs = 0
+        self.sync_errors = 0
+        self.last_sync_changes = 0
+
+    def open(self):
+        """DB 열기 (테이블이 없으면 생성, 이전 동기화 상태 복원)"""
+        if self._engine is not None:
+            return
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._engine = create_engine(f"sqlite:///{self.path}")
+
+        @event.listens_for(self._engine, "connect")
+        def _set_pragmas(connection, record):
+            cursor = connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.close()
+
+        Base.metadata.create_all(self._engine)
+        self._load_state()
+
+    def _load_state(self):
+        """DB에 기록된 동기화 상태 읽기 (다른 워커의 동기화 포함)"""
+        with Session(self._engine) as session:
+            self._state = {
+                state.name: state.value for state in session.scalars(select(MirrorState))
+            }
+
+    def close(self):
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._engine is not None
+
+    def is_warm(self) -> bool:
+        """전체 동기화를 마쳤고 마지막 동기화가 오래되지 않았는지"""
+        if self._engine is None or "last_full_sync" not in self._state:
+            return False
+        return time.time() - self._state.get("last_sync", 0) < self.stale_after
+
+    def get(self, email: str) -> Optional[dict]:
+        """이메일로 회원 조회 (없으면 None)"""
+        if self._engine is None:
+            return None
+        with Session(self._engine) as session:
+            row = session.scalars(
+                select(MirroredMember)
+                .where(MirroredMember.email == normalize_email(email))
+                .limit(1)
+            ).first()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return _to_member(row)
+
+    def _upsert(self, session: Session, members: list[dict], now: float) -> int:
+        """변경된 회원만 저장 (변경 건수 반환)"""
+        hashes = {}
+        for member in members:
+            if member.get("member_code"):
+                hashes[member["member_code"]] = _member_hash(member)
+        if not hashes:
+            return 0
+
+        existing = dict(
+            session.execute(
+                select(MirroredMember.member_code, MirroredMember.data_hash).where(
+                    MirroredMember.member_code.in_(hashes)
+                )
+            ).all()
+        )
+        changed = [
+            member
+            for member in members
+            if member.get("member_code")
+            and existing.get(member["member_code"]) != hashes[member["member_code"]]
+        ]
+        if changed:
+            rows = [
+                {
+                    "member_code": member["member_code"],
+                    "email": normalize_email(member["email"]) if member.get("email") else None,
+                    "home_page": member.get("home_page"),
+                    "data": json.dumps(member, ensure_ascii=False, default=str),
+                    "data_hash": hashes[member["member_code"]],
+                    "synced_at": now,
+                }
+                for member in changed
+            ]
+            statement = insert(MirroredMember).values(rows)
+            session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[MirroredMember.member_code],
+                    set_={
+                        column: statement.excluded[column]
+                        for column in ("email", "home_page", "data", "data_hash", "synced_at")
+                    },
+                )
+            )
+        unchanged = [code for code in hashes if existing.get(code) == hashes[code]]
+        if unchanged:
+            # 전체 동기화 후 삭제된 회원 정리를 위해 확인 시각 갱신
+            session.execute(
+                update(MirroredMember)
+                .where(MirroredMember.member_code.in_(unchanged))
+                .values(synced_at=now)
+            )
+        return len(changed)
+
+    def upsert_members(self, members: Iterable[dict], now: Optional[float] = None) -> int:
+        """회원 목록 저장 (변경된 회원만 기록)"""
+        if self._engine is None:
+            return 0
+        with Session(self._engine) as session, session.begin():
+            return self._upsert(session, list(members), now or time.time())
+
+    def update_home_page(self, email: str, home_page: str):
+        """앱에서 MBTI 결과를 저장하면 바로 반영"""
+        if self._engine is None:
+            return
+        with Session(self._engine) as session, session.begin():
+            session.execute(
+                update(MirroredMember)
+                .where(MirroredMember.email == normalize_email(email))
+                .values(home_page=home_page)
+            )
+
+    def delete(self, email: str):
+        """더 이상 유효하지 않은 회원 삭제"""
+        if self._engine is None:
+            return
+        with Session(self._engine) as session, session.begin():
+            session.execute(
+                delete(MirroredMember).where(
+                    MirroredMember.email == normalize_email(email)
+                )
+            )
+
+    def _set_state(self, session: Session, **values: float):
+        for name, value in values.items():
+            session.merge(MirrorState(name=name, value=value))
+            self._state[name] = value
+
+    def _finish_sync(self, full: bool, started: float) -> int:
+        with Session(self._engine) as session, session.begin():
+            removed = 0
+            if full:
+                # 전체 동기화에서 보이지 않은 회원은 탈퇴한 것으로 간주
+                removed = session.execute(
+                    delete(MirroredMember).where(MirroredMember.synced_at < started)
+                ).rowcount
+                self._set_state(session, last_full_sync=started)
+            self._set_state(session, last_sync=started)
+            return removed
+
+    async def sync(self, full: bool = False) -> int:
+        """아임웹 회원 목록과 동기화 (변경 건수 반환)
+
+        증분 동기화는 최신 회원부터 조회하다가 변경 없는 페이지를 만나면 중단
+        """
+        started = time.time()
+        changes = 0
+        batch: list[dict] = []
+        async with aclosing(imweb_service.iter_members()) as members:
+            async for member in members:
+                batch.append(member)
+                if len(batch) < MEMBERS_PER_PAGE:
+                    continue
+                changed = await asyncio.to_thread(self.upsert_members, batch, started)
+                changes += changed
+                batch = []
+                if not full and not changed:
+                    break
+        if batch:
+            changes += await asyncio.to_thread(self.upsert_members, batch, started)
+
+        removed = await asyncio.to_thread(self._finish_sync, full, started)
+        self.syncs += 1
+        self.last_sync_changes = changes
+        logger.info(
+            "회원 미러 %s 동기화 완료 - 변경: %s건, 삭제: %s건, 소요: %.2fs",
+            "전체" if full else "증분",
+            changes,
+            removed,
+            time.time() - started,
+        )
+        return changes
+
+    async def _scheduled_sync(self) -> int:
+        full = time.time() - self._state.get("last_full_sync", 0) > self.full_sync_interval
+        return await self.sync(full=full)
+
+    async def _shared_sync(self) -> tuple[dict, None]:
+        # lease를 얻은 뒤 다른 워커가 마친 동기화 상태를 보고 전체 동기화 여부 결정
+        await asyncio.to_thread(self._load_state)
+        changes = await self._scheduled_sync()
+        return {"changes": changes}, None
+
+    def _recently_synced(self, entry: SharedEntry) -> bool:
+        return entry.age < self.sync_interval
+
+    async def sync_once(self):
+        """주기 동기화 한 번 (공유 상태가 열려 있으면 lease를 얻은 워커만 아임웹 조회)"""
+        if not self.state.is_open:
+            await self._scheduled_sync()
+            return
+        await self.state.coordinate(
+            SHARED_SYNC_KEY,
+            self._shared_sync,
+            self._recently_synced,
+            lease_ttl=self.sync_lease_ttl,
+        )
+        await asyncio.to_thread(self._load_state)
+
+    async def _sync_loop(self):
+        while True:
+            try:
+                await self.sync_once()
+            except Exception as e:
+                self.sync_errors += 1
+                logger.error("회원 미러 동기화 실패: %s", e)
+            await asyncio.sleep(self.sync_interval)
+
+    def start(self):
+        """DB 열기 및 주기 동기화 시작"""
+        self.open()
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.create_task(self._sync_loop())
+
+    async def stop(self):
+        """주기 동기화 종료"""
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+            self._sync_task = None
+        self.close()
+
+    def stats(self) -> dict:
+        """미러 상태 및 통계"""
+        count = 0
+        if self._engine is not None:
+            with Session(self._engine) as session:
+                count = session.scalar(select(func.count()).select_from(MirroredMember))
+        return {
+            "warm": self.is_warm(),
+            "members": count,
+            "last_sync": self._state.get("last_sync"),
+            "last_full_sync": self._state.get("last_full_sync"),
+            "hits": self.hits,
+            "misses": self.misses,
+            "syncs": self.syncs,
+            "sync_errors": self.sync_errors,
+            "last_sync_changes": self.last_sync_changes,
+        }
+
+
+# 회원 미러 인스턴스 생성
+member_mirror = MemberMirror()
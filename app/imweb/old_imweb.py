@@ -1,29 +1,100 @@
 import asyncio
 import hashlib
 import hmac
+import json
 import logging
+import math
 import os
 import time
-from typing import Optional
+from collections import deque
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, AsyncIterator, BinaryIO, Callable, Optional
 
 import aiohttp
 from dotenv import load_dotenv
-
-# 로거 설정
-logging.basicConfig(level=logging.INFO)
+from fastapi import HTTPException
+
+from app.common.config import settings
+from app.common.metrics import registry
+from app.common.shared_state import SharedEntry, shared_state
+from app.common.tracing import span
+from app.imweb.client import UpstreamCall, endpoint_label, imweb_client
+from app.imweb.limiter import Priority, imweb_limiter, priority
+from app.imweb.resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    deadline,
+    is_retryable_error,
+    is_retryable_status,
+    is_safe_to_retry,
+    retry_call,
+)
+
+# 로거 설정 (핸들러/포맷은 시작 시 app.common.logging_config에서 설정)
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+token_refreshes = registry.counter(
+    "imweb_token_refreshes_total", "아임웹 토큰 발급 시도 수", ("result",)
+)
+
+# 토큰 유효시간 50분 = 3000초
+TOKEN_TTL = 3000
+# 만료 5분 전에 백그라운드에서 미리 갱신
+TOKEN_REFRESH_MARGIN = 300
+# 갱신 실패 시 재시도 간격
+TOKEN_RETRY_INTERVAL = 10
+# 워커 간 공유 상태에 저장하는 토큰 키
+SHARED_TOKEN_KEY = "imweb:token"
+
+# 상품 목록 페이지 크기 / 동시 조회 페이지 수
+PRODUCTS_PER_PAGE = 100
+PRODUCT_PAGE_CONCURRENCY = 5
+
+# 회원 목록 페이지 크기 / 미리 요청해 둘 다음 페이지 수
+MEMBERS_PER_PAGE = 100
+MEMBER_PAGE_PREFETCH = 2
+
+
+@dataclass
+class ImwebResponse:
+    """아임웹 API 응답"""
+
+    status: int
+    data: Any
+    text: str
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
 
 class ImwebService:
     def __init__(self):
         self.api_key = os.getenv("IMWEB_API_KEY")
         self.secret_key = os.getenv("IMWEB_SECRET_KEY")
-        self.base_url = "https://api.imweb.me/v2"
+        self.base_url = os.getenv("IMWEB_BASE_URL", "https://api.imweb.me/v2")
         self.access_token = None
         self.token_timestamp = None
-        self.category_mapping = {}
+        self._token_refresh: Optional[asyncio.Future] = None
+        # 토큰 에러로 버린 토큰 (공유 상태에 남아 있어도 다시 쓰지 않음)
+        self._rejected_token: Optional[str] = None
+        # 같은 호스트의 다른 워커와 토큰 공유 (열려 있지 않으면 직접 발급)
+        self.shared_state = shared_state
+        self._refresher_task: Optional[asyncio.Task] = None
+        # 아임웹 호출 재시도 정책 / 장애 시 빠른 실패용 서킷 브레이커
+        self.retry_policy = RetryPolicy(
+            max_attempts=settings.IMWEB_RETRY_MAX_ATTEMPTS,
+            base_delay=settings.IMWEB_RETRY_BASE_DELAY,
+            max_delay=settings.IMWEB_RETRY_MAX_DELAY,
+        )
+        self.breaker = CircuitBreaker(
+            "아임웹",
+            failure_threshold=settings.IMWEB_BREAKER_FAILURE_THRESHOLD,
+            reset_timeout=settings.IMWEB_BREAKER_RESET_TIMEOUT,
+        )
 
     def generate_signature(self, timestamp: str) -> str:
         """HMAC 서명 생성"""
@@ -33,195 +104,444 @@ class ImwebService:
         ).hexdigest()
         return signature
 
-    async def get_access_token(self):
-        """액세스 토큰 발급 또는 재사용"""
-        current_time = time.time()
+    def _token_expired(self, margin: float = 0) -> bool:
+        """토큰 만료 여부 (margin초 만큼 일찍 만료로 간주)"""
+        if not self.access_token or not self.token_timestamp:
+            return True
+        return time.time() - self.token_timestamp > TOKEN_TTL - margin
 
-        # 토큰이 없거나, 발급된지 50분이 지났으면 새로 발급
-        if (
-            not self.access_token
-            or not self.token_timestamp
-            or current_time - self.token_timestamp > 3000
-        ):  # 50분 = 3000초
-            try:
-                async with aiohttp.ClientSession() as session:
-                    url = f"{self.base_url}/auth"
-                    params = {"key": self.api_key, "secret": self.secret_key}
-
-                    async with session.get(url, params=params) as response:
-                        result = await response.json()
-                        if response.status == 200 and result.get("access_token"):
-                            self.access_token = result["access_token"]
-                            self.token_timestamp = current_time
-                            return self.access_token
-                        logger.error(f"토큰 발급 실패: {result}")
-                        return None
-            except Exception as e:
-                logger.error(f"토큰 발급 실패: {str(e)}")
+    async def _fetch_access_token(self) -> Optional[str]:
+        """아임웹 /auth 호출로 새 토큰 발급"""
+        try:
+            session = imweb_client.session
+            url = f"{self.base_url}/auth"
+            params = {"key": self.api_key, "secret": self.secret_key}
+
+            # 모든 호출이 토큰을 기다리므로 가장 높은 우선순위로 발급
+            async with (
+                imweb_limiter.slot(Priority.MBTI, endpoint="GET /auth") as slot,
+                UpstreamCall("GET", "/auth") as call,
+                session.get(url, params=params) as response,
+            ):
+                slot.record_status(response.status)
+                call.record_status(response.status)
+                result = await response.json()
+                if response.status == 200 and result.get("access_token"):
+                    self.access_token = result["access_token"]
+                    self.token_timestamp = time.time()
+                    token_refreshes.inc("success")
+                    logger.info("액세스 토큰 발급 완료")
+                    return self.access_token
+                token_refreshes.inc("failure")
+                logger.error("토큰 발급 실패: %s", result)
                 return None
+        except Exception as e:
+            token_refreshes.inc("failure")
+            logger.error("토큰 발급 실패: %s", e)
+            return None
+
+    async def _obtain_access_token(self) -> Optional[str]:
+        """토큰 확보 (다른 워커가 발급한 유효한 토큰이 있으면 재사용, /auth는 한 워커만 호출)"""
+        if not self.shared_state.is_open:
+            return await self._fetch_access_token()
 
+        rejected = self._rejected_token
+
+        def usable(entry: SharedEntry) -> bool:
+            return entry.value != rejected and entry.ttl() > TOKEN_REFRESH_MARGIN
+
+        async def fetch() -> tuple[str, float]:
+            token = await self._fetch_access_token()
+            if not token:
+                raise RuntimeError("토큰 발급 실패")
+            return token, self.token_timestamp + TOKEN_TTL
+
+        try:
+            entry = await self.shared_state.coordinate(SHARED_TOKEN_KEY, fetch, usable)
+        except RuntimeError:
+            return None  # _fetch_access_token에서 기록
+        self.access_token = entry.value
+        self.token_timestamp = entry.expires_at - TOKEN_TTL
+        return self.access_token
+
+    async def _refresh_access_token(self) -> Optional[str]:
+        """토큰 갱신 (동시 호출 시 하나의 /auth 요청을 공유)"""
+        if self._token_refresh is None:
+            self._token_refresh = asyncio.ensure_future(self._obtain_access_token())
+            self._token_refresh.add_done_callback(self._clear_token_refresh)
+        # 호출자가 취소되어도 공유 중인 발급 요청은 유지
+        return await asyncio.shield(self._token_refresh)
+
+    def _clear_token_refresh(self, future: asyncio.Future):
+        if self._token_refresh is future:
+            self._token_refresh = None
+
+    async def get_access_token(self):
+        """액세스 토큰 발급 또는 재사용"""
+        # 토큰이 없거나, 발급된지 50분이 지났으면 새로 발급
+        if self._token_expired():
+            return await self._refresh_access_token()
         return self.access_token
 
-    async def refresh_token_if_needed(self, response_data: dict) -> bool:
+    async def refresh_token(self, stale_token: Optional[str] = None) -> Optional[str]:
+        """토큰 에러 발생 시 재발급 (같은 토큰으로 실패한 요청들은 1회만 재발급)"""
+        if stale_token is None or stale_token == self.access_token:
+            self._rejected_token = self.access_token
+            self.access_token = None
+            self.token_timestamp = None
+        return await self.get_access_token()
+
+    async def refresh_token_if_needed(
+        self, response_data: dict, stale_token: Optional[str] = None
+    ) -> bool:
         """토큰 에러 시 갱신"""
         if response_data.get("code") == -2:  # Error Token
             logger.info("토큰 만료 감지, 새로운 토큰 발급 시도")
-            self.access_token = None
-            self.token_timestamp = None
+            await self.refresh_token(stale_token)
             return True
         return False
 
-    async def get_all_members(self, page: int = 1):
-        """모든 회원 목록 조회"""
-        try:
-            # 토큰 가져오기 (캐시된 토큰 사용)
-            access_token = await self.get_access_token()
+    async def _token_refresh_loop(self):
+        """만료 전에 토큰을 미리 갱신하는 백그라운드 작업"""
+        while True:
+            if self._token_expired(margin=TOKEN_REFRESH_MARGIN):
+                token = await self._refresh_access_token()
+                if not token:
+                    await asyncio.sleep(TOKEN_RETRY_INTERVAL)
+                    continue
+            # 다음 갱신 시점까지 대기
+            remaining = TOKEN_TTL - TOKEN_REFRESH_MARGIN
+            remaining -= time.time() - self.token_timestamp
+            await asyncio.sleep(max(remaining, 1))
+
+    def start_token_refresher(self):
+        """토큰 자동 갱신 작업 시작"""
+        if self._refresher_task is None or self._refresher_task.done():
+            self._refresher_task = asyncio.create_task(self._token_refresh_loop())
+
+    async def stop_token_refresher(self):
+        """토큰 자동 갱신 작업 종료"""
+        if self._refresher_task is not None:
+            self._refresher_task.cancel()
+            try:
+                await self._refresher_task
+            except asyncio.CancelledError:
+                pass
+            self._refresher_task = None
+
+    @staticmethod
+    def is_token_error(response: ImwebResponse) -> bool:
+        """토큰 만료/무효 응답 여부 (HTTP 401 또는 code -2)"""
+        if response.status == 401:
+            return True
+        data = response.data
+        return isinstance(data, dict) and data.get("code") in (-2, 401)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        access_token: str,
+        form: Optional[Callable[[], aiohttp.FormData]] = None,
+        **kwargs,
+    ) -> ImwebResponse:
+        headers = {"access-token": access_token}
+        if form is None:
+            headers["Content-Type"] = "application/json"
+        else:
+            # 한 번 보낸 multipart 본문은 재사용할 수 없으므로 전송마다 새로 구성
+            kwargs["data"] = form()
+        headers.update(kwargs.pop("headers", None) or {})
+        url = f"{self.base_url}{path}"
+
+        session = imweb_client.session
+        async with (
+            imweb_limiter.slot(endpoint=f"{method} {endpoint_label(path)}") as slot,
+            UpstreamCall(method, path) as call,
+            session.request(method, url, headers=headers, **kwargs) as response,
+        ):
+            slot.record_status(response.status)
+            call.record_status(response.status)
+            text = await response.text()
+            try:
+                data = json.loads(text) if text else None
+            except ValueError:
+                data = None
+            return ImwebResponse(status=response.status, data=data, text=text)
+
+    async def _send_with_retry(
+        self, method: str, path: str, access_token: str, **kwargs
+    ) -> ImwebResponse:
+        """일시적 장애(네트워크 오류, 타임아웃, 429/5xx)면 백오프 후 재전송"""
+        return await retry_call(
+            lambda: self._send(method, path, access_token, **kwargs),
+            self.retry_policy,
+            breaker=self.breaker,
+            is_failure=lambda response: is_retryable_status(response.status),
+            retry_on_error=is_retryable_error,
+            can_repeat=partial(is_safe_to_retry, method),
+            operation=f"아임웹 {method} {path}",
+        )
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        use_deadline: bool = True,
+        **kwargs,
+    ) -> ImwebResponse:
+        """아임웹 API 호출 (일시적 장애는 재시도, 토큰 에러 시 1회 재발급 후 재요청)
+
+        multipart 본문은 form(FormData를 만드는 함수)으로 전달 (재전송 시 다시 구성).
+        use_deadline=False면 호출한 쪽의 제한 시간만 적용.
+        서킷이 열려 있으면 503, 제한 시간을 넘기면 504 (HTTPException)
+        """
+        # 장애 중에는 토큰 발급도 시도하지 않고 바로 실패
+        self.breaker.check()
+        with deadline(settings.IMWEB_REQUEST_DEADLINE if use_deadline else None):
+            with span("token"):
+                access_token = await self.get_access_token()
             if not access_token:
-                return {"error": "토큰 발급 실패"}
-
-            headers = {"Content-Type": "application/json", "access-token": access_token}
+                raise HTTPException(status_code=401, detail="토큰 발급 실패")
+
+            response = await self._send_with_retry(method, path, access_token, **kwargs)
+            if self.is_token_error(response):
+                logger.info("토큰 에러 감지, 재발급 후 재요청: %s %s", method, path)
+                access_token = await self.refresh_token(access_token)
+                if not access_token:
+                    raise HTTPException(status_code=401, detail="토큰 발급 실패")
+                response = await self._send_with_retry(
+                    method, path, access_token, **kwargs
+                )
+        return response
 
+    async def get_all_members(self, page: int = 1):
+        """모든 회원 목록 조회 (대량 작업 우선순위로 호출)"""
+        try:
             params = {"page": page, "limit": 100}
 
-            url = f"{self.base_url}/member/members"
-
-            # API 호출 전 1초 대기
-            await asyncio.sleep(1)
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, params=params) as response:
-                    return await response.json()
+            with priority(Priority.BULK):
+                response = await self.request("GET", "/member/members", params=params)
+            return response.data
 
         except Exception as e:
-            logging.error(f"API 호출 에러: {str(e)}")
+            logger.error("API 호출 에러: %s", e)
             return {"error": str(e)}
 
-    async def get_member_by_email(self, email: str):
-        """이메일로 회원 정보를 조회하는 메서드"""
-        try:
-            # 아임웹 API를 통해 회원 정보 조회
-            access_token = await self.get_access_token()
-            if not access_token:
-                return None
-
-            headers = {"Content-Type": "application/json", "access-token": access_token}
-            url = f"{self.base_url}/member/members"
-            params = {"search_type": "email", "keyword": email}
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, params=params) as response:
-                    result = await response.json()
-                    if response.status == 200 and "data" in result:
-                        members = result["data"].get("list", [])
-                        return members[0] if members else None
-                    return None
+    async def get_member_page(self, page: int, per_page: int = MEMBERS_PER_PAGE) -> dict:
+        """회원 목록 한 페이지 조회"""
+        params = {"page": page, "limit": per_page}
+        response = await self.request("GET", "/member/members", params=params)
+        result = response.data if isinstance(response.data, dict) else {}
+        if not response.ok or result.get("code", 200) != 200:
+            logger.error("회원 목록 %s페이지 조회 실패: %s", page, response.text)
+            raise HTTPException(status_code=502, detail=f"회원 목록 {page}페이지 조회 실패")
+        return result
+
+    async def iter_members(
+        self, per_page: int = MEMBERS_PER_PAGE, prefetch: int = MEMBER_PAGE_PREFETCH
+    ) -> AsyncIterator[dict]:
+        """전체 회원을 페이지 순서대로 하나씩 반환
+
+        현재 페이지를 넘겨주는 동안 다음 prefetch개 페이지를 미리 요청하므로
+        메모리에는 최대 prefetch + 1 페이지만 유지됨
+        """
+
+        async def fetch(page: int) -> dict:
+            with priority(Priority.BULK):
+                return await self.get_member_page(page, per_page)
+
+        pages: deque[tuple[int, asyncio.Task]] = deque()
+        next_page = 1
+        last_page: Optional[int] = None
+
+        def schedule():
+            nonlocal next_page
+            while len(pages) < max(prefetch, 1) and (
+                last_page is None or next_page <= last_page
+            ):
+                pages.append((next_page, asyncio.create_task(fetch(next_page))))
+                next_page += 1
+                if next_page == 2 and last_page is None:
+                    # 첫 페이지 응답으로 전체 페이지 수를 확인한 뒤 나머지 요청
+                    return
 
-        except Exception as e:
-            logger.error(f"회원 정보 조회 실패: {str(e)}")
-            return None
-
-    async def get_categories(self) -> Optional[list]:
-        """아임웹 카테고리 목록 조회"""
         try:
-            access_token = await self.get_access_token()
-            if not access_token:
-                return None
+            schedule()
+            total_known = False
+            while pages:
+                page, task = pages.popleft()
+                result = await task
+                if not total_known:
+                    total_known = True
+                    last_page = self.get_total_pages(result, per_page)
+                items = (result.get("data") or {}).get("list") or []
+                if len(items) < per_page:
+                    # 마지막 페이지 (미리 요청한 뒤 페이지는 취소)
+                    last_page = page
+                    while pages:
+                        pages.pop()[1].cancel()
+                schedule()
+                for item in items:
+                    yield item
+        finally:
+            # 중간에 소비를 멈춘 경우 미리 요청한 페이지 정리
+            tasks = [task for _, task in pages]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def get_product_page(self, page: int, per_page: int = PRODUCTS_PER_PAGE):
+        """상품 목록 한 페이지 조회 (일시적 장애는 request에서 해당 페이지만 재시도)"""
+        params = {"per_page": per_page, "page": page}
+        try:
+            response = await self.request("GET", "/shop/products", params=params)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("상품 목록 %s페이지 조회 실패: %s", page, e)
+            raise HTTPException(
+                status_code=502, detail=f"상품 목록 {page}페이지 조회 실패"
+            )
 
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "Content-Type": "application/json",
-                    "access-token": access_token,
-                }
-                url = f"{self.base_url}/shop/categories"
-
-                async with session.get(url, headers=headers) as response:
-                    result = await response.json()
-                    if response.status == 200:
-                        return result.get("categories", [])
-                    return None
-        except Exception as e:
-            logger.error(f"카테고리 조회 실패: {str(e)}")
+        result = response.data or {}
+        if result.get("code") == 200:
+            return result
+        logger.error("상품 목록 %s페이지 응답 에러: %s", page, result)
+        if self.is_token_error(response):
+            raise HTTPException(status_code=401, detail="토큰 만료, 재시도 필요")
+        raise HTTPException(status_code=502, detail=f"상품 목록 {page}페이지 조회 실패")
+
+    @staticmethod
+    def get_total_pages(result: dict, per_page: int) -> Optional[int]:
+        """첫 페이지 응답에서 전체 페이지 수 추출"""
+        data = result.get("data") or {}
+        paging = data.get("pagenation") or data.get("pagination") or {}
+        if paging.get("total_page"):
+            return int(paging["total_page"])
+        if paging.get("data_count") is not None:
+            return max(1, math.ceil(int(paging["data_count"]) / per_page))
+        return None
+
+    async def get_all_products(self, per_page: int = PRODUCTS_PER_PAGE) -> list:
+        """전체 상품 목록 조회 (첫 페이지 이후 페이지는 병렬 조회)"""
+        first = await self.get_product_page(1, per_page)
+        products = list(first.get("data", {}).get("list", []))
+        total_pages = self.get_total_pages(first, per_page)
+        semaphore = asyncio.Semaphore(PRODUCT_PAGE_CONCURRENCY)
+
+        async def fetch(page: int) -> list:
+            async with semaphore:
+                result = await self.get_product_page(page, per_page)
+                return result.get("data", {}).get("list", [])
+
+        async def fetch_all(page_numbers: range) -> list[list]:
+            tasks = [asyncio.create_task(fetch(page)) for page in page_numbers]
+            try:
+                return await asyncio.gather(*tasks)
+            finally:
+                # 한 페이지가 실패하면 나머지 페이지 요청도 취소 (슬롯을 계속 잡지 않도록)
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        if total_pages is not None:
+            pages = await fetch_all(range(2, total_pages + 1))
+            for page_items in pages:
+                products.extend(page_items)
+            return products
+
+        # 페이지 정보가 없으면 마지막 페이지가 나올 때까지 묶음 단위로 병렬 조회
+        next_page = 2
+        last_size = len(products)
+        while last_size >= per_page:
+            window = range(next_page, next_page + PRODUCT_PAGE_CONCURRENCY)
+            pages = await fetch_all(window)
+            for page_items in pages:
+                products.extend(page_items)
+                last_size = len(page_items)
+                if last_size < per_page:
+                    break
+            next_page += PRODUCT_PAGE_CONCURRENCY
+        return products
+
+    async def get_member_by_email(self, email: str):
+        """이메일로 회원 정보를 조회하는 메서드 (회원이 없으면 None)"""
+        params = {"search_type": "email", "search_value": email, "limit": 1}
+        response = await self.request("GET", "/member/members", params=params)
+        if response.status == 404:
             return None
 
-    async def initialize_categories(self):
-        """카테고리 매핑 초기화"""
-        try:
-            categories = await self.get_categories()
-            if categories:
-                self.category_mapping.clear()
-                for category in categories:
-                    self.category_mapping[category["name"]] = category["no"]
-                logger.info(f"카테고�� 매핑 완료: {self.category_mapping}")
-            else:
-                logger.warning("카테고리 정보를 가져오지 못했습니다.")
-        except Exception as e:
-            logger.error(f"카테고리 초기화 실패: {str(e)}")
+        result = response.data if isinstance(response.data, dict) else {}
+        if not response.ok or result.get("code", 200) != 200:
+            logger.error("회원 검색 실패: %s", response.text)
+            raise HTTPException(status_code=502, detail="회원 검색 실패")
 
-    def get_category_id(self, category_name: str) -> Optional[str]:
-        """카테고리 이름으로 ID 조회"""
-        return self.category_mapping.get(category_name)
+        members = (result.get("data") or {}).get("list", [])
+        return members[0] if members else None
 
     async def upload_image(
-        self, access_token: str, image_data: bytes, filename: str, content_type: str
+        self, file: BinaryIO, filename: str, content_type: str
     ) -> Optional[str]:
-        """이미지 업로드"""
-        try:
-            headers = {"access-token": access_token, "Accept": "application/json"}
+        """이미지 업로드 (파일 객체를 청크 단위로 읽어 전송, 전체를 메모리에 올리지 않음)
+
+        다른 호출과 같이 토큰 에러 시 재발급 후 재전송 (파일은 처음부터 다시 읽음)
+        """
 
+        def form() -> aiohttp.FormData:
+            file.seek(0)
             # multipart/form-data로 이미지 전송
             data = aiohttp.FormData()
             data.add_field(
                 "files[]",  # 파일 필드
-                image_data,
+                file,
                 filename=filename,
                 content_type=content_type,
             )
             # 추가 필드
             data.add_field("target", "shop")  # 업로드 대상
             data.add_field("type", "image")  # 파일 타입
+            return data
 
-            # 아임웹 API 엔드포인트
-            url = f"{self.base_url}/file"  # 수정된 엔드포인트
-
-            logger.info(f"이미지 업로드 시도 - URL: {url}")
-            logger.info(
-                f"파일 정보 - 이름: {filename}, 타입: {content_type}, 크기: {len(image_data)} bytes"
+        logger.debug("이미지 업로드 시도 - 이름: %s, 타입: %s", filename, content_type)
+        try:
+            # 큰 파일은 오래 걸리므로 요청 제한 시간 대신 호출한 쪽의 제한 시간만 적용
+            response = await self.request(
+                "POST",
+                "/file",
+                use_deadline=False,
+                form=form,
+                headers={"Accept": "application/json"},
             )
-            logger.info(f"헤더 정보: {headers}")
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, data=data) as response:
-                    response_text = await response.text()
-                    logger.info(
-                        f"아임웹 응답 - 상태: {response.status}, 내용: {response_text}"
-                    )
-
-                    if response.status == 200:
-                        try:
-                            result = await response.json()
-                            if result.get("code") == 200:
-                                files = result.get("data", {}).get("files", [])
-                                if files and len(files) > 0:
-                                    # 이미지 URL 구성
-                                    file_info = files[0]
-                                    image_url = file_info.get("url")
-                                    if image_url:
-                                        logger.info(
-                                            f"이미지 업로드 성공 - URL: {image_url}"
-                                        )
-                                        return image_url
-                        except Exception as e:
-                            logger.error(f"응답 파싱 실패: {str(e)}")
-
-                    logger.error(
-                        f"이미지 업로드 실패 - 상태: {response.status}, 응답: {response_text}"
-                    )
-                    return None
-
         except Exception as e:
-            logger.error(f"이미지 업로드 중 예외 발생: {str(e)}")
+            logger.error("이미지 업로드 중 예외 발생: %s", e)
             return None
 
+        logger.debug("아임웹 응답 - 상태: %s, 내용: %s", response.status, response.text)
+        result = response.data if isinstance(response.data, dict) else {}
+        if response.status == 200 and result.get("code") == 200:
+            files = (result.get("data") or {}).get("files") or []
+            # 이미지 URL 구성
+            image_url = files[0].get("url") if files else None
+            if image_url:
+                logger.info("이미지 업로드 성공 - URL: %s", image_url)
+                return image_url
+
+        logger.error(
+            "이미지 업로드 실패 - 상태: %s, 응답: %s", response.status, response.text
+        )
+        return None
+
 
 # 서비스 인스턴스 생성
 imweb_service = ImwebService()
+
+registry.callback(
+    "imweb_circuit_state",
+    "아임웹 서킷 상태 (0: closed, 1: half_open, 2: open)",
+    lambda: {"closed": 0, "half_open": 1, "open": 2}[imweb_service.breaker.state],
+)
+registry.callback(
+    "imweb_circuit_rejected_total",
+    "서킷이 열려 바로 실패한 호출 수",
+    lambda: imweb_service.breaker.rejected,
+    type="counter",
+)
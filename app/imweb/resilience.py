@@ -0,0 +1,275 @@
+import asyncio
+import contextvars
+import logging
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import aiohttp
+from fastapi import HTTPException
+
+from app.common.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+retry_attempts = registry.counter(
+    "imweb_retries_total",
+    "아임웹 호출 재시도 수 (reason: 예외 이름 또는 response)",
+    ("reason",),
+)
+
+T = TypeVar("T")
+
+# 재시도할 HTTP 상태 코드 (일시적인 장애)
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+# 실패 후 다시 보내도 결과가 같은 메서드
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"})
+
+
+class CircuitOpenError(HTTPException):
+    """서킷이 열려 있어 호출하지 않고 바로 실패"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(
+            status_code=503,
+            detail=f"{name} API 일시 중단 (잠시 후 다시 시도해주세요)",
+            headers={"Retry-After": str(max(1, round(retry_after)))},
+        )
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(HTTPException):
+    """요청 제한 시간 초과"""
+
+    def __init__(self):
+        super().__init__(status_code=504, detail="아임웹 API 응답 시간 초과")
+
+
+def is_retryable_status(status: int) -> bool:
+    return status in RETRYABLE_STATUSES
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """네트워크 오류 / 타임아웃 / 일시적 장애 응답만 재시도"""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return is_retryable_status(error.status)
+    return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError))
+
+
+def is_safe_to_retry(method: str, error: Optional[BaseException] = None) -> bool:
+    """재시도해도 중복 처리 위험이 없는지 (POST는 요청이 전달되지 않은 경우만)"""
+    if method.upper() in IDEMPOTENT_METHODS:
+        return True
+    return isinstance(error, aiohttp.ClientConnectorError)
+
+
+# 현재 요청의 제한 시각 (time.monotonic 기준, 중첩 시 더 이른 쪽 적용)
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "imweb_deadline", default=None
+)
+
+
+@contextmanager
+def deadline(seconds: Optional[float]):
+    """블록 안의 아임웹 호출 전체에 적용할 제한 시간"""
+    if seconds is None:
+        yield
+        return
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires_at = min(expires_at, current)
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def time_remaining() -> Optional[float]:
+    """남은 제한 시간 (제한이 없으면 None)"""
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """재시도 정책 (지수 백오프 + full jitter)"""
+
+    max_attempts: int = 3
+    base_delay: float = 0.2
+    max_delay: float = 2.0
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째 실패 후 대기 시간"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """연속 실패 시 일정 시간 호출을 막고, 이후 시험 호출로 복구 여부 확인"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 15.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+
+        # 통계
+        self.rejected = 0
+        self.opened = 0
+
+    def _retry_after(self) -> float:
+        return self._opened_at + self.reset_timeout - time.monotonic()
+
+    def check(self):
+        """서킷이 열려 있으면 바로 실패 (상태 변경 없음)"""
+        if self.state == self.OPEN and self._retry_after() > 0:
+            self.rejected += 1
+            raise CircuitOpenError(self.name, self._retry_after())
+
+    def before_call(self):
+        """호출 허용 여부 확인 (허용되면 결과를 record_* 로 알려야 함)"""
+        self.check()
+        if self.state == self.OPEN:
+            logger.info("%s 서킷 half-open, 시험 호출 허용", self.name)
+            self.state = self.HALF_OPEN
+            self._half_open_calls = 0
+        if self.state == self.HALF_OPEN:
+            if self._half_open_calls >= self.half_open_max_calls:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, self.reset_timeout)
+            self._half_open_calls += 1
+
+    def record_success(self):
+        if self.state != self.CLOSED:
+            logger.info("%s 서킷 닫힘 (정상 응답)", self.name)
+        self.state = self.CLOSED
+        self._failures = 0
+
+    def record_failure(self):
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(
+                    "%s 서킷 열림 (%s회 연속 실패, %s초 동안 호출 중단)",
+                    self.name,
+                    self._failures,
+                    self.reset_timeout,
+                )
+                self.opened += 1
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def release(self):
+        """성공/실패로 판단할 수 없는 호출 종료 (취소 등)"""
+        if self.state == self.HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def reset(self):
+        self.state = self.CLOSED
+        self._failures = 0
+        self._half_open_calls = 0
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self._failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+
+async def retry_call(
+    func: Callable[[], Awaitable[T]],
+    policy: RetryPolicy,
+    breaker: Optional[CircuitBreaker] = None,
+    is_failure: Callable[[T], bool] = lambda result: False,
+    retry_on_error: Callable[[BaseException], bool] = is_retryable_error,
+    can_repeat: Callable[[Optional[BaseException]], bool] = lambda error: True,
+    operation: str = "",
+) -> T:
+    """func 호출 (일시적 장애면 백오프 후 재시도, 제한 시간 내에서만)
+
+    - is_failure: 재시도 대상 응답인지 (서킷 브레이커 실패로도 집계)
+    - retry_on_error: 재시도 대상 오류인지
+    - can_repeat: 같은 요청을 다시 보내도 되는지 (오류가 없으면 None)
+
+    재시도하지 않으면 마지막 응답을 반환하거나 마지막 오류를 다시 발생시킴
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        remaining = time_remaining()
+        if remaining is not None and remaining <= 0:
+            raise DeadlineExceeded()
+        if breaker is not None:
+            breaker.before_call()
+
+        try:
+            if remaining is None:
+                result = await func()
+            else:
+                result = await asyncio.wait_for(func(), remaining)
+        except asyncio.CancelledError:
+            if breaker is not None:
+                breaker.release()
+            raise
+        except Exception as e:
+            retryable = retry_on_error(e)
+            if breaker is not None:
+                if retryable:
+                    breaker.record_failure()
+                else:
+                    breaker.release()
+            remaining = time_remaining()
+            if remaining is not None and remaining <= 0:
+                raise DeadlineExceeded() from e
+            if not retryable or not can_repeat(e) or attempt >= policy.max_attempts:
+                raise
+            failure = f"{type(e).__name__}: {e}"
+            reason = type(e).__name__
+        else:
+            retryable = is_failure(result)
+            if breaker is not None:
+                if retryable:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            if not retryable or not can_repeat(None) or attempt >= policy.max_attempts:
+                return result
+            failure = "재시도 대상 응답"
+            reason = "response"
+
+        delay = policy.backoff(attempt)
+        remaining = time_remaining()
+        if remaining is not None and delay >= remaining:
+            raise DeadlineExceeded()
+        retry_attempts.inc(reason)
+        logger.warning(
+            "%s 실패, %.2f초 후 재시도 (%s/%s): %s",
+            operation,
+            delay,
+            attempt,
+            policy.max_attempts,
+            failure,
+        )
+        await asyncio.sleep(delay)
@@ -0,0 +1,110 @@
+import json
+import logging
+from pathlib import Path
+from typing import Optional
+
+from app.agency_admin.constants import MBTI_MAP
+from app.common.http_cache import make_etag
+from app.common.responses import dumps
+
+logger = logging.getLogger(__name__)
+
+# MBTI 궁합 원본 데이터 (best_match / good_match)
+MBTI_MATCH_PATH = Path(__file__).with_name("mbti_match.json")
+
+# 궁합 점수
+SCORE_NONE = 0
+SCORE_GOOD = 1
+SCORE_BEST = 2
+
+# MBTI_MAP 순서 기준 인덱스 (행/열)
+MBTI_TYPES = tuple(MBTI_MAP)
+MBTI_INDEX = {mbti: index for index, mbti in enumerate(MBTI_TYPES)}
+CODE_INDEX = {code: MBTI_INDEX[mbti] for mbti, code in MBTI_MAP.items()}
+
+
+def _serialize(payload) -> bytes:
+    return dumps(payload)
+
+
+def _split(matches) -> list:
+    if isinstance(matches, str):
+        return [match.strip() for match in matches.split(",") if match.strip()]
+    return list(matches or [])
+
+
+class MBTICompatibility:
+    """MBTI 궁합 조회 (16x16 점수 행렬 + 직렬화된 응답)"""
+
+    def __init__(self, results: list):
+        size = len(MBTI_TYPES)
+        self.matrix = [[SCORE_NONE] * size for _ in range(size)]
+        # 유형별 best / good 목록 (원본 데이터의 순서 유지)
+        self.matches = {mbti: {SCORE_BEST: [], SCORE_GOOD: []} for mbti in MBTI_TYPES}
+
+        for result in results:
+            row = MBTI_INDEX[result["mbti"]]
+            section = result["section_match"]
+            for mbti in _split(section.get("good_match")):
+                self.matrix[row][MBTI_INDEX[mbti]] = SCORE_GOOD
+            for mbti in _split(section.get("best_match")):
+                self.matrix[row][MBTI_INDEX[mbti]] = SCORE_BEST
+            matches = self.matches[result["mbti"]]
+            for key, score in (("best_match", SCORE_BEST), ("good_match", SCORE_GOOD)):
+                for mbti in _split(section.get(key)):
+                    # 양쪽에 있으면 행렬과 같이 best로만 표시
+                    if self.matrix[row][MBTI_INDEX[mbti]] == score:
+                        if mbti not in matches[score]:
+                            matches[score].append(mbti)
+
+        # 응답 미리 생성 (유형별 + 전체)
+        self.results = {mbti: self._build_result(mbti) for mbti in MBTI_TYPES}
+        self.bodies = {mbti: _serialize(self.results[mbti]) for mbti in MBTI_TYPES}
+        self.etags = {mbti: make_etag(body) for mbti, body in self.bodies.items()}
+        # 인코딩별 압축 결과 (첫 요청 시 압축 후 재사용)
+        self.compressed = {mbti: {} for mbti in MBTI_TYPES}
+        self.all_body = _serialize(
+            {
+                mbti: {"section_match": result["section_match"]}
+                for mbti, result in self.results.items()
+            }
+        )
+        self.all_etag = make_etag(self.all_body)
+        self.all_compressed = {}
+
+    @classmethod
+    def load(cls, path: Path = MBTI_MATCH_PATH) -> "MBTICompatibility":
+        """JSON 파일에서 궁합 데이터 로드"""
+        with open(path, encoding="utf-8") as f:
+            results = json.load(f)
+        logger.info("MBTI 궁합 데이터 로드 완료: %s개 유형", len(results))
+        return cls(results)
+
+    def _build_result(self, mbti: str) -> dict:
+        row = self.matrix[MBTI_INDEX[mbti]]
+        return {
+            "mbti": mbti,
+            "section_match": {
+                "best_match": list(self.matches[mbti][SCORE_BEST]),
+                "good_match": list(self.matches[mbti][SCORE_GOOD]),
+            },
+            "scores": dict(zip(MBTI_TYPES, row)),
+        }
+
+    @staticmethod
+    def normalize(mbti: str) -> Optional[str]:
+        """MBTI 유형명 또는 brand 코드를 유형명으로 변환"""
+        value = mbti.strip()
+        if value.upper() in MBTI_INDEX:
+            return value.upper()
+        if value in CODE_INDEX:
+            return MBTI_TYPES[CODE_INDEX[value]]
+        return None
+
+    def score(self, mbti: str, other: str) -> int:
+        """두 유형의 궁합 점수 (0: 없음, 1: good, 2: best)"""
+        return self.matrix[MBTI_INDEX[mbti]][MBTI_INDEX[other]]
+
+
+# 궁합 데이터 (앱 시작 시 1회 로드)
+mbti_compatibility = MBTICompatibility.load()
@@ -1,10 +1,13 @@
-import asyncio
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel, EmailStr
 
+from app.agency_admin.constants import MBTI_MAP
+from app.common.config import settings
 from app.imweb.imweb_member_handler import ImwebMemberHandler
+from app.imweb.member_cache import member_cache
+from app.mbti.write_behind import mbti_write_queue
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -23,132 +26,62 @@ class MBTIResultResponse(BaseModel):
 
 
 # MBTI 결과 저장 엔드포인트
-@router.post("/result")
-async def save_mbti_result(request: MBTIResultRequest, max_retries: int = 5):
-    """MBTI 결과 저장 (재시도 로직 포함)"""
-    retry_count = 0
-    last_error = None
-
-    while retry_count < max_retries:
-        try:
-            logger.info(
-                f"MBTI 결과 저장 시도 {retry_count + 1}/{max_retries}: {request.email}"
-            )
-
-            handler = ImwebMemberHandler()
-            success = await handler.save_mbti_result(request.email, request.result)
-
-            if success:
-                return {
-                    "email": request.email,
-                    "mbti": request.result,
-                    "message": "MBTI 결과가 성공적으로 저장되었습니다",
-                }
-
-            # 실패 시 재시도
-            retry_count += 1
-            if retry_count < max_retries:
-                logger.warning(
-                    f"저장 실패, 1초 후 재시도... ({retry_count}/{max_retries})"
-                )
-                await asyncio.sleep(1)  # 3초 대기
-            else:
-                logger.error(f"최대 재시도 횟수 도달: {request.email}")
-                raise HTTPException(
-                    status_code=500, detail="MBTI 결과 저장에 실패했습니다"
-                )
-
-        except HTTPException as he:
-            last_error = he
-            retry_count += 1
-            if retry_count < max_retries:
-                logger.warning(
-                    f"HTTP 예외 발생, 1초 후 재시도... ({retry_count}/{max_retries}): {str(he)}"
-                )
-                await asyncio.sleep(1)
-            else:
-                logger.error(f"최대 재시도 횟수 도달 (HTTP 예외): {str(he)}")
-                raise he
-
-        except Exception as e:
-            last_error = e
-            retry_count += 1
-            if retry_count < max_retries:
-                logger.warning(
-                    f"예외 발생, 1초 후 재시도... ({retry_count}/{max_retries}): {str(e)}"
-                )
-                await asyncio.sleep(1)
-            else:
-                logger.error(f"최대 재시도 횟수 도달 (예외): {str(e)}")
-                raise HTTPException(status_code=500, detail=str(e))
-
-    # 모든 재시도 실패 시
-    if last_error:
-        if isinstance(last_error, HTTPException):
-            raise last_error
-        raise HTTPException(status_code=500, detail=str(last_error))
+@router.post("/result", response_model=MBTIResultResponse)
+async def save_mbti_result(request: MBTIResultRequest, response: Response):
+    """MBTI 결과 저장 (write-behind 사용 시 저널 기록 후 202 응답)
+
+    아임웹 일시 장애는 공용 재시도 정책으로 처리되므로 여기서 다시 재시도하지 않음
+    """
+    mbti = request.result.strip().upper()
+    if mbti not in MBTI_MAP:
+        raise HTTPException(status_code=422, detail="올바르지 않은 MBTI 유형입니다")
+
+    if settings.MBTI_WRITE_BEHIND:
+        await mbti_write_queue.enqueue(request.email, mbti)
+        response.status_code = 202
+        return {
+            "email": request.email,
+            "mbti": mbti,
+            "message": "MBTI 결과 저장 요청이 접수되었습니다",
+        }
+
+    logger.debug("MBTI 결과 저장 요청: %s", request.email)
+    handler = ImwebMemberHandler()
+    if not await handler.save_mbti_result(request.email, mbti):
+        raise HTTPException(status_code=500, detail="MBTI 결과 저장에 실패했습니다")
+    return {
+        "email": request.email,
+        "mbti": mbti,
+        "message": "MBTI 결과가 성공적으로 저장되었습니다",
+    }
 
 
 # MBTI 결과 조회 엔드포인트
-@router.get("/result/{email}")
-async def get_mbti_result(email: str, max_retries: int = 5):
-    """MBTI 결과 조회 (재시도 로직 포함)"""
-    retry_count = 0
-    last_error = None
-
-    while retry_count < max_retries:
-        try:
-            logger.info(f"MBTI 결과 조회 시도 {retry_count + 1}/{max_retries}: {email}")
-
-            handler = ImwebMemberHandler()
-            mbti_result = await handler.get_mbti_result(email)
-
-            if mbti_result:
-                return {
-                    "email": email,
-                    "mbti": mbti_result,
-                    "message": "MBTI 결과 조회 성공",
-                }
-
-            # 실패 시 재시도
-            retry_count += 1
-            if retry_count < max_retries:
-                logger.warning(
-                    f"조회 실패, 1초 후 재시도... ({retry_count}/{max_retries})"
-                )
-                await asyncio.sleep(1)  # 1초 대기
-            else:
-                logger.error(f"최대 재시도 횟수 도달: {email}")
-                raise HTTPException(
-                    status_code=404, detail="MBTI 결과를 찾을 수 없습니다"
-                )
-
-        except HTTPException as he:
-            last_error = he
-            retry_count += 1
-            if retry_count < max_retries:
-                logger.warning(
-                    f"HTTP 예외 발생, 1초 후 재시도... ({retry_count}/{max_retries}): {str(he)}"
-                )
-                await asyncio.sleep(1)
-            else:
-                logger.error(f"최대 재시도 횟수 도달 (HTTP 예외): {str(he)}")
-                raise he
-
-        except Exception as e:
-            last_error = e
-            retry_count += 1
-            if retry_count < max_retries:
-                logger.warning(
-                    f"예외 발생, 1초 후 재시도... ({retry_count}/{max_retries}): {str(e)}"
-                )
-                await asyncio.sleep(1)
-            else:
-                logger.error(f"최대 재시도 횟수 도달 (예외): {str(e)}")
-                raise HTTPException(status_code=500, detail=str(e))
-
-    # 모든 재시도 실패 시
-    if last_error:
-        if isinstance(last_error, HTTPException):
-            raise last_error
-        raise HTTPException(status_code=500, detail=str(last_error))
+@router.get("/result/{email}", response_model=MBTIResultResponse)
+async def get_mbti_result(email: str):
+    """MBTI 결과 조회 (회원/결과가 없으면 재시도 없이 바로 404)"""
+    # 아직 저장 대기 중인 결과가 있으면 그 값을 우선 반환
+    pending = mbti_write_queue.pending_value(email)
+    if pending:
+        return {"email": email, "mbti": pending, "message": "MBTI 결과 조회 성공"}
+
+    logger.debug("MBTI 결과 조회 요청: %s", email)
+    handler = ImwebMemberHandler()
+    mbti_result = await handler.get_mbti_result(email)
+    if not mbti_result:
+        raise HTTPException(status_code=404, detail="MBTI 결과를 찾을 수 없습니다")
+    return {"email": email, "mbti": mbti_result, "message": "MBTI 결과 조회 성공"}
+
+
+# 회원 캐시 통계 조회 엔드포인트
+@router.get("/cache/stats")
+async def get_member_cache_stats():
+    """이메일 → 회원 정보 캐시 통계"""
+    return {"code": 200, "message": "success", "data": member_cache.stats()}
+
+
+# MBTI 결과 저장 큐 상태 조회 엔드포인트
+@router.get("/queue/stats")
+async def get_write_queue_stats():
+    """MBTI 결과 저장 대기열 상태 및 통계"""
+    return {"code": 200, "message": "success", "data": mbti_write_queue.stats()}
@@ -0,0 +1,359 @@
+import asyncio
+import logging
+import os
+import random
+import sqlite3
+import time
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from fastapi import HTTPException
+
+from app.common.config import settings
+from app.common.metrics import registry
+from app.imweb.imweb_member_handler import ImwebMemberHandler
+from app.imweb.member_cache import normalize_email
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pending (
+    email TEXT PRIMARY KEY,
+    address TEXT NOT NULL,
+    mbti TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    claimed_by TEXT,
+    claim_expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS pending_next_attempt ON pending (next_attempt_at);
+CREATE TABLE IF NOT EXISTS failed (
+    email TEXT NOT NULL,
+    mbti TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    error TEXT,
+    failed_at REAL NOT NULL
+);
+"""
+
+# 처리 중 표시 컬럼이 없던 이전 저널에 추가
+_CLAIM_COLUMNS = {"claimed_by": "TEXT", "claim_expires_at": "REAL"}
+
+
+class MBTIWriteQueue:
+    """MBTI 결과 저장 write-behind 큐 (SQLite 저널 + 워커)
+
+    저널은 같은 호스트의 모든 워커 프로세스가 함께 사용. 대기 중인 값은 저널에서
+    조회하고, 처리할 항목은 claim(유효시간 있음)으로 한 워커만 가져감
+    """
+
+    def __init__(
+        self,
+        path: str = settings.MBTI_WRITE_JOURNAL_PATH,
+        workers: int = settings.MBTI_WRITE_WORKERS,
+        max_attempts: int = settings.MBTI_WRITE_MAX_ATTEMPTS,
+        retry_base: float = settings.MBTI_WRITE_RETRY_BASE,
+        retry_max: float = settings.MBTI_WRITE_RETRY_MAX,
+        claim_ttl: float = settings.MBTI_WRITE_CLAIM_TTL,
+    ):
+        self.path = path
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.claim_ttl = claim_ttl
+        # 프로세스 번호가 재사용되어도 이전 프로세스의 claim과 구분
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.handler = ImwebMemberHandler()
+
+        self._db: Optional[sqlite3.Connection] = None
+        self._tasks: list[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        # 이 프로세스에서 처리 중인 이메일 (통계용)
+        self._in_flight: set[str] = set()
+
+        # 통계
+        self.enqueued = 0
+        self.saved = 0
+        self.retried = 0
+        self.failed = 0
+
+    def open(self):
+        """저널 열기 (재시작 시 남아있는 항목 복원)"""
+        if self._db is not None:
+            return
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(pending)")}
+        for name, type_ in _CLAIM_COLUMNS.items():
+            if name not in columns:
+                try:
+                    self._db.execute(f"ALTER TABLE pending ADD COLUMN {name} {type_}")
+                except sqlite3.OperationalError:
+                    pass  # 다른 워커가 먼저 추가
+        pending = self.pending_count()
+        if pending:
+            logger.info("저장 대기 중인 MBTI 결과 복원: %s건", pending)
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    async def enqueue(self, email: str, mbti: str):
+        """저장 요청 기록 (같은 이메일의 대기 중인 요청은 마지막 값으로 합침)
+
+        저널 쓰기(커밋)는 스레드에서 수행해 이벤트 루프를 막지 않음
+        """
+        await asyncio.to_thread(self._record, email, mbti)
+        self.enqueued += 1
+        self._wakeup.set()
+
+    def _record(self, email: str, mbti: str):
+        # 자동 커밋 단일 문장이므로 루프에서 쓰는 다른 문장과 섞여도 안전
+        key = normalize_email(email)
+        now = time.time()
+        self._db.execute(
+            """
+            INSERT INTO pending
+                (email, address, mbti, seq, attempts, next_attempt_at, created_at)
+            VALUES (?, ?, ?, ?, 0, ?, ?)
+            ON CONFLICT(email) DO UPDATE SET
+                address = excluded.address,
+                mbti = excluded.mbti,
+                seq = excluded.seq,
+                attempts = 0,
+                next_attempt_at = excluded.next_attempt_at
+            """,
+            (key, email, mbti, time.time_ns(), now, now),
+        )
+
+    def pending_value(self, email: str) -> Optional[str]:
+        """저장 대기 중인 MBTI 결과 (다른 워커가 접수한 요청 포함)"""
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT mbti FROM pending WHERE email = ?", (normalize_email(email),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def pending_count(self) -> int:
+        if self._db is None:
+            return 0
+        return self._db.execute("SELECT COUNT(*) FROM pending").fetchone()[0]
+
+    def _claim(self, drained: Optional[set] = None) -> Optional[tuple]:
+        """처리할 항목 하나를 가져옴 (다른 워커가 claim한 이메일 제외)
+
+        선택과 claim 표시를 한 문장으로 처리하므로 두 워커가 같은 항목을 가져가지 않음
+        """
+        now = time.time()
+        # 종료 시에는 재시도 일정과 관계없이 아직 시도하지 않은 항목 선택
+        due = float("inf") if drained is not None else now
+        excluded = drained or set()
+        placeholders = ",".join("?" * len(excluded))
+        row = self._db.execute(
+            f"""
+            UPDATE pending SET claimed_by = ?, claim_expires_at = ?
+            WHERE email = (
+                SELECT email FROM pending
+                WHERE next_attempt_at <= ?
+                    AND (claimed_by IS NULL OR claim_expires_at < ?)
+                    AND email NOT IN ({placeholders})
+                ORDER BY next_attempt_at LIMIT 1
+            )
+            RETURNING email, address, mbti, seq, attempts
+            """,
+            (self.owner, now + self.claim_ttl, due, now, *excluded),
+        ).fetchone()
+        if row is not None:
+            self._in_flight.add(row[0])
+        return row
+
+    def _release(self, email: str):
+        """claim 해제 (처리 중 들어온 같은 이메일의 새 값을 다시 가져갈 수 있도록)"""
+        self._db.execute(
+            "UPDATE pending SET claimed_by = NULL, claim_expires_at = NULL "
+            "WHERE email = ? AND claimed_by = ?",
+            (email, self.owner),
+        )
+
+    def _next_due_in(self) -> float:
+        now = time.time()
+        # 다른 워커가 처리 중인 항목은 claim이 만료될 때 다시 확인
+        row = self._db.execute(
+            """
+            SELECT MIN(
+                CASE WHEN claimed_by IS NOT NULL AND claim_expires_at >= ?
+                THEN claim_expires_at ELSE next_attempt_at END
+            ) FROM pending
+            """,
+            (now,),
+        ).fetchone()
+        if row[0] is None:
+            return self.retry_max
+        return min(max(row[0] - now, 0.01), self.retry_max)
+
+    def _backoff(self, attempts: int) -> float:
+        # 지수 백오프 + full jitter
+        return random.uniform(0, min(self.retry_max, self.retry_base * 2**attempts))
+
+    async def _process(
+        self, email: str, address: str, mbti: str, seq: int, attempts: int
+    ):
+        error = None
+        retryable = True
+        try:
+            success = await self.handler.save_mbti_result(address, mbti)
+        except HTTPException as e:
+            success = False
+            error = str(e.detail)
+            # 회원 없음은 재시도해도 결과가 같으므로 바로 실패 처리
+            retryable = e.status_code != 404
+        except Exception as e:
+            success = False
+            error = str(e)
+
+        if success:
+            self._db.execute(
+                "DELETE FROM pending WHERE email = ? AND seq = ?", (email, seq)
+            )
+            self.saved += 1
+            return
+
+        attempts += 1
+        if not retryable or attempts >= self.max_attempts:
+            logger.error("MBTI 결과 저장 최종 실패 (%s회): %s - %s", attempts, email, error)
+            self._db.execute(
+                "INSERT INTO failed (email, mbti, attempts, error, failed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (email, mbti, attempts, error, time.time()),
+            )
+            self._db.execute(
+                "DELETE FROM pending WHERE email = ? AND seq = ?", (email, seq)
+            )
+            self.failed += 1
+            return
+
+        delay = self._backoff(attempts)
+        logger.warning(
+            "MBTI 결과 저장 실패, %.1f초 후 재시도 (%s/%s): %s - %s",
+            delay,
+            attempts,
+            self.max_attempts,
+            email,
+            error,
+        )
+        # 그 사이 새 값이 들어왔으면(seq 변경) 새 값의 일정을 유지
+        self._db.execute(
+            "UPDATE pending SET attempts = ?, next_attempt_at = ? "
+            "WHERE email = ? AND seq = ?",
+            (attempts, time.time() + delay, email, seq),
+        )
+        self.retried += 1
+
+    async def _worker(self, drained: Optional[set] = None):
+        # wait_for는 대기가 끝나는 순간의 취소를 놓칠 수 있으므로 종료 표시도 확인
+        while drained is not None or not self._stopping:
+            job = self._claim(drained)
+            if job is None:
+                if drained is not None:
+                    return
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self._next_due_in())
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            email = job[0]
+            if drained is not None:
+                drained.add(email)
+            try:
+                await self._process(*job)
+            finally:
+                self._in_flight.discard(email)
+                if self._db is not None:
+                    self._release(email)
+                # 처리 중 들어온 같은 이메일 요청을 다른 워커가 가져갈 수 있도록
+                self._wakeup.set()
+
+    def start(self):
+        """저널 열기 및 워커 시작"""
+        self.open()
+        self._stopping = False
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._worker()) for _ in range(self.workers)
+            ]
+
+    async def stop(self, timeout: float = settings.MBTI_WRITE_DRAIN_TIMEOUT):
+        """워커 종료 (남은 항목은 제한 시간 내에서 한 번 더 처리, 나머지는 저널에 보존)"""
+        self._stopping = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._in_flight.clear()
+
+        if self._db is not None:
+            # 중단된 처리의 claim은 바로 해제 (만료를 기다리지 않음)
+            self._db.execute(
+                "UPDATE pending SET claimed_by = NULL, claim_expires_at = NULL "
+                "WHERE claimed_by = ?",
+                (self.owner,),
+            )
+        if self._db is not None and self.pending_count():
+            drained = set()
+            drainers = [
+                asyncio.create_task(self._worker(drained))
+                for _ in range(self.workers)
+            ]
+            done, pending = await asyncio.wait(drainers, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*drainers, return_exceptions=True)
+            remaining = self.pending_count()
+            if remaining:
+                logger.warning("저장되지 않은 MBTI 결과 %s건은 재시작 시 처리", remaining)
+        self.close()
+
+    def stats(self) -> dict:
+        """큐 상태 및 통계"""
+        return {
+            "pending": self.pending_count(),
+            "in_flight": len(self._in_flight),
+            "enqueued": self.enqueued,
+            "saved": self.saved,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
+
+
+# 큐 인스턴스 생성
+mbti_write_queue = MBTIWriteQueue()
+
+registry.callback(
+    "mbti_write_pending", "저장 대기 중인 MBTI 결과 수", mbti_write_queue.pending_count
+)
+registry.callback(
+    "mbti_write_attempts_total",
+    "MBTI 결과 저장 처리 결과 수 (retried: 재시도 예약)",
+    lambda: {
+        ("saved",): mbti_write_queue.saved,
+        ("retried",): mbti_write_queue.retried,
+        ("failed",): mbti_write_queue.failed,
+    },
+    ("result",),
+    type="counter",
+)
@@ -0,0 +1,118 @@
+import csv
+import io
+import json
+import logging
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from app.common.auth import require_admin_key
+from app.imweb.member_mirror import member_mirror
+from app.imweb.old_imweb import imweb_service
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# 스트리밍 응답 묶음 크기 (이만큼 쌓이면 전송)
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _split_fields(fields: Optional[str]) -> Optional[list[str]]:
+    if not fields:
+        return None
+    return [field.strip() for field in fields.split(",") if field.strip()] or None
+
+
+def _project(member: dict, fields: Optional[list[str]]) -> dict:
+    if fields is None:
+        return member
+    return {field: member.get(field) for field in fields}
+
+
+def _csv_value(value):
+    # 중첩된 값은 JSON 문자열로 저장
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+async def _export_lines(
+    members: AsyncIterator[dict], first: Optional[dict], fmt: str, fields
+) -> AsyncIterator[str]:
+    """회원 한 명씩 NDJSON/CSV 줄로 변환"""
+    if first is None:
+        if fmt == "csv" and fields:
+            yield ",".join(fields) + "\r\n"
+        return
+
+    if fmt == "csv":
+        # 필드를 지정하지 않으면 첫 회원의 필드를 헤더로 사용
+        columns = fields or list(first)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        writer.writerow([_csv_value(first.get(column)) for column in columns])
+        yield buffer.getvalue()
+        async for member in members:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerow([_csv_value(member.get(column)) for column in columns])
+            yield buffer.getvalue()
+        return
+
+    yield json.dumps(_project(first, fields), ensure_ascii=False) + "\n"
+    async for member in members:
+        yield json.dumps(_project(member, fields), ensure_ascii=False) + "\n"
+
+
+async def _chunked(lines: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """작은 줄들을 묶어서 전송"""
+    chunk = []
+    size = 0
+    try:
+        async for line in lines:
+            chunk.append(line)
+            size += len(line)
+            if size >= EXPORT_CHUNK_SIZE:
+                yield "".join(chunk).encode("utf-8")
+                chunk = []
+                size = 0
+    except Exception as e:
+        # 응답 헤더를 이미 보냈으므로 상태 코드로 알릴 수 없음
+        logger.error("회원 내보내기 중단: %s", e)
+        raise
+    if chunk:
+        yield "".join(chunk).encode("utf-8")
+
+
+@router.get("/export", dependencies=[Depends(require_admin_key)])
+async def export_members(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    fields: Optional[str] = Query(None, description="내보낼 필드 (콤마 구분)"),
+):
+    """전체 회원 내보내기 (NDJSON / CSV 스트리밍, 선택한 필드만 포함 가능)
+
+    개인정보가 포함되므로 관리자 키(X-Admin-Key)가 필요
+    """
+    projection = _split_fields(fields)
+    members = imweb_service.iter_members()
+    # 첫 페이지 조회 실패는 스트리밍 시작 전에 오류 응답으로 반환
+    first = await anext(members, None)
+
+    return StreamingResponse(
+        _chunked(_export_lines(members, first, format, projection)),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="members.{format}"'},
+    )
+
+
+@router.get("/mirror/stats")
+async def get_mirror_stats():
+    """로컬 회원 미러 상태 조회"""
+    return {"code": 200, "message": "success", "data": member_mirror.stats()}
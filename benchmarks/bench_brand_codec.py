@@ -0,0 +1,58 @@
+"""brand 디코딩: 항목별 json.loads vs 일괄 + 캐시 디코더 (상품 10만 개)
+
+실행: python -m benchmarks.bench_brand_codec
+"""
+import json
+import time
+
+from app.agency_admin import brand_codec
+from app.agency_admin.constants import REVERSE_LOCATION_MAP, REVERSE_MBTI_MAP
+from benchmarks.fake_imweb import fake_product
+
+PRODUCTS = 100_000
+
+
+def per_item_decode(brands: list) -> list:
+    """기존 방식: 항목마다 json.loads + 역매핑"""
+    result = []
+    for brand in brands:
+        brand_data = json.loads(brand)
+        if isinstance(brand_data, list) and len(brand_data) >= 4:
+            result.append(
+                (
+                    REVERSE_LOCATION_MAP.get(brand_data[0], "서울"),
+                    REVERSE_MBTI_MAP.get(brand_data[1], "ENFJ"),
+                    brand_data[2],
+                    brand_data[3],
+                )
+            )
+    return result
+
+
+def measure(label: str, func, repeat: int = 3):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<36} {best * 1000:>9.1f}ms  ({best / PRODUCTS * 1e9:>6.0f}ns/item)")
+
+
+def main():
+    brands = [fake_product(no)["brand"] for no in range(1, PRODUCTS + 1)]
+    print(f"상품 {PRODUCTS:,}개, 고유 brand {len(set(brands)):,}개")
+
+    measure("per-item json.loads", lambda: per_item_decode(brands))
+
+    def cold():
+        brand_codec.clear_cache()
+        brand_codec.decode_brands(brands)
+
+    measure("batched decoder (cold cache)", cold)
+    brand_codec.decode_brands(brands)
+    measure("batched decoder (warm cache)", lambda: brand_codec.decode_brands(brands))
+
+
+if __name__ == "__main__":
+    main()
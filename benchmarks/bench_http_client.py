@@ -0,0 +1,59 @@
+"""요청마다 세션을 만드는 방식과 공용 커넥션 풀 방식의 처리량 비교
+
+실행: python -m benchmarks.bench_http_client [요청 수] [동시성]
+"""
+import asyncio
+import sys
+import time
+
+import aiohttp
+
+from app.imweb.client import ImwebClient
+from benchmarks.fake_imweb import FakeImweb
+
+
+async def per_request_session(url: str):
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url) as response:
+            await response.json()
+
+
+async def run(label: str, call, total: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await call()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+    print(f"{label:<22} {total / elapsed:>10.1f} req/s  ({elapsed:.2f}s)")
+    return total / elapsed
+
+
+async def main(total: int, concurrency: int):
+    fake = FakeImweb()
+    base_url = await fake.start()
+    url = f"{base_url}/member/members"
+    client = ImwebClient()
+    await client.start()
+
+    async def pooled():
+        async with client.session.get(url) as response:
+            await response.json()
+
+    try:
+        print(f"요청 {total}건, 동시성 {concurrency}")
+        before = await run("per-request session", lambda: per_request_session(url), total, concurrency)
+        after = await run("shared pooled client", pooled, total, concurrency)
+        print(f"개선율: x{after / before:.2f}")
+    finally:
+        await client.close()
+        await fake.stop()
+
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    asyncio.run(main(total, concurrency))
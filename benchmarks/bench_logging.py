@@ -0,0 +1,105 @@
+"""/agency/list 처리량: 동기 basicConfig 로깅 vs 큐 기반 JSON 로깅
+
+요청마다 INFO 한 줄과 응답 내용을 담은 DEBUG 한 줄을 남기는 상황을 가정하고,
+로그 출력은 실제 파일에 기록
+
+실행: python -m benchmarks.bench_logging [요청 수] [동시성]
+"""
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+
+import httpx
+from fastapi import FastAPI, Request
+
+from app.agency_admin.agency_endpoint import router
+from app.agency_admin.catalog import agency_catalog
+from app.common.logging_config import setup_logging, shutdown_logging
+from app.imweb.client import imweb_client
+from app.imweb.old_imweb import imweb_service
+from benchmarks.fake_imweb import FakeImweb
+
+logger = logging.getLogger("benchmarks.access")
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(router, prefix="/agency")
+
+    @app.middleware("http")
+    async def access_log(request: Request, call_next):
+        response = await call_next(request)
+        logger.info(
+            "%s %s %s", request.method, request.url.path, response.status_code
+        )
+        logger.debug("응답 헤더: %s", dict(response.headers))
+        return response
+
+    return app
+
+
+def reset_logging():
+    shutdown_logging()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+
+async def run(label: str, app: FastAPI, total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def one():
+            async with semaphore:
+                response = await client.get("/agency/list", params={"per_page": 20})
+                response.raise_for_status()
+
+        await one()  # 워밍업
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        elapsed = time.perf_counter() - started
+
+    print(f"{label:<28} {total / elapsed:>10.1f} req/s  ({elapsed:.2f}s)")
+    return total / elapsed
+
+
+async def main(total: int, concurrency: int):
+    fake = FakeImweb(products=1000)
+    imweb_service.base_url = await fake.start()
+    await imweb_client.start()
+    await agency_catalog.rebuild()
+    app = build_app()
+
+    try:
+        print(f"요청 {total}건, 동시성 {concurrency}")
+        with tempfile.NamedTemporaryFile("w") as output:
+            # 기존 방식: 이벤트 루프에서 바로 포맷팅/파일 쓰기, 응답 내용도 INFO 이상으로 기록
+            reset_logging()
+            logging.basicConfig(stream=output, level=logging.DEBUG, force=True)
+            before = await run("basicConfig (동기)", app, total, concurrency)
+
+            # 큐 핸들러 + 리스너 스레드, 호출 위치별 개수 제한
+            reset_logging()
+            setup_logging(level="INFO", stream=output)
+            after = await run("setup_logging (큐 + JSON)", app, total, concurrency)
+
+            reset_logging()
+            logging.getLogger().setLevel(logging.CRITICAL)
+            baseline = await run("로깅 없음 (참고)", app, total, concurrency)
+
+        print(f"개선율: x{after / before:.2f} (로깅 없음 대비 {after / baseline:.0%})")
+    finally:
+        reset_logging()
+        await imweb_client.close()
+        await fake.stop()
+
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    asyncio.run(main(total, concurrency))
@@ -0,0 +1,96 @@
+"""지표 수집 비용 측정: 요청 / 아임웹 호출 하나당 추가되는 시간 (마이크로초)
+
+- 원시 연산: Counter.inc / Histogram.observe
+- MetricsMiddleware: 최소 ASGI 앱을 직접 호출해 미들웨어 유무 비교 (네트워크 / 라우팅 제외)
+- UpstreamCall: 아임웹 호출 하나를 감싸는 비용
+
+실행: python -m benchmarks.bench_metrics [반복 수]
+"""
+import asyncio
+import sys
+import time
+
+from app.common.metrics import MetricsMiddleware, Registry
+from app.imweb.client import UpstreamCall
+
+# 미들웨어 비교 측정 반복 횟수
+ROUNDS = 7
+
+
+def per_call_us(label: str, seconds: float, count: int) -> float:
+    us = seconds / count * 1e6
+    print(f"{label:<34} {us:>8.3f} µs/call")
+    return us
+
+
+def bench_primitives(count: int):
+    registry = Registry()
+    counter = registry.counter("c_total", "", ("method", "route", "status"))
+    histogram = registry.histogram("h_seconds", "", ("method", "route"))
+
+    started = time.perf_counter()
+    for _ in range(count):
+        counter.inc("GET", "/agency/list", 200)
+    per_call_us("Counter.inc (3 labels)", time.perf_counter() - started, count)
+
+    started = time.perf_counter()
+    for i in range(count):
+        histogram.observe(i % 100 / 1000, "GET", "/agency/list")
+    per_call_us("Histogram.observe (2 labels)", time.perf_counter() - started, count)
+
+
+class _Route:
+    path = "/agency/{agency_id}"
+
+
+async def endpoint(scope, receive, send):
+    """라우팅이 끝난 뒤의 최소 ASGI 앱 (라우트 기록 후 빈 응답)"""
+    scope["route"] = _Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def drive(app, count: int) -> float:
+    """ASGI 앱을 직접 count번 호출 (전송 계층 / 라우팅 비용 제외)"""
+    scope = {"type": "http", "method": "GET", "path": "/agency/123"}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(count):
+        await app(dict(scope), receive, send)
+    return time.perf_counter() - started
+
+
+async def bench_upstream(count: int):
+    started = time.perf_counter()
+    for _ in range(count):
+        async with UpstreamCall("GET", "/shop/products/123") as call:
+            call.record_status(200)
+    per_call_us("UpstreamCall (aenter/aexit)", time.perf_counter() - started, count)
+
+
+async def main(count: int):
+    print(f"반복 {count}회")
+    bench_primitives(count)
+    await bench_upstream(count)
+
+    # 두 앱을 번갈아 여러 번 측정하고 가장 빠른 값 비교 (측정 잡음 제거)
+    requests = max(count // 20, 1000)
+    apps = {"plain": endpoint, "instrumented": MetricsMiddleware(endpoint)}
+    best = {name: float("inf") for name in apps}
+    for _ in range(ROUNDS):
+        for name, app in apps.items():
+            best[name] = min(best[name], await drive(app, requests))
+    per_call_us("요청 (미들웨어 없음)", best["plain"], requests)
+    per_call_us("요청 (MetricsMiddleware)", best["instrumented"], requests)
+    per_call_us("→ 요청당 추가 비용", best["instrumented"] - best["plain"], requests)
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    asyncio.run(main(count))
@@ -0,0 +1,100 @@
+"""에이전시 검색: 비트셋 색인 vs 전체 목록 선형 필터링
+
+실행: python -m benchmarks.bench_search
+"""
+import json
+import random
+import time
+
+from app.agency_admin.constants import (
+    CATEGORY_MAP,
+    LOCATION_MAP,
+    MBTI_MAP,
+    SUB_CATEGORY_MAP,
+)
+from app.agency_admin.search_index import AgencySearchIndex
+
+QUERIES = [
+    {"location": ["서울"]},
+    {"location": ["서울"], "mbti": ["ENFJ"]},
+    {"main_category": ["w"], "sub_categories": ["1", "2", "3"]},
+    {"location": ["그 외"], "mbti": ["INTP", "ISTJ"], "main_category": ["d"]},
+]
+
+
+def synthetic_agencies(count: int) -> list:
+    rng = random.Random(count)
+    locations = list(LOCATION_MAP)
+    mbtis = list(MBTI_MAP)
+    categories = list(CATEGORY_MAP.values())
+    sub_categories = list(SUB_CATEGORY_MAP.values())
+    return [
+        {
+            "no": no,
+            "name": f"에이전시 {no}",
+            "content": "에이전시 소개 " * 20,
+            "location": rng.choice(locations),
+            "mbti": rng.choice(mbtis),
+            "main_category": rng.choice(categories),
+            "sub_categories": rng.sample(sub_categories, 2),
+            "status": "sale",
+        }
+        for no in range(count)
+    ]
+
+
+def linear_search(agencies: list, filters: dict, per_page: int = 20) -> dict:
+    codes = {
+        "mbti": set(filters.get("mbti", [])),
+        "location": set(filters.get("location", [])),
+        "main_category": set(filters.get("main_category", [])),
+        "sub_categories": set(filters.get("sub_categories", [])),
+    }
+    matched = [
+        agency
+        for agency in agencies
+        if (not codes["location"] or agency["location"] in codes["location"])
+        and (not codes["mbti"] or agency["mbti"] in codes["mbti"])
+        and (
+            not codes["main_category"]
+            or agency["main_category"] in codes["main_category"]
+        )
+        and (
+            not codes["sub_categories"]
+            or codes["sub_categories"].intersection(agency["sub_categories"])
+        )
+    ]
+    return {"total": len(matched), "items": matched[:per_page]}
+
+
+def timeit(func, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    for count in (10_000, 100_000):
+        agencies = synthetic_agencies(count)
+        started = time.perf_counter()
+        index = AgencySearchIndex(agencies)
+        build = time.perf_counter() - started
+        full_bytes = len(json.dumps(agencies, ensure_ascii=False).encode())
+
+        print(f"\n에이전시 {count:,}개 - 색인 생성 {build * 1000:.1f}ms")
+        print(f"{'query':<70} {'linear':>10} {'bitset':>10} {'page bytes':>12}")
+        for query in QUERIES:
+            assert index.search(query)["total"] == linear_search(agencies, query)["total"]
+            linear = timeit(lambda: linear_search(agencies, query), 5)
+            bitset = timeit(lambda: index.search(query), 50)
+            page_bytes = len(json.dumps(index.search(query), ensure_ascii=False).encode())
+            print(
+                f"{json.dumps(query, ensure_ascii=False):<70} "
+                f"{linear * 1000:>8.2f}ms {bitset * 1000:>8.3f}ms {page_bytes:>12,}"
+            )
+        print(f"전체 목록 응답 크기: {full_bytes:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""에이전시 5천 건 목록: 직렬화 시간과 전송 바이트 비교
+
+기본 경로(jsonable_encoder + json.dumps) vs orjson, 무압축 vs gzip / brotli
+
+실행: python -m benchmarks.bench_serialization [에이전시 수]
+"""
+import gzip
+import json
+import sys
+import time
+
+from fastapi.encoders import jsonable_encoder
+
+from app.agency_admin.brand_codec import decode_brands
+from app.agency_admin.catalog import build_agency
+from app.common import compression
+from app.common.config import settings
+from app.common.responses import dumps
+from benchmarks.fake_imweb import fake_product
+
+
+def synthetic_payload(count: int) -> dict:
+    products = []
+    for no in range(1, count + 1):
+        product = fake_product(no)
+        product["simple_content_plain"] = f"에이전시 {no} 소개 - 웹/앱 개발 전문 " * 8
+        products.append(product)
+    brands = decode_brands(product["brand"] for product in products)
+    agencies = [
+        build_agency(product, brand) for product, brand in zip(products, brands)
+    ]
+    return {"code": 200, "message": "success", "data": agencies}
+
+
+def default_json(payload: dict) -> bytes:
+    # FastAPI 기본 JSONResponse 경로
+    return json.dumps(
+        jsonable_encoder(payload),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def timeit(func, repeat: int):
+    result = func()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return result, (time.perf_counter() - started) / repeat
+
+
+def main(count: int):
+    payload = synthetic_payload(count)
+    print(f"에이전시 {count}건")
+
+    before, before_time = timeit(lambda: default_json(payload), 10)
+    after, after_time = timeit(lambda: dumps(payload), 10)
+    assert json.loads(before) == json.loads(after)
+    print(f"{'jsonable_encoder + json':<26} {before_time * 1000:>8.2f} ms")
+    print(f"{'orjson':<26} {after_time * 1000:>8.2f} ms")
+    print(f"직렬화 개선율: x{before_time / after_time:.1f}")
+    print()
+
+    print(f"{'무압축':<26} {len(after):>10,} bytes")
+    gzipped, gzip_time = timeit(
+        lambda: gzip.compress(after, compresslevel=settings.COMPRESSION_GZIP_LEVEL), 5
+    )
+    print(
+        f"{'gzip (level ' + str(settings.COMPRESSION_GZIP_LEVEL) + ')':<26} "
+        f"{len(gzipped):>10,} bytes  {gzip_time * 1000:>8.2f} ms  "
+        f"({len(gzipped) / len(after):.0%})"
+    )
+    if compression.brotli is not None:
+        quality = settings.COMPRESSION_BROTLI_QUALITY
+        brotlied, brotli_time = timeit(
+            lambda: compression.brotli.compress(after, quality=quality), 5
+        )
+        print(
+            f"{'brotli (quality ' + str(quality) + ')':<26} "
+            f"{len(brotlied):>10,} bytes  {brotli_time * 1000:>8.2f} ms  "
+            f"({len(brotlied) / len(after):.0%})"
+        )
+    else:
+        print("brotli 미설치 (pip install brotli) - gzip만 비교")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
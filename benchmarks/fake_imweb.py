@@ -0,0 +1,234 @@
+import asyncio
+import json
+import random
+
+from aiohttp import web
+
+
+# 카테고리 트리 (최상위 에이전시 카테고리 + 메인 카테고리별 하위 카테고리)
+FAKE_CATEGORIES = [
+    {
+        "code": "s202411108ecdc08e5d466",
+        "name": "에이전시",
+        "subcategories": [
+            {"code": f"s2024111{no:02d}", "name": name}
+            for no, name in enumerate(
+                ["웹개발", "디자인", "앱개발", "영상/사진", "브랜딩", "마케팅"]
+            )
+        ],
+    },
+    {"code": "s202411100000000000001", "name": "공지"},
+]
+
+
+class FakeImweb:
+    """로컬 아임웹 API 대역 서버 (벤치마크용)
+
+    latency ± jitter초 지연 후 응답하고, /auth 외 호출은 error_rate 확률로 503 반환
+    """
+
+    def __init__(
+        self,
+        products: int = 100,
+        latency: float = 0.0,
+        members: int = 100,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.products = products
+        self.members = members
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.calls: dict[str, int] = {}
+        self.errors = 0
+        self.uploads = 0
+        # 회원 코드 → MBTI (home_page) 저장값
+        self.home_pages: dict[str, str] = {}
+        self._rng = random.Random(seed)
+        self._runner = None
+        self.base_url = None
+
+    def _count(self, name: str):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    async def _delay(self):
+        delay = self.latency
+        if self.jitter:
+            delay = max(0.0, delay + self._rng.uniform(-self.jitter, self.jitter))
+        if delay:
+            await asyncio.sleep(delay)
+
+    @web.middleware
+    async def _inject(self, request: web.Request, handler):
+        # 지연 / 오류 주입 (토큰 발급은 오류 없이 지연만)
+        await self._delay()
+        if (
+            self.error_rate
+            and not request.path.endswith("/auth")
+            and self._rng.random() < self.error_rate
+        ):
+            self.errors += 1
+            return web.json_response(
+                {"code": 503, "msg": "injected error"}, status=503
+            )
+        return await handler(request)
+
+    async def auth(self, request: web.Request):
+        self._count("auth")
+        return web.json_response({"code": 200, "access_token": "fake-token"})
+
+    async def products_list(self, request: web.Request):
+        self._count("products")
+        page = int(request.query.get("page", 1))
+        per_page = int(request.query.get("per_page", 100))
+        start = (page - 1) * per_page
+        items = [
+            fake_product(no)
+            for no in range(start + 1, min(start + per_page, self.products) + 1)
+        ]
+        paging = {
+            "data_count": self.products,
+            "current_page": page,
+            "total_page": max(1, -(-self.products // per_page)),
+            "pagesize": per_page,
+        }
+        return web.json_response(
+            {"code": 200, "data": {"list": items, "pagenation": paging}}
+        )
+
+    async def product_detail(self, request: web.Request):
+        self._count("product")
+        no = int(request.match_info["no"])
+        if no > self.products:
+            return web.json_response({"code": 404, "msg": "not found"}, status=404)
+        product = fake_product(no)
+        product["content"] = "<p>에이전시 상세 소개</p>"
+        product["simple_content"] = "에이전시 소개"
+        return web.json_response({"code": 200, "data": product})
+
+    async def product_write(self, request: web.Request):
+        self._count("product_write")
+        body = await request.json()
+        return web.json_response({"code": 200, "data": {"no": body.get("no", 1)}})
+
+    def _member(self, no: int) -> dict:
+        member = fake_member(no)
+        if member["member_code"] in self.home_pages:
+            member["home_page"] = self.home_pages[member["member_code"]]
+        return member
+
+    async def members_list(self, request: web.Request):
+        self._count("members")
+        if request.query.get("search_type") == "email":
+            no = member_no(request.query.get("search_value", ""))
+            items = [self._member(no)] if no and no <= self.members else []
+            return web.json_response({"code": 200, "data": {"list": items}})
+
+        page = int(request.query.get("page", 1))
+        limit = int(request.query.get("limit", 100))
+        start = (page - 1) * limit
+        items = [
+            self._member(no)
+            for no in range(start + 1, min(start + limit, self.members) + 1)
+        ]
+        paging = {
+            "data_count": self.members,
+            "current_page": page,
+            "total_page": max(1, -(-self.members // limit)),
+            "pagesize": limit,
+        }
+        return web.json_response(
+            {"code": 200, "data": {"list": items, "pagenation": paging}}
+        )
+
+    async def member_detail(self, request: web.Request):
+        self._count("member")
+        code = request.match_info["code"]
+        no = member_no(code)
+        if not no or no > self.members:
+            return web.json_response({"code": 404, "msg": "not found"}, status=404)
+        if request.method == "PATCH":
+            body = await request.json()
+            if body.get("home_page"):
+                self.home_pages[code] = body["home_page"]
+        return web.json_response({"code": 200, "data": self._member(no)})
+
+    async def categories(self, request: web.Request):
+        self._count("categories")
+        return web.json_response({"code": 200, "data": FAKE_CATEGORIES})
+
+    async def upload(self, request: web.Request):
+        self._count("file")
+        size = 0
+        reader = await request.multipart()
+        while part := await reader.next():
+            while chunk := await part.read_chunk():
+                size += len(chunk)
+        self.uploads += 1
+        url = f"https://cdn.example.com/upload/{self.uploads}.png"
+        return web.json_response(
+            {"code": 200, "data": {"files": [{"url": url, "size": size}]}}
+        )
+
+    async def start(self) -> str:
+        app = web.Application(middlewares=[self._inject], client_max_size=32 << 20)
+        app.router.add_get("/v2/auth", self.auth)
+        app.router.add_get("/v2/shop/products", self.products_list)
+        app.router.add_post("/v2/shop/products", self.product_write)
+        app.router.add_get("/v2/shop/products/{no}", self.product_detail)
+        app.router.add_patch("/v2/shop/products/{no}", self.product_write)
+        app.router.add_get("/v2/shop/categories", self.categories)
+        app.router.add_get("/v2/member/members", self.members_list)
+        app.router.add_get("/v2/member/member/{code}", self.member_detail)
+        app.router.add_patch("/v2/member/member/{code}", self.member_detail)
+        app.router.add_post("/v2/file", self.upload)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}/v2"
+        return self.base_url
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+
+
+def fake_product(no: int) -> dict:
+    """가짜 상품(에이전시) 데이터"""
+    rng = random.Random(no)
+    brand = [
+        rng.choice("se"),
+        rng.choice("1234567890abcdef"),
+        rng.choice("wdapbmtc"),
+        rng.sample("123456abcdefg", 2),
+    ]
+    return {
+        "no": no,
+        "name": f"에이전시 {no}",
+        "simple_content_plain": "에이전시 소개",
+        "categories": ["s202411108ecdc08e5d466"],
+        "brand": json.dumps(brand),
+        "image_url": {"1": f"S20241019/{no}.png"},
+        "prod_status": "sale",
+    }
+
+
+def fake_member(no: int) -> dict:
+    """가짜 회원 데이터 (member{no}@example.com)"""
+    return {
+        "member_code": f"m{no:08d}",
+        "email": f"member{no}@example.com",
+        "name": f"회원 {no}",
+        "home_page": "INTP" if no % 2 else "",
+        "join_time": "2024-11-01 00:00:00",
+    }
+
+
+def member_no(value: str) -> int:
+    """회원 코드 / 이메일 → 회원 번호 (형식이 다르면 0)"""
+    digits = value.removeprefix("m").removeprefix("member").split("@")[0]
+    return int(digits) if digits.isdigit() else 0
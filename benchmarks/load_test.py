@@ -0,0 +1,319 @@
+"""실제 FastAPI 앱 부하 테스트 (로컬 아임웹 대역 서버 사용, 외부 네트워크 불필요)
+
+동시성 단계별로 라우트마다 요청을 보내 처리량과 p50/p95/p99 지연 시간을 측정하고
+결과를 JSON으로 저장 (--compare로 이전 커밋 결과와 비교)
+
+실행: python -m benchmarks.load_test --concurrency 1,10,50 --requests 500 \\
+          --latency 0.02 --jitter 0.01 --error-rate 0.01
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import aiohttp
+
+from benchmarks.fake_imweb import FakeImweb
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+MBTI_TYPES = ["INTP", "ENFJ", "ISTJ", "ESFP"]
+
+
+def build_scenarios(products: int, members: int) -> dict:
+    """라우트 → 요청 생성 함수 (method, path, kwargs)"""
+
+    def member_email(rng: random.Random) -> str:
+        return f"member{rng.randint(1, members)}@example.com"
+
+    def image(rng: random.Random) -> dict:
+        # 일부는 같은 이미지를 다시 올려 중복 업로드 방지 경로도 포함
+        data = aiohttp.FormData()
+        body = PNG_HEADER + bytes([rng.randint(0, 7)]) * 4096
+        data.add_field("file", body, filename="a.png", content_type="image/png")
+        return {"data": data}
+
+    return {
+        "GET /agency/list": lambda rng: ("GET", "/agency/list", {}),
+        "GET /agency/search": lambda rng: (
+            "GET",
+            "/agency/search",
+            {"params": {"mbti": rng.choice(MBTI_TYPES), "per_page": 20}},
+        ),
+        "GET /agency/{id}": lambda rng: (
+            "GET",
+            f"/agency/{rng.randint(1, products)}",
+            {},
+        ),
+        "GET /agency/categories": lambda rng: ("GET", "/agency/categories", {}),
+        "GET /mbti/result/{email}": lambda rng: (
+            "GET",
+            f"/mbti/result/{member_email(rng)}",
+            {},
+        ),
+        "POST /mbti/result": lambda rng: (
+            "POST",
+            "/mbti/result",
+            {"json": {"email": member_email(rng), "result": rng.choice(MBTI_TYPES)}},
+        ),
+        "POST /agency/image": lambda rng: ("POST", "/agency/image", image(rng)),
+    }
+
+
+def percentile(values: list[float], q: float) -> float:
+    """정렬된 값의 q 백분위 (nearest-rank)"""
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(values)))
+    return values[min(rank, len(values)) - 1]
+
+
+async def run_route(
+    session: aiohttp.ClientSession,
+    base_url: str,
+    make_request,
+    total: int,
+    concurrency: int,
+    seed: int,
+) -> dict:
+    """고정 동시성(closed loop)으로 total건 요청"""
+    rng = random.Random(seed)
+    latencies: list[float] = []
+    statuses: dict[str, int] = {}
+    remaining = total
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            method, path, kwargs = make_request(rng)
+            started = time.perf_counter()
+            try:
+                async with session.request(method, base_url + path, **kwargs) as response:
+                    await response.read()
+                    status = str(response.status)
+            except aiohttp.ClientError as e:
+                status = type(e).__name__
+            latencies.append(time.perf_counter() - started)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    errors = sum(
+        count
+        for status, count in statuses.items()
+        if not status.isdigit() or int(status) >= 500
+    )
+    return {
+        "requests": total,
+        "seconds": round(elapsed, 4),
+        "throughput": round(total / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3),
+        "errors": errors,
+        "statuses": statuses,
+    }
+
+
+async def wait_ready(
+    session: aiohttp.ClientSession, base_url: str, timeout: float
+) -> dict:
+    """시작 준비 작업이 끝날 때까지 대기 (준비 상태 반환)"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            async with session.get(f"{base_url}/health/ready") as response:
+                if response.status == 200:
+                    return await response.json()
+        except aiohttp.ClientError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError("앱이 준비되지 않았습니다")
+
+
+def configure_environment(workdir: str, base_url: str):
+    """앱 설정 (앱 모듈을 가져오기 전에 호출해야 적용됨)"""
+    os.environ.setdefault("IMWEB_API_KEY", "load-test")
+    os.environ.setdefault("IMWEB_SECRET_KEY", "load-test")
+    os.environ["IMWEB_BASE_URL"] = base_url
+    os.environ.setdefault("LOG_LEVEL", "ERROR")
+    for name in (
+        "PRODUCT_MIRROR_PATH",
+        "MEMBER_MIRROR_PATH",
+        "MBTI_WRITE_JOURNAL_PATH",
+        "IMAGE_INDEX_PATH",
+        "SHARED_STATE_PATH",
+    ):
+        os.environ[name] = str(Path(workdir) / f"{name.lower()}.sqlite3")
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def main(args: argparse.Namespace) -> dict:
+    fake = FakeImweb(
+        products=args.products,
+        members=args.members,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    base_url = await fake.start()
+    workdir = tempfile.mkdtemp(prefix="load-test-")
+    configure_environment(workdir, base_url)
+
+    import uvicorn
+
+    from app.imweb.old_imweb import imweb_service
+    from main import app
+
+    imweb_service.base_url = base_url
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning")
+    )
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    app_url = f"http://127.0.0.1:{port}"
+
+    scenarios = build_scenarios(args.products, args.members)
+    routes = args.routes.split(",") if args.routes else list(scenarios)
+    levels = [int(level) for level in args.concurrency.split(",")]
+    results = []
+    connector = aiohttp.TCPConnector(limit=max(levels))
+    try:
+        async with aiohttp.ClientSession(connector=connector) as session:
+            readiness = await wait_ready(session, app_url, args.ready_timeout)
+            print(f"준비 완료: {readiness['time_to_ready_seconds']}s")
+            for concurrency in levels:
+                for route in routes:
+                    result = await run_route(
+                        session,
+                        app_url,
+                        scenarios[route],
+                        args.requests,
+                        concurrency,
+                        args.seed,
+                    )
+                    results.append({"route": route, "concurrency": concurrency, **result})
+                    print(
+                        f"{route:<28} c={concurrency:<4} "
+                        f"{result['throughput']:>9.1f} req/s  "
+                        f"p50 {result['p50_ms']:>8.2f}ms  "
+                        f"p95 {result['p95_ms']:>8.2f}ms  "
+                        f"p99 {result['p99_ms']:>8.2f}ms  "
+                        f"errors {result['errors']}"
+                    )
+    finally:
+        server.should_exit = True
+        await serving
+        await fake.stop()
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time_to_ready_seconds": readiness["time_to_ready_seconds"],
+            "requests_per_route": args.requests,
+            "concurrency": levels,
+            "upstream": {
+                "products": args.products,
+                "members": args.members,
+                "latency": args.latency,
+                "jitter": args.jitter,
+                "error_rate": args.error_rate,
+                "seed": args.seed,
+            },
+        },
+        "upstream_calls": fake.calls,
+        "upstream_errors": fake.errors,
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """이전 결과 대비 처리량 감소 / p95 증가가 threshold를 넘는 항목"""
+    previous = {
+        (result["route"], result["concurrency"]): result
+        for result in baseline["results"]
+    }
+    regressions = []
+    print(f"\n기준: {baseline['meta']['commit']} → 현재: {current['meta']['commit']}")
+    for result in current["results"]:
+        before = previous.get((result["route"], result["concurrency"]))
+        if before is None:
+            continue
+        throughput = result["throughput"] / before["throughput"] - 1
+        p95 = result["p95_ms"] / before["p95_ms"] - 1 if before["p95_ms"] else 0.0
+        line = (
+            f"{result['route']:<28} c={result['concurrency']:<4} "
+            f"처리량 {throughput:+7.1%}  p95 {p95:+7.1%}"
+        )
+        if throughput < -threshold or p95 > threshold:
+            regressions.append(line)
+            line += "  ← 회귀"
+        print(line)
+    return regressions
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", default="1,10,50", help="동시성 단계 (콤마 구분)")
+    parser.add_argument("--requests", type=int, default=300, help="단계/라우트별 요청 수")
+    parser.add_argument("--routes", default="", help="측정할 라우트 (콤마 구분, 기본 전체)")
+    parser.add_argument("--products", type=int, default=500, help="가짜 상품 수")
+    parser.add_argument("--members", type=int, default=1000, help="가짜 회원 수")
+    parser.add_argument("--latency", type=float, default=0.02, help="아임웹 응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연 편차 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="아임웹 503 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ready-timeout", type=float, default=30.0)
+    parser.add_argument("--output", help="결과 JSON 경로 (기본 results/<커밋>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="회귀로 볼 변화율 (기본 10%%)"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    report = asyncio.run(main(args))
+
+    output = Path(args.output or RESULTS_DIR / f"{report['meta']['commit']}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\n결과 저장: {output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        if compare(report, baseline, args.threshold):
+            sys.exit(1)
@@ -1,12 +1,101 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.agency_admin.agency_endpoint import router as agency_router
+from app.agency_admin.catalog import agency_catalog
+from app.agency_admin.category_tree import category_cache
+from app.agency_admin.product_mirror import product_mirror
+from app.common.compression import CompressionMiddleware
+from app.common.config import settings
+from app.common.logging_config import setup_logging, shutdown_logging
+from app.common.metrics import CONTENT_TYPE, MetricsMiddleware, registry
+from app.common.responses import ORJSONResponse
+from app.common.shared_state import shared_state
+from app.common.tracing import TracingMiddleware
+from app.common.warmup import Warmup
+from app.imweb.client import imweb_client
+from app.imweb.image_store import image_store
+from app.imweb.member_mirror import member_mirror
 from app.imweb.old_imweb import imweb_service
 from app.mbti.mbti_result import router as mbti_router
+from app.mbti.write_behind import mbti_write_queue
+from app.member_admin.member_endpoint import router as member_router
+
+
+async def warm_token():
+    if not await imweb_service.get_access_token():
+        raise RuntimeError("토큰 발급 실패")
+
+
+# 시작 준비 작업 (아임웹 호출은 모두 백그라운드에서 동시에, 끝나면 /health/ready가 200)
+warmup = Warmup(
+    {
+        "token": warm_token,
+        "categories": category_cache.refresh,
+        "agency_catalog": agency_catalog.rebuild,
+    }
+)
+
+registry.callback("app_ready", "시작 준비 완료 여부", lambda: int(warmup.ready))
+registry.callback(
+    "app_time_to_ready_seconds",
+    "시작부터 준비 완료까지 걸린 시간",
+    lambda: warmup.time_to_ready,
+)
+
+
+# 앱 수명주기 (시작/종료)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 로깅 설정 (JSON 포맷, 출력은 백그라운드 스레드에서 처리)
+    setup_logging()
+    # 공용 HTTP 클라이언트 생성
+    await imweb_client.start()
+    # 워커 간 공유 상태 열기 (다른 워커 / 재시작 전에 발급한 토큰, 카테고리 재사용)
+    if settings.SHARED_STATE_ENABLED:
+        shared_state.open()
+    # 로컬 저장소 열기 (상품 미러는 이전 카탈로그 버전 복원)
+    if settings.PRODUCT_MIRROR_ENABLED:
+        product_mirror.open()
+    # 토큰 발급 / 카테고리 / 에이전시 목록은 기다리지 않고 백그라운드에서 준비
+    warmup.start()
+    # 토큰 만료 전 자동 갱신, 에이전시 목록 / 카테고리 트리 주기 갱신 시작
+    imweb_service.start_token_refresher()
+    agency_catalog.start()
+    category_cache.start()
+    # 이미지 해시 → URL 색인 열기
+    image_store.open()
+    # 로컬 회원 미러 주기 동기화 시작
+    if settings.MEMBER_MIRROR_ENABLED:
+        member_mirror.start()
+    # MBTI 결과 저장 큐 시작 (저널에 남은 항목 재처리)
+    mbti_write_queue.start()
+    try:
+        yield
+    finally:
+        await warmup.stop()
+        # 남은 저장 요청 처리 후 종료 (토큰/HTTP 클라이언트보다 먼저)
+        await mbti_write_queue.stop()
+        await agency_catalog.stop()
+        await category_cache.stop()
+        product_mirror.close()
+        image_store.close()
+        await member_mirror.stop()
+        await imweb_service.stop_token_refresher()
+        shared_state.close()
+        await imweb_client.close()
+        # 남은 로그 출력 후 로깅 스레드 종료
+        shutdown_logging()
 
-app = FastAPI(title="ILOVESALES API")
+
+app = FastAPI(
+    title="ILOVESALES API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # CORS 설정 수정
 app.add_middleware(
@@ -22,17 +111,26 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# 응답 압축 (brotli / gzip, 작은 응답은 그대로)
+app.add_middleware(CompressionMiddleware)
+
+# 요청 지표 집계 (압축까지 포함한 전체 처리 시간)
+app.add_middleware(MetricsMiddleware)
 
-# 시작 시 이벤트
-@app.on_event("startup")
-async def startup_event():
-    # 초기 액세스 토큰 발급
-    await imweb_service.get_access_token()
+# 요청 구간별 시간 측정 (Server-Timing 헤더, 느린 요청 기록)
+app.add_middleware(TracingMiddleware)
 
 
 # 라우터 등록
 app.include_router(agency_router, prefix="/agency", tags=["agency"])
 app.include_router(mbti_router, prefix="/mbti", tags=["mbti"])
+app.include_router(member_router, prefix="/members", tags=["members"])
+
+
+# Prometheus 지표 엔드포인트
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
 
 
 # 헬스체크 엔드포인트
@@ -41,5 +139,20 @@ async def health_check():
     return {"status": "healthy"}
 
 
+# 프로세스 생존 확인 (준비 상태와 관계없이 200)
+@app.get("/health/live")
+async def health_live():
+    return {"status": "alive"}
+
+
+# 트래픽 수신 가능 여부 (시작 준비 작업이 끝나기 전에는 503)
+@app.get("/health/ready")
+async def health_ready():
+    stats = warmup.stats()
+    if not warmup.ready:
+        return ORJSONResponse({"status": "starting", **stats}, status_code=503)
+    return {"status": "ready", **stats}
+
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,23 @@
+import json
+
+import pytest
+
+
+@pytest.fixture
+def make_products():
+    """아임웹 상품 목록 응답 형태의 에이전시 상품 생성 (no: 1부터 count까지)"""
+
+    def make(count: int) -> list:
+        return [
+            {
+                "no": no,
+                "name": f"에이전시 {no}",
+                "brand": json.dumps(["s", "1", "w", ["1"]]),
+                "content": f"<p>{no}</p>",
+                "image_url": {"1": f"{no}.png"},
+                "prod_status": "sale",
+            }
+            for no in range(1, count + 1)
+        ]
+
+    return make
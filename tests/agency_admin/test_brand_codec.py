@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from app.agency_admin import brand_codec
+from app.agency_admin.brand_codec import (
+    DEFAULT_RECORD,
+    decode_brand,
+    decode_brands,
+    encode_brand,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_brand_cache():
+    brand_codec.clear_cache()
+    yield
+    brand_codec.clear_cache()
+
+
+def test_decode_brand():
+    """brand 문자열 디코딩 및 캐시"""
+    record = decode_brand('["e","a","w",["1","2"]]')
+
+    assert record.location == "그 외"
+    assert record.mbti == "INTJ"
+    assert record.main_category == "w"
+    assert record.sub_categories == ("1", "2")
+    assert decode_brand('["e","a","w",["1","2"]]') is record
+
+
+def test_decode_brand_defaults_and_errors():
+    """형식이 다르면 기본값, 잘못된 JSON이면 ValueError"""
+    assert decode_brand("[]") is DEFAULT_RECORD
+    assert DEFAULT_RECORD.location == "서울"
+    assert DEFAULT_RECORD.mbti == "ENFJ"
+    with pytest.raises(ValueError):
+        decode_brand("[broken")
+
+
+def test_decode_brands_matches_single_decode():
+    """일괄 디코딩 결과가 개별 디코딩과 동일 (잘못된 값은 None)"""
+    brands = [
+        '["s","1","w",["1"]]',
+        '["e","2","d",["a","b"]]',
+        '["s","1","w",["1"]]',
+        '["s"],["e"',
+        None,
+        "[]",
+    ]
+
+    records = decode_brands(brands)
+
+    assert records[0] is records[2]
+    assert records[3] is None
+    assert records[4] is None
+    assert records[5] is DEFAULT_RECORD
+    brand_codec.clear_cache()
+    assert records[1] == decode_brand(brands[1])
+
+
+def test_encode_brand_round_trip():
+    """이름/코드 입력 모두 같은 brand 문자열 생성"""
+    brand = encode_brand("서울", "intp", "웹개발", ["프론트엔드", "2"])
+
+    assert json.loads(brand) == ["s", "b", "w", ["1", "2"]]
+    record = decode_brand(brand)
+    assert (record.location, record.mbti) == ("서울", "INTP")
+    assert encode_brand("s", "b", "w", ["1", "2"]) == brand
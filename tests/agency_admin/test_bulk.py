@@ -0,0 +1,171 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.agency_admin.agency_endpoint import router
+from app.agency_admin.bulk import BulkOperation, run_bulk
+from app.imweb.limiter import Priority, current_priority
+from app.imweb.old_imweb import ImwebResponse
+
+CREATE = {
+    "op": "create",
+    "data": {"name": "새 에이전시", "content": "상세", "simple_content": "요약"},
+}
+
+
+def update(no: int) -> dict:
+    return {"op": "update", "id": str(no), "data": {"name": f"에이전시 {no}"}}
+
+
+def ok_response(*args, **kwargs) -> ImwebResponse:
+    return ImwebResponse(200, {"code": 200, "data": {"no": 1}}, "")
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(router, prefix="/agency")
+    with (
+        patch("app.agency_admin.bulk.agency_catalog.schedule_rebuild") as rebuild,
+        patch("app.agency_admin.bulk.product_mirror.invalidate"),
+    ):
+        client = TestClient(app)
+        client.rebuild = rebuild
+        yield client
+
+
+def test_invalid_items_rejected_before_any_call(client):
+    """검증 실패 항목이 하나라도 있으면 아임웹 호출 없이 422"""
+    operations = [
+        CREATE,
+        {"op": "update", "data": {}},
+        {"op": "create", "data": {"name": "x"}},
+        {"op": "update", "id": "1", "data": {"mbti": "ABCD"}},
+    ]
+    with patch(
+        "app.agency_admin.bulk.imweb_service.request", new_callable=AsyncMock
+    ) as request:
+        response = client.post("/agency/bulk", json={"operations": operations})
+
+    assert response.status_code == 422
+    locations = {tuple(error["loc"][:3]) for error in response.json()["detail"]}
+    assert locations == {
+        ("body", "operations", 1),
+        ("body", "operations", 2),
+        ("body", "operations", 3),
+    }
+    request.assert_not_awaited()
+
+
+def test_partial_failure_report(client):
+    """일부 항목이 실패해도 나머지는 처리하고 항목별 결과 반환"""
+
+    async def respond(method, path, **kwargs):
+        if path.endswith("/2"):
+            return ImwebResponse(404, {"msg": "상품 없음"}, "not found")
+        if path.endswith("/3"):
+            raise asyncio.TimeoutError()
+        return ok_response()
+
+    operations = [CREATE, update(1), update(2), update(3)]
+    with patch(
+        "app.agency_admin.bulk.imweb_service.request", side_effect=respond
+    ):
+        response = client.post("/agency/bulk", json={"operations": operations})
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert (data["total"], data["succeeded"], data["failed"]) == (4, 2, 2)
+    results = data["results"]
+    assert [result["index"] for result in results] == [0, 1, 2, 3]
+    assert [result["status"] for result in results] == ["ok", "ok", "error", "error"]
+    assert results[2]["status_code"] == 404
+    assert results[2]["error"] == "상품 없음"
+    client.rebuild.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded_and_runs_as_bulk():
+    """동시 호출 수 제한, 아임웹 호출은 대량 작업 우선순위로 실행"""
+    running = 0
+    peak = 0
+    lanes = set()
+
+    async def respond(method, path, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        lanes.add(current_priority())
+        await asyncio.sleep(0.01)
+        running -= 1
+        return ok_response()
+
+    operations = [BulkOperation(**update(no)) for no in range(20)]
+    with (
+        patch("app.agency_admin.bulk.imweb_service.request", side_effect=respond),
+        patch("app.agency_admin.bulk.agency_catalog.schedule_rebuild"),
+        patch("app.agency_admin.bulk.product_mirror.invalidate") as invalidate,
+    ):
+        results = [result async for result in run_bulk(operations, concurrency=3)]
+
+    assert len(results) == 20
+    assert peak == 3
+    assert lanes == {Priority.BULK}
+    assert invalidate.call_count == 20
+
+
+def test_ndjson_streams_results_and_summary(client):
+    """format=ndjson이면 항목별 결과 한 줄씩, 마지막 줄은 요약"""
+    operations = [update(no) for no in range(5)]
+    with patch(
+        "app.agency_admin.bulk.imweb_service.request", side_effect=ok_response
+    ):
+        with client.stream(
+            "POST", "/agency/bulk?format=ndjson", json={"operations": operations}
+        ) as response:
+            assert response.headers["content-type"] == "application/x-ndjson"
+            lines = [json.loads(line) for line in response.iter_lines() if line]
+
+    assert sorted(line["index"] for line in lines[:-1]) == [0, 1, 2, 3, 4]
+    assert lines[-1] == {"summary": {"total": 5, "succeeded": 5, "failed": 0}}
+
+
+def test_single_create_reports_upstream_error(client):
+    """단건 생성도 아임웹 오류 상태를 그대로 반환하고 목록 갱신은 예약하지 않음"""
+    with patch(
+        "app.agency_admin.agency_endpoint.imweb_service.request",
+        new_callable=AsyncMock,
+        return_value=ImwebResponse(400, {"code": -1}, '{"code": -1}'),
+    ):
+        response = client.post("/agency/create", json=CREATE["data"])
+
+    assert response.status_code == 400
+    client.rebuild.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "reply, status_code",
+    [
+        (ImwebResponse(200, {"code": 200, "data": {"no": 1}}, ""), 200),
+        (ImwebResponse(200, {"code": -5, "msg": "권한 없음"}, ""), 502),
+        (ImwebResponse(400, {"code": -1}, '{"code": -1}'), 400),
+    ],
+)
+def test_single_and_bulk_update_agree_on_result(client, reply, status_code):
+    """같은 아임웹 응답은 단건 수정과 일괄 처리에서 같은 결과로 판단"""
+    with patch(
+        "app.agency_admin.agency_endpoint.imweb_service.request",
+        new_callable=AsyncMock,
+        return_value=reply,
+    ):
+        single = client.patch("/agency/7", json={"name": "에이전시 7"})
+        bulk = client.post("/agency/bulk", json={"operations": [update(7)]})
+
+    (result,) = bulk.json()["data"]["results"]
+    assert single.status_code == status_code
+    assert result["status_code"] == status_code
+    assert result["status"] == ("ok" if status_code == 200 else "error")
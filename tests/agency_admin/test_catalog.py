@@ -0,0 +1,129 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.agency_admin.catalog import AgencyCatalog
+from app.imweb.resilience import deadline, time_remaining
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_requests_share_one_build(make_products):
+    """스냅샷이 없을 때 동시 요청은 한 번만 빌드"""
+    catalog = AgencyCatalog(refresh_interval=60, stale_after=60)
+    calls = []
+
+    async def fake_get_all_products():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return make_products(3)
+
+    with patch(
+        "app.agency_admin.catalog.imweb_service.get_all_products",
+        side_effect=fake_get_all_products,
+    ):
+        snapshots = await asyncio.gather(*(catalog.get() for _ in range(10)))
+
+    assert len(calls) == 1
+    assert all(s is snapshots[0] for s in snapshots)
+    body = json.loads(snapshots[0].body)
+    assert body["code"] == 200
+    assert [a["no"] for a in body["data"]] == [1, 2, 3]
+    assert body["data"][0]["mbti"] == "ENFJ"
+
+
+@pytest.mark.asyncio
+async def test_stale_snapshot_is_served_while_revalidating(make_products):
+    """오래된 스냅샷은 바로 반환하고 백그라운드에서 갱신"""
+    catalog = AgencyCatalog(refresh_interval=60, stale_after=0)
+    products = make_products(1)
+
+    async def fake_get_all_products():
+        return list(products)
+
+    with patch(
+        "app.agency_admin.catalog.imweb_service.get_all_products",
+        side_effect=fake_get_all_products,
+    ):
+        first = await catalog.get()
+        products.extend(make_products(2)[1:])
+        stale = await catalog.get()
+        assert stale is first
+        await catalog.rebuild()
+
+    assert catalog.snapshot.version == 2
+    assert len(catalog.snapshot.agencies) == 2
+    stats = catalog.stats()
+    assert stats["misses"] == 1
+    assert stats["stale_hits"] == 1
+    assert stats["rebuilds"] == 2
+
+
+@pytest.mark.asyncio
+async def test_rebuild_requested_during_build_runs_again(make_products):
+    """갱신 중 변경 요청이 들어오면 갱신을 한 번 더 수행"""
+    catalog = AgencyCatalog(refresh_interval=60, stale_after=60)
+    calls = []
+
+    async def fake_get_all_products():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return make_products(len(calls))
+
+    with patch(
+        "app.agency_admin.catalog.imweb_service.get_all_products",
+        side_effect=fake_get_all_products,
+    ):
+        catalog.schedule_rebuild()
+        await asyncio.sleep(0)
+        catalog.schedule_rebuild()
+        await catalog.rebuild()
+
+    assert len(calls) == 2
+    assert len(catalog.snapshot.agencies) == 2
+
+
+@pytest.mark.asyncio
+async def test_stop_waits_for_in_flight_rebuild():
+    """종료 시 진행 중인 갱신이 정리된 뒤 반환 (이후 미러를 닫아도 안전)"""
+    catalog = AgencyCatalog(refresh_interval=60, stale_after=60)
+    finished = []
+
+    async def slow_get_all_products():
+        try:
+            await asyncio.sleep(10)
+        finally:
+            finished.append(1)
+
+    with patch(
+        "app.agency_admin.catalog.imweb_service.get_all_products",
+        side_effect=slow_get_all_products,
+    ):
+        catalog.schedule_rebuild()
+        await asyncio.sleep(0)
+        await catalog.stop()
+
+    assert finished == [1]
+    assert catalog._rebuild is None
+
+
+@pytest.mark.asyncio
+async def test_scheduled_rebuild_does_not_inherit_request_deadline(make_products):
+    """요청 안에서 예약한 갱신은 요청의 제한 시간과 무관하게 실행"""
+    catalog = AgencyCatalog(refresh_interval=60, stale_after=60)
+    remaining = []
+
+    async def fake_get_all_products():
+        remaining.append(time_remaining())
+        return make_products(1)
+
+    with patch(
+        "app.agency_admin.catalog.imweb_service.get_all_products",
+        side_effect=fake_get_all_products,
+    ):
+        with deadline(0.01):
+            catalog.schedule_rebuild()
+        await catalog._rebuild
+
+    assert remaining == [None]
@@ -0,0 +1,160 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.agency_admin.agency_endpoint import router
+from app.agency_admin.bulk import build_create_payload, validate_agency_data
+from app.agency_admin.category_tree import CategoryCache, CategoryTree
+from app.common.shared_state import SharedState
+from app.imweb.old_imweb import ImwebResponse
+
+PAYLOAD = {
+    "code": 200,
+    "data": [
+        {
+            "code": "s1",
+            "name": "에이전시",
+            "subcategories": [
+                {"code": "s11", "name": "웹개발"},
+                {
+                    "code": "s12",
+                    "name": "디자인",
+                    "subcategories": [{"code": "s121", "name": "웹개발"}],
+                },
+            ],
+        },
+        {"code": "s2", "name": "공지"},
+    ],
+}
+
+
+def test_tree_indexes_and_navigation():
+    """번호/이름 색인과 상위/하위 탐색 (이름이 겹치면 상위 단계 우선)"""
+    tree = CategoryTree(PAYLOAD, version=1)
+
+    assert len(tree) == 5
+    assert [node.no for node in tree.roots] == ["s1", "s2"]
+    assert tree.resolve("웹개발") == "s11"
+    assert tree.resolve("s121") == "s121"
+    assert tree.resolve("없는 카테고리") is None
+    assert [node.no for node in tree.children("s1")] == ["s11", "s12"]
+    assert tree.parent("s121").no == "s12"
+    assert tree.get("s121").path() == ["에이전시", "디자인", "웹개발"]
+    assert tree.get("s121").depth == 2
+    assert [node.no for node in tree.get("s1").descendants()] == [
+        "s11",
+        "s12",
+        "s121",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_refresh_keeps_version_when_unchanged():
+    """같은 내용이면 버전/ETag 유지, 바뀌면 버전 증가, 동시 갱신은 한 번만 조회"""
+    payloads = [PAYLOAD, PAYLOAD, {"code": 200, "data": [{"code": "s3", "name": "새"}]}]
+
+    async def respond(method, path, **kwargs):
+        await asyncio.sleep(0.01)
+        return ImwebResponse(200, payloads.pop(0), "")
+
+    cache = CategoryCache()
+    with patch(
+        "app.agency_admin.category_tree.imweb_service.request", side_effect=respond
+    ) as request:
+        await asyncio.gather(cache.refresh(), cache.refresh())
+        assert request.await_count == 1
+        first = cache.tree
+
+        assert await cache.refresh() is first
+        changed = await cache.refresh()
+
+    assert first.version == 1
+    assert changed.version == 2
+    assert changed.etag != first.etag
+    assert cache.resolve("새") == "s3"
+
+
+@pytest.mark.asyncio
+async def test_refresh_failure_keeps_unloaded():
+    """조회 실패 시 오류를 올리고 트리는 그대로 (시작 준비 작업이 재시도)"""
+    cache = CategoryCache()
+    with patch(
+        "app.agency_admin.category_tree.imweb_service.request",
+        new_callable=AsyncMock,
+        return_value=ImwebResponse(500, None, "error"),
+    ):
+        with pytest.raises(RuntimeError):
+            await cache.refresh()
+
+    assert cache.is_loaded is False
+    assert cache.refresh_errors == 1
+
+
+def test_categories_endpoint_never_waits_for_upstream():
+    """트리를 아직 불러오지 못했으면 아임웹을 기다리지 않고 503"""
+    app = FastAPI()
+    app.include_router(router, prefix="/agency")
+    client = TestClient(app)
+    cache = CategoryCache()
+
+    with (
+        patch("app.agency_admin.agency_endpoint.category_cache", cache),
+        patch.object(cache, "schedule_refresh") as schedule,
+    ):
+        response = client.get("/agency/categories")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "5"
+    schedule.assert_called_once()
+
+    cache.tree = CategoryTree(PAYLOAD, version=3)
+    with patch("app.agency_admin.agency_endpoint.category_cache", cache):
+        response = client.get("/agency/categories")
+    assert response.status_code == 200
+    assert response.json()["version"] == 3
+    assert response.json()["data"] == PAYLOAD
+
+
+def test_payloads_resolve_category_names():
+    """생성/수정 데이터의 카테고리 이름은 코드로 변환, 모르는 카테고리는 검증 실패"""
+    cache = CategoryCache()
+    cache.tree = CategoryTree(PAYLOAD, version=1)
+    data = {"name": "a", "content": "b", "simple_content": "c"}
+
+    with (
+        patch("app.agency_admin.bulk.category_cache", cache),
+        patch("app.agency_admin.bulk.settings.IMWEB_AGENCY_CATEGORY", "s1"),
+    ):
+        assert build_create_payload(data)["categories"] == ["s1"]
+        named = build_create_payload({**data, "category": ["디자인", "s2"]})
+        assert named["categories"] == ["s12", "s2"]
+        assert validate_agency_data("update", {"category": ["없음"]}) == [
+            "알 수 없는 category: 없음"
+        ]
+
+
+@pytest.mark.asyncio
+async def test_workers_share_tree_version(tmp_path):
+    """워커 여러 개가 갱신해도 아임웹 조회는 1회, 버전/ETag는 모든 워커가 같음"""
+    path = str(tmp_path / "shared.sqlite3")
+    states = [SharedState(path, poll_interval=0.005) for _ in range(3)]
+    for state in states:
+        state.open()
+    workers = [CategoryCache(state=state) for state in states]
+
+    async def respond(method, path, **kwargs):
+        await asyncio.sleep(0.05)
+        return ImwebResponse(200, PAYLOAD, "")
+
+    with patch(
+        "app.agency_admin.category_tree.imweb_service.request", side_effect=respond
+    ) as request:
+        trees = await asyncio.gather(*(worker.refresh() for worker in workers))
+
+    assert request.await_count == 1
+    assert {tree.version for tree in trees} == {1}
+    assert {tree.etag for tree in trees} == {trees[0].etag}
+    for state in states:
+        state.close()
@@ -0,0 +1,127 @@
+import asyncio
+import time
+from email.utils import formatdate
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.agency_admin.agency_endpoint import router
+from app.agency_admin.catalog import AgencyCatalog
+from app.agency_admin.category_tree import CategoryCache, CategoryTree
+from app.agency_admin.product_mirror import ProductMirror
+from app.imweb.old_imweb import ImwebResponse
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(router, prefix="/agency")
+    return TestClient(app)
+
+
+def test_list_etag_and_last_modified(client, make_products):
+    """목록은 스냅샷 ETag / 수정 시각으로 304 응답, 내용이 바뀌면 새 ETag"""
+    catalog = AgencyCatalog(refresh_interval=60, stale_after=60)
+    products = make_products(3)
+
+    with (
+        patch("app.agency_admin.agency_endpoint.agency_catalog", catalog),
+        patch("app.agency_admin.catalog.product_mirror", ProductMirror()),
+        patch(
+            "app.agency_admin.catalog.imweb_service.get_all_products",
+            new_callable=AsyncMock,
+            side_effect=lambda: products,
+        ),
+    ):
+        response = client.get("/agency/list")
+        etag = response.headers["etag"]
+        assert response.status_code == 200
+        assert "s-maxage" in response.headers["cache-control"]
+        assert response.headers["vary"] == "Accept-Encoding"
+
+        cached = client.get("/agency/list", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+        since = formatdate(time.time() + 1, usegmt=True)
+        assert client.get(
+            "/agency/list", headers={"If-Modified-Since": since}
+        ).status_code == 304
+
+        # 내용이 같으면 다시 만들어도 ETag / 수정 시각 유지
+        modified = response.headers["last-modified"]
+        asyncio.run(catalog.rebuild())
+        again = client.get("/agency/list")
+        assert again.headers["etag"] == etag
+        assert again.headers["last-modified"] == modified
+
+        products[0]["name"] = "바뀐 이름"
+        asyncio.run(catalog.rebuild())
+        changed = client.get("/agency/list", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+
+def test_detail_not_modified_skips_transform(client, tmp_path, make_products):
+    """상세 조회는 미러의 내용 해시로 ETag를 만들고, 일치하면 변환 없이 304"""
+    mirror = ProductMirror(path=str(tmp_path / "products.sqlite3"))
+    mirror.open()
+    mirror.apply(make_products(2))
+
+    with patch("app.agency_admin.agency_endpoint.product_mirror", mirror):
+        response = client.get("/agency/2")
+        etag = response.headers["etag"]
+        assert response.status_code == 200
+        assert response.json()["data"]["name"] == "에이전시 2"
+
+        with patch("app.agency_admin.agency_endpoint.build_agency") as build:
+            cached = client.get("/agency/2", headers={"If-None-Match": f"W/{etag}"})
+        assert cached.status_code == 304
+        build.assert_not_called()
+
+    mirror.close()
+
+
+def test_detail_etag_matches_between_mirror_and_imweb(client, tmp_path, make_products):
+    """미러가 없을 때 아임웹 응답으로 만든 ETag도 같은 값"""
+    product = make_products(1)[0]
+    mirror = ProductMirror(path=str(tmp_path / "products.sqlite3"))
+    mirror.open()
+    mirror.apply([product])
+
+    with patch("app.agency_admin.agency_endpoint.product_mirror", mirror):
+        mirrored_etag = client.get("/agency/1").headers["etag"]
+
+    with (
+        patch("app.agency_admin.agency_endpoint.product_mirror", ProductMirror()),
+        patch(
+            "app.agency_admin.agency_endpoint.imweb_service.request",
+            new_callable=AsyncMock,
+            return_value=ImwebResponse(
+                status=200, data={"code": 200, "data": product}, text=""
+            ),
+        ),
+    ):
+        response = client.get("/agency/1", headers={"If-None-Match": mirrored_etag})
+
+    assert response.status_code == 304
+    mirror.close()
+
+
+def test_categories_etag(client):
+    """카테고리 목록은 메모리 트리 본문 ETag로 304 응답"""
+    cache = CategoryCache()
+    cache.tree = CategoryTree({"code": 200, "data": [{"code": "a"}]}, version=1)
+    with patch("app.agency_admin.agency_endpoint.category_cache", cache):
+        response = client.get("/agency/categories")
+        cached = client.get(
+            "/agency/categories",
+            headers={"If-None-Match": f'"other", {response.headers["etag"]}'},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"].startswith("public, max-age=300")
+    assert cached.status_code == 304
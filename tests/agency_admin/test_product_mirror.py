@@ -0,0 +1,139 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.agency_admin.agency_endpoint import router
+from app.agency_admin.catalog import AgencyCatalog
+from app.agency_admin.product_mirror import ProductMirror
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = ProductMirror(path=str(tmp_path / "products.sqlite3"))
+    mirror.open()
+    yield mirror
+    mirror.close()
+
+
+def test_apply_writes_only_changed_rows(mirror, make_products):
+    """해시가 같은 상품은 건너뛰고, 변경이 있을 때만 버전 증가"""
+    products = make_products(100)
+    assert mirror.apply(products) == 100
+    assert mirror.version == 1
+
+    assert mirror.apply(products) == 0
+    assert mirror.version == 1
+
+    products[10]["name"] = "바뀐 이름"
+    del products[50]
+    assert mirror.apply(products) == 1 + 1 + 49  # 수정 1, 삭제 1, 순서 이동 49
+    assert mirror.version == 2
+    assert mirror.get("11")["name"] == "바뀐 이름"
+    assert mirror.get("51") is None
+    assert [p["no"] for p in mirror.products()] == [p["no"] for p in products]
+
+
+def test_version_survives_restart(mirror, tmp_path, make_products):
+    """카탈로그 버전은 재시작 후에도 유지"""
+    mirror.apply(make_products(3))
+    mirror.apply(make_products(2))
+    mirror.close()
+
+    restarted = ProductMirror(path=str(tmp_path / "products.sqlite3"))
+    restarted.open()
+    assert restarted.version == 2
+    assert len(restarted.products()) == 2
+    restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_catalog_reuses_snapshot_when_version_unchanged(mirror, make_products):
+    """카탈로그 버전이 그대로면 스냅샷을 다시 만들지 않음"""
+    catalog = AgencyCatalog(refresh_interval=60, stale_after=60)
+
+    with (
+        patch("app.agency_admin.catalog.product_mirror", mirror),
+        patch(
+            "app.agency_admin.product_mirror.imweb_service.get_all_products",
+            new_callable=AsyncMock,
+            return_value=make_products(3),
+        ),
+    ):
+        first = await catalog.rebuild()
+        second = await catalog.rebuild()
+
+    assert first is second
+    assert first.version == mirror.version == 1
+    assert catalog.rebuilds == 1
+
+
+@pytest.mark.asyncio
+async def test_catalog_serves_mirror_during_outage(mirror, make_products):
+    """아임웹 장애 시 마지막으로 동기화된 미러 내용으로 목록 생성"""
+    mirror.apply(make_products(2))
+    catalog = AgencyCatalog(refresh_interval=60, stale_after=60)
+
+    with (
+        patch("app.agency_admin.catalog.product_mirror", mirror),
+        patch(
+            "app.agency_admin.product_mirror.imweb_service.get_all_products",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("down"),
+        ),
+    ):
+        snapshot = await catalog.rebuild()
+
+    assert [a["no"] for a in snapshot.agencies] == [1, 2]
+
+
+def test_get_agency_reads_from_mirror(mirror, make_products):
+    """상세 조회는 미러에 있으면 아임웹을 호출하지 않음"""
+    mirror.apply(make_products(2))
+    app = FastAPI()
+    app.include_router(router, prefix="/agency")
+
+    with (
+        patch("app.agency_admin.agency_endpoint.product_mirror", mirror),
+        patch(
+            "app.agency_admin.agency_endpoint.imweb_service.request",
+            new_callable=AsyncMock,
+        ) as mock_request,
+    ):
+        response = TestClient(app).get("/agency/2")
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["name"] == "에이전시 2"
+    assert data["content"] == "<p>2</p>"
+    mock_request.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_workers_sharing_mirror_see_same_version(mirror, tmp_path, make_products):
+    """다른 워커가 먼저 반영한 변경도 카탈로그 버전에 반영되어 목록을 다시 만듦"""
+    other = ProductMirror(path=str(tmp_path / "products.sqlite3"))
+    other.open()
+    catalog = AgencyCatalog(refresh_interval=60, stale_after=60)
+    products = make_products(2)
+
+    with (
+        patch("app.agency_admin.catalog.product_mirror", other),
+        patch(
+            "app.agency_admin.product_mirror.imweb_service.get_all_products",
+            new_callable=AsyncMock,
+            side_effect=lambda: list(products),
+        ),
+    ):
+        first = await catalog.rebuild()
+        # 다른 워커가 같은 파일에 변경 반영
+        products.append(make_products(3)[2])
+        mirror.apply(products)
+        second = await catalog.rebuild()
+
+    assert first.version == 1
+    assert other.version == mirror.version == 2
+    assert second.version == 2
+    assert [a["no"] for a in second.agencies] == [1, 2, 3]
+    other.close()
@@ -0,0 +1,59 @@
+from app.agency_admin.search_index import AgencySearchIndex
+
+
+def make_agency(no, location, mbti, main_category, sub_categories, status="sale"):
+    return {
+        "no": no,
+        "location": location,
+        "mbti": mbti,
+        "main_category": main_category,
+        "sub_categories": sub_categories,
+        "status": status,
+    }
+
+
+AGENCIES = [
+    make_agency(1, "서울", "ENFJ", "w", ["1", "2"]),
+    make_agency(2, "그 외", "ENFJ", "w", ["3"]),
+    make_agency(3, "서울", "INTP", "d", ["a"]),
+    make_agency(4, "서울", "ENFJ", "d", ["a", "b"], status="nosale"),
+    make_agency(5, "그 외", "ISTJ", "w", ["1"]),
+]
+
+
+def test_filters_intersect_across_facets_and_union_within():
+    """항목 간 교집합, 항목 내 합집합"""
+    index = AgencySearchIndex(AGENCIES)
+
+    result = index.search({"location": ["서울"], "mbti": ["ENFJ"]})
+    assert [a["no"] for a in result["items"]] == [1, 4]
+
+    result = index.search({"sub_categories": ["1", "a"]})
+    assert [a["no"] for a in result["items"]] == [1, 3, 4, 5]
+
+    # 이름/코드 모두 허용
+    result = index.search({"main_category": ["웹개발"], "location": ["e"]})
+    assert [a["no"] for a in result["items"]] == [2, 5]
+
+
+def test_facet_counts_exclude_own_filter():
+    """항목별 건수는 자기 항목 필터를 제외하고 계산"""
+    index = AgencySearchIndex(AGENCIES)
+
+    result = index.search({"location": ["서울"], "main_category": ["w"]})
+
+    assert result["total"] == 1
+    assert result["facets"]["location"] == {"서울": 1, "그 외": 2}
+    assert result["facets"]["main_category"] == {"w": 1, "d": 2}
+    assert result["facets"]["mbti"] == {"ENFJ": 1}
+
+
+def test_pagination():
+    """페이지네이션"""
+    index = AgencySearchIndex(AGENCIES)
+
+    result = index.search({}, page=2, per_page=2)
+
+    assert result["total"] == 5
+    assert [a["no"] for a in result["items"]] == [3, 4]
+    assert index.search({}, page=4, per_page=2)["items"] == []
@@ -0,0 +1,110 @@
+import gzip
+import zlib
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.common.compression import CompressionMiddleware, negotiate_encoding
+from app.common.http_cache import cached_response
+from app.common.responses import ORJSONResponse
+
+BIG = {"data": [{"no": no, "name": f"에이전시 {no}"} for no in range(200)]}
+
+
+def make_app() -> FastAPI:
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+    compressed = {}
+
+    @app.get("/big")
+    async def big():
+        return BIG
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def lines():
+            for no in range(100):
+                yield f'{{"no":{no}}}\n'.encode()
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    @app.get("/cached")
+    async def cached(request: Request):
+        body = ORJSONResponse(BIG).body
+        return cached_response(
+            request, body, "no-cache", etag='"v1"', compressed=compressed
+        )
+
+    app.state.compressed = compressed
+    return app
+
+
+def test_negotiate_encoding():
+    """q 값과 서버 선호 순서로 압축 방식 선택"""
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("gzip;q=0") is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("*") in ("br", "gzip")
+    assert negotiate_encoding(None) is None
+
+
+def test_compresses_large_json_only():
+    """minimum_size 이상만 압축, Accept-Encoding 없으면 압축하지 않음"""
+    client = TestClient(make_app())
+
+    response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json() == BIG
+
+    raw = client.get("/big", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in raw.headers
+    assert int(raw.headers["content-length"]) > int(
+        response.headers["content-length"]
+    )
+
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+
+def test_streaming_response_is_compressed_per_chunk():
+    """스트리밍 응답은 청크 단위로 압축"""
+    client = TestClient(make_app())
+
+    with client.stream(
+        "GET", "/stream", headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        raw = b"".join(response.iter_raw())
+
+    lines = zlib.decompress(raw, 31).decode().splitlines()
+    assert len(lines) == 100
+
+
+def test_precompressed_body_is_reused():
+    """미리 압축된 본문을 재사용하고, 압축 응답의 ETag는 약한 ETag"""
+    app = make_app()
+    client = TestClient(app)
+
+    first = client.get("/cached", headers={"Accept-Encoding": "gzip"})
+    assert first.headers["etag"] == 'W/"v1"'
+    assert first.json() == BIG
+    stored = app.state.compressed["gzip"]
+    assert gzip.decompress(stored) == ORJSONResponse(BIG).body
+
+    client.get("/cached", headers={"Accept-Encoding": "gzip"})
+    assert app.state.compressed["gzip"] is stored
+
+    cached = client.get(
+        "/cached", headers={"Accept-Encoding": "gzip", "If-None-Match": 'W/"v1"'}
+    )
+    assert cached.status_code == 304
+
+    plain = client.get("/cached", headers={"Accept-Encoding": "identity"})
+    assert plain.headers["etag"] == '"v1"'
@@ -0,0 +1,109 @@
+import io
+import json
+import logging
+
+import pytest
+
+from app.common.logging_config import (
+    DeferredQueueHandler,
+    JsonFormatter,
+    RateLimitFilter,
+    redact,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+def make_record(msg, *args, level=logging.INFO, lineno=1, **extra):
+    record = logging.LogRecord("test", level, __file__, lineno, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture
+def stream():
+    stream = io.StringIO()
+    level = logging.getLogger().level
+    setup_logging(level="DEBUG", json_format=True, burst=3, interval=60, stream=stream)
+    yield stream
+    shutdown_logging()
+    logging.getLogger().setLevel(level)
+
+
+def test_redact_secrets():
+    """토큰/비밀번호는 키 이름과 key=value 패턴 모두 가림"""
+    headers = {"access-token": "abc123", "Accept": "application/json"}
+    assert redact(headers) == {"access-token": "***", "Accept": "application/json"}
+    assert redact({"data": [{"password": "pw"}]}) == {"data": [{"password": "***"}]}
+    assert redact("헤더: {'access-token': 'abc123'}") == "헤더: {'access-token': '***'}"
+    assert redact("GET /x?api_key=abc&page=1") == "GET /x?api_key=***&page=1"
+
+
+def test_json_formatter_formats_and_redacts():
+    """메시지 포맷팅과 extra 필드를 한 줄 JSON으로 출력"""
+    record = make_record(
+        "요청 헤더: %s", {"access-token": "abc"}, route="/agency/list", api_key="k"
+    )
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["level"] == "INFO"
+    assert entry["message"] == "요청 헤더: {'access-token': '***'}"
+    assert entry["route"] == "/agency/list"
+    assert entry["api_key"] == "***"
+
+
+def test_queue_handler_snapshots_arguments():
+    """큐 핸들러는 호출 시점의 인자로 메시지를 고정 (이후 인자가 바뀌어도 그대로)"""
+    payload = {"items": [1], "access-token": "abc"}
+    record = make_record("데이터: %s", payload)
+    prepared = DeferredQueueHandler(None).prepare(record)
+    payload["items"].append(2)
+
+    assert prepared.args is None
+    assert prepared.msg == "데이터: {'items': [1], 'access-token': '***'}"
+
+
+def test_rate_limit_per_call_site():
+    """같은 위치의 INFO 로그는 burst개까지만 통과, WARNING 이상은 항상 통과"""
+    limiter = RateLimitFilter(burst=2, interval=60)
+
+    passed = [limiter.filter(make_record("x")) for _ in range(5)]
+    assert passed == [True, True, False, False, False]
+    assert limiter.filter(make_record("x", lineno=2))
+    assert limiter.filter(make_record("x", level=logging.ERROR))
+
+    limiter.interval = 0
+    record = make_record("x")
+    assert limiter.filter(record)
+    assert record.suppressed == 3
+
+
+def test_setup_logging_writes_json_in_background(stream):
+    """루트 로거 출력은 리스너 스레드를 거쳐 JSON 줄로 기록"""
+    logger = logging.getLogger("app.test")
+    for index in range(5):
+        logger.info("항목 %s", index)
+    logger.error("실패: %s", "access_token=secret-value")
+    shutdown_logging()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["message"] for line in lines] == [
+        "항목 0",
+        "항목 1",
+        "항목 2",
+        "실패: access_token=***",
+    ]
+
+
+def test_setup_logging_keeps_exception_traceback(stream):
+    """logger.exception 트레이스백이 큐를 거쳐도 JSON에 남음"""
+    try:
+        raise ValueError("잘못된 값")
+    except ValueError:
+        logging.getLogger("app.test").exception("처리 실패")
+    shutdown_logging()
+
+    (line,) = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert line["message"] == "처리 실패"
+    assert "Traceback" in line["exc_info"]
+    assert "ValueError: 잘못된 값" in line["exc_info"]
@@ -0,0 +1,77 @@
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.common.metrics import MetricsMiddleware, Registry, http_requests_total
+from app.imweb.client import UpstreamCall, endpoint_label, upstream_errors
+
+
+def test_render_prometheus_text_format():
+    """카운터 / 히스토그램(누적 구간, 합계, 개수) / 콜백 지표 출력"""
+    registry = Registry()
+    counter = registry.counter("jobs_total", "처리 수", ("result",))
+    histogram = registry.histogram("job_seconds", "처리 시간", buckets=(0.1, 1.0))
+    registry.callback("queue_depth", "대기 수", lambda: 3)
+
+    counter.inc("ok")
+    counter.inc("ok")
+    counter.inc('a"b')
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    lines = registry.render().decode().splitlines()
+    assert "# TYPE jobs_total counter" in lines
+    assert 'jobs_total{result="ok"} 2' in lines
+    assert 'jobs_total{result="a\\"b"} 1' in lines
+    assert 'job_seconds_bucket{le="0.1"} 2' in lines
+    assert 'job_seconds_bucket{le="1"} 3' in lines
+    assert 'job_seconds_bucket{le="+Inf"} 4' in lines
+    assert "job_seconds_sum 2.65" in lines
+    assert "job_seconds_count 4" in lines
+    assert "queue_depth 3" in lines
+
+
+def test_middleware_labels_by_route_template():
+    """요청 지표는 실제 경로가 아니라 라우트 경로로 집계"""
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        if item_id == 0:
+            raise HTTPException(status_code=404)
+        return {"item_id": item_id}
+
+    client = TestClient(app)
+    before = http_requests_total.get("GET", "/items/{item_id}", 200)
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/items/0")
+    client.get("/missing/path")
+
+    assert http_requests_total.get("GET", "/items/{item_id}", 200) == before + 2
+    assert http_requests_total.get("GET", "/items/{item_id}", 404) >= 1
+    assert http_requests_total.get("GET", "<unmatched>", 404) >= 1
+
+
+def test_endpoint_label_hides_ids():
+    assert endpoint_label("/shop/products/123") == "/shop/products/{id}"
+    assert endpoint_label("/member/member/m00000774") == "/member/member/{id}"
+    assert endpoint_label("/member/members?page=2") == "/member/members"
+
+
+@pytest.mark.asyncio
+async def test_upstream_call_counts_errors():
+    """오류 상태 코드와 예외를 엔드포인트별로 집계"""
+    before = upstream_errors.get("GET", "/test/{id}", "503")
+    async with UpstreamCall("GET", "/test/1") as call:
+        call.record_status(503)
+    async with UpstreamCall("GET", "/test/2") as call:
+        call.record_status(200)
+    with pytest.raises(TimeoutError):
+        async with UpstreamCall("GET", "/test/3"):
+            raise TimeoutError()
+
+    assert upstream_errors.get("GET", "/test/{id}", "503") == before + 1
+    assert upstream_errors.get("GET", "/test/{id}", "TimeoutError") >= 1
+    assert upstream_errors.get("GET", "/test/{id}", "200") == 0
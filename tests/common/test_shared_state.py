@@ -0,0 +1,120 @@
+import asyncio
+import time
+
+import pytest
+
+from app.common.shared_state import SharedState
+
+
+def open_state(path, **kwargs) -> SharedState:
+    state = SharedState(str(path), poll_interval=0.005, **kwargs)
+    state.open()
+    return state
+
+
+def test_versions_and_persistence(tmp_path):
+    """내용이 바뀔 때만 버전 증가, 재시작 후에도 값/버전 유지"""
+    path = tmp_path / "shared.sqlite3"
+    state = open_state(path)
+    assert state.put("k", {"b": 1, "a": [1, 2]}).version == 1
+    assert state.put("k", {"a": [1, 2], "b": 1}).version == 1
+    assert state.put("k", {"a": [3]}, expires_at=time.time() + 60).version == 2
+    state.close()
+
+    restarted = open_state(path)
+    entry = restarted.get("k")
+    assert entry.value == {"a": [3]}
+    assert entry.version == 2
+    assert 0 < entry.ttl() <= 60
+    assert restarted.get("없음") is None
+    restarted.close()
+
+
+def test_lease_is_exclusive_until_released_or_expired(tmp_path):
+    path = tmp_path / "shared.sqlite3"
+    first, second = open_state(path), open_state(path)
+
+    assert first.acquire("token")
+    assert first.acquire("token")  # 같은 워커는 연장
+    assert not second.acquire("token")
+    first.release("token")
+    assert second.acquire("token", ttl=-1)  # 이미 만료된 lease
+    assert first.acquire("token")
+    first.close()
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_shared_by_loop_and_threads(tmp_path):
+    """루프와 to_thread 스레드가 같은 연결을 동시에 써도 오류 없이 처리"""
+    state = open_state(tmp_path / "shared.sqlite3")
+
+    def churn(no: int):
+        for count in range(50):
+            state.put(f"k{no}", {"count": count})
+            assert state.acquire(f"lease{no}")
+            state.release(f"lease{no}")
+            state.publish("member", f"user{no}", retain=60)
+            state.changes("member", 0)
+
+    await asyncio.gather(
+        *(asyncio.to_thread(churn, no) for no in range(8)),
+        *(asyncio.to_thread(state.stats) for _ in range(20)),
+    )
+
+    assert {state.get(f"k{no}").value["count"] for no in range(8)} == {49}
+    assert state.errors == 0
+    state.close()
+
+
+@pytest.mark.asyncio
+async def test_coordinate_runs_one_fetch_across_workers(tmp_path):
+    """여러 워커가 동시에 갱신해도 조회는 한 번, 나머지는 같은 값을 읽음"""
+    path = tmp_path / "shared.sqlite3"
+    workers = [open_state(path) for _ in range(4)]
+    fetches = []
+
+    async def fetch():
+        fetches.append(1)
+        await asyncio.sleep(0.05)
+        return {"n": len(fetches)}, None
+
+    entries = await asyncio.gather(
+        *(
+            state.coordinate("k", fetch, usable=lambda entry: entry.age < 60)
+            for state in workers
+        )
+    )
+
+    assert len(fetches) == 1
+    assert {entry.value["n"] for entry in entries} == {1}
+    assert sum(state.reused for state in workers) == 3
+    for state in workers:
+        state.close()
+
+
+@pytest.mark.asyncio
+async def test_coordinate_failed_leader_hands_over(tmp_path):
+    """조회한 워커가 실패하면 기다리던 워커가 이어서 조회"""
+    path = tmp_path / "shared.sqlite3"
+    leader, follower = open_state(path), open_state(path)
+
+    async def failing():
+        await asyncio.sleep(0.1)
+        raise RuntimeError("아임웹 응답 없음")
+
+    async def working():
+        return "ok", None
+
+    leading = asyncio.create_task(
+        leader.coordinate("k", failing, usable=lambda entry: True)
+    )
+    await asyncio.sleep(0.02)  # leader가 lease를 얻고 조회 중
+    entry = await follower.coordinate("k", working, usable=lambda entry: True)
+
+    with pytest.raises(RuntimeError):
+        await leading
+    assert entry.value == "ok"
+    assert follower.waits == 1
+    leader.close()
+    follower.close()
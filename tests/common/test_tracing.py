@@ -0,0 +1,63 @@
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.common.responses import ORJSONResponse
+from app.common.tracing import TracingMiddleware, current_trace, record_span, span
+from app.imweb.client import UpstreamCall
+
+
+def make_app(slow_threshold: float = 10.0) -> FastAPI:
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.add_middleware(TracingMiddleware, slow_threshold=slow_threshold)
+
+    @app.get("/agencies/{agency_id}")
+    async def detail(agency_id: int):
+        for no in range(2):
+            async with UpstreamCall("GET", f"/shop/products/{no}") as call:
+                call.record_status(200)
+        with span("transform"):
+            agency = {"no": agency_id}
+        return agency
+
+    return app
+
+
+def test_span_outside_request_is_noop():
+    """요청 밖에서는 측정하지 않음"""
+    with span("transform"):
+        pass
+    record_span("upstream", 0.1)
+    assert current_trace() is None
+
+
+def test_server_timing_header():
+    """구간별 합계(같은 이름은 합산)와 전체 시간을 Server-Timing으로 반환"""
+    response = TestClient(make_app()).get("/agencies/7")
+
+    assert response.json() == {"no": 7}
+    entries = [entry.strip() for entry in response.headers["server-timing"].split(",")]
+    names = [entry.split(";")[0] for entry in entries]
+    assert names == ["upstream", "transform", "serialize", "total"]
+    assert entries[0].endswith('desc="2x"')
+
+
+def test_slow_request_is_logged_with_spans(caplog):
+    """기준 시간을 넘긴 요청은 구간 목록과 함께 WARNING으로 기록"""
+    client = TestClient(make_app(slow_threshold=0.0))
+    with caplog.at_level(logging.WARNING, logger="app.common.tracing"):
+        client.get("/agencies/7")
+
+    record = caplog.records[-1]
+    assert record.route == "/agencies/{agency_id}"
+    assert record.status == 200
+    spans = record.spans
+    assert [item["name"] for item in spans] == [
+        "upstream",
+        "upstream",
+        "transform",
+        "serialize",
+    ]
+    assert spans[0]["detail"] == "GET /shop/products/{id}"
+    assert spans[1]["start_ms"] >= spans[0]["start_ms"]
@@ -0,0 +1,70 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.common.warmup import Warmup
+
+
+@pytest.mark.asyncio
+async def test_steps_run_concurrently_and_retry():
+    """준비 작업은 동시에 실행하고, 실패한 작업은 성공할 때까지 재시도"""
+    failures = [RuntimeError("아임웹 응답 없음")]
+
+    async def slow():
+        await asyncio.sleep(0.05)
+
+    async def flaky():
+        await asyncio.sleep(0.05)
+        if failures:
+            raise failures.pop()
+
+    warmup = Warmup(
+        {"a": slow, "b": slow, "flaky": flaky}, retry_base=0.01, retry_max=0.01
+    )
+    started = time.monotonic()
+    warmup.start()
+    assert warmup.ready is False
+    assert await warmup.wait(timeout=2)
+
+    # 순서대로 실행했다면 0.15초 이상
+    assert time.monotonic() - started < 0.14
+    stats = warmup.stats()
+    assert stats["ready"] is True
+    assert stats["time_to_ready_seconds"] > 0
+    assert stats["steps"]["flaky"]["attempts"] == 2
+    assert stats["steps"]["flaky"]["state"] == "done"
+    assert stats["steps"]["a"]["attempts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_pending_steps():
+    async def forever():
+        await asyncio.sleep(3600)
+
+    warmup = Warmup({"never": forever})
+    warmup.start()
+    assert await warmup.wait(timeout=0.01) is False
+    await warmup.stop()
+    assert warmup.ready is False
+
+
+def test_health_probes():
+    """live는 항상 200, ready는 준비 작업이 끝난 뒤에만 200"""
+    import main
+
+    warmup = Warmup({})
+    client = TestClient(main.app)
+    with patch("main.warmup", warmup):
+        assert client.get("/health/live").status_code == 200
+        starting = client.get("/health/ready")
+        assert starting.status_code == 503
+        assert starting.json()["status"] == "starting"
+
+        warmup.started_at = time.monotonic() - 1.5
+        warmup.ready_at = time.monotonic()
+        ready = client.get("/health/ready")
+    assert ready.status_code == 200
+    assert ready.json()["time_to_ready_seconds"] >= 1.5
@@ -1,6 +1,7 @@
 import pytest
 
 from app.common.config import Settings
+from app.imweb.member_cache import member_cache
 
 
 @pytest.fixture
@@ -15,3 +16,11 @@ def app_config():
 def mock_imweb_api():
     # 아임웹 API 모킹
     pass
+
+
+@pytest.fixture(autouse=True)
+def clear_member_cache():
+    # 테스트 간 회원 캐시 공유 방지
+    member_cache.clear()
+    yield
+    member_cache.clear()
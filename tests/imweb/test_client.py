@@ -0,0 +1,18 @@
+import pytest
+
+from app.imweb.client import ImwebClient
+
+
+@pytest.mark.asyncio
+async def test_session_is_shared_and_closed():
+    """공용 세션 재사용 및 종료 테스트"""
+    client = ImwebClient(limit=10, limit_per_host=5, dns_cache_ttl=60)
+    await client.start()
+
+    session = client.session
+    assert client.session is session
+    assert session.connector.limit == 10
+    assert session.connector.limit_per_host == 5
+
+    await client.close()
+    assert session.closed
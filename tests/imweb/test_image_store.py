@@ -0,0 +1,130 @@
+import io
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.agency_admin.agency_endpoint import router
+from app.imweb.client import ImwebClient
+from app.imweb.image_store import ImageStore
+from app.imweb.old_imweb import ImwebService
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 40
+
+
+class FakeFileUpstream:
+    """아임웹 /file 대역 (받은 파일 크기 기록)"""
+
+    def __init__(self):
+        self.received: list[int] = []
+        app = web.Application()
+        app.router.add_get("/v2/auth", self.auth)
+        app.router.add_post("/v2/file", self.upload)
+        self.server = TestServer(app)
+
+    async def auth(self, request: web.Request) -> web.Response:
+        return web.json_response({"access_token": "token"})
+
+    async def upload(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        data = form["files[]"].file.read()
+        self.received.append(len(data))
+        url = f"https://cdn.example.com/{len(self.received)}.png"
+        return web.json_response({"code": 200, "data": {"files": [{"url": url}]}})
+
+    async def __aenter__(self):
+        await self.server.start_server()
+        self.client = ImwebClient()
+        await self.client.start()
+        self._patch = patch("app.imweb.old_imweb.imweb_client", self.client)
+        self._patch.start()
+        self.service = ImwebService()
+        self.service.base_url = str(self.server.make_url("/v2"))
+        return self
+
+    async def __aexit__(self, *exc):
+        self._patch.stop()
+        await self.client.close()
+        await self.server.close()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ImageStore(path=str(tmp_path / "images.sqlite3"), chunk_size=1024)
+    store.open()
+    yield store
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_identical_image_is_uploaded_once(store, tmp_path):
+    """같은 이미지는 아임웹에 한 번만 전송하고, 색인은 재시작 후에도 유지"""
+    async with FakeFileUpstream() as upstream:
+        with patch("app.imweb.image_store.imweb_service", upstream.service):
+            first = await store.upload(io.BytesIO(PNG), "a.png")
+            second = await store.upload(io.BytesIO(PNG), "b.png")
+
+    assert upstream.received == [len(PNG)]
+    assert first["content_type"] == "image/png"
+    assert first["deduplicated"] is False
+    assert second["deduplicated"] is True
+    assert second["url"] == first["url"]
+
+    store.close()
+    restarted = ImageStore(path=str(tmp_path / "images.sqlite3"))
+    restarted.open()
+    assert restarted.get(first["sha256"]) == first["url"]
+    restarted.close()
+
+
+def test_scan_rejects_type_and_size(store):
+    """이미지가 아니면 415, 크기 제한을 넘으면 읽는 도중 413"""
+    with pytest.raises(HTTPException) as error:
+        store.scan(io.BytesIO(b"<html></html>"))
+    assert error.value.status_code == 415
+
+    store.max_bytes = 2048
+    with pytest.raises(HTTPException) as error:
+        store.scan(io.BytesIO(PNG))
+    assert error.value.status_code == 413
+    assert store.rejected == 2
+
+
+def test_upload_endpoint_dedup_and_limits(tmp_path):
+    """multipart 업로드: 중복 이미지는 업로드 없이 URL 반환, 크기/형식 제한"""
+    store = ImageStore(path=str(tmp_path / "images.sqlite3"), max_bytes=len(PNG))
+    store.open()
+    app = FastAPI()
+    app.include_router(router, prefix="/agency")
+    client = TestClient(app)
+
+    with (
+        patch("app.agency_admin.agency_endpoint.image_store", store),
+        patch(
+            "app.imweb.image_store.imweb_service.upload_image",
+            new_callable=AsyncMock,
+            return_value="https://cdn.example.com/a.png",
+        ) as upload,
+    ):
+        files = {"file": ("a.png", PNG, "image/png")}
+        first = client.post("/agency/image", files=files)
+        second = client.post("/agency/image", files=files)
+        too_big = client.post(
+            "/agency/image", files={"file": ("b.png", PNG + b"x" * 100, "image/png")}
+        )
+        not_image = client.post(
+            "/agency/image", files={"file": ("c.txt", b"hello", "text/plain")}
+        )
+        missing = client.post("/agency/image", data={"name": "x"}, files={})
+
+    assert first.status_code == 200
+    assert first.json()["data"]["url"] == "https://cdn.example.com/a.png"
+    assert second.json()["data"]["deduplicated"] is True
+    upload.assert_awaited_once()
+    assert too_big.status_code == 413
+    assert not_image.status_code == 415
+    assert missing.status_code == 415
+    store.close()
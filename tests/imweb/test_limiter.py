@@ -0,0 +1,122 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from app.common.metrics import registry
+from app.imweb.limiter import AdaptiveLimiter, Priority, limiter_wait, priority
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_by_priority():
+    """대기 중인 호출은 MBTI → 관리자 → 대량 작업 순서로 처리"""
+    limiter = AdaptiveLimiter(initial_limit=1, min_limit=1, max_limit=1)
+    order = []
+    await limiter.acquire(Priority.ADMIN)
+
+    async def call(name: str, lane: Priority):
+        with priority(lane):
+            await limiter.acquire()
+        order.append(name)
+        limiter.release(0.01, False)
+
+    tasks = [
+        asyncio.create_task(call("bulk", Priority.BULK)),
+        asyncio.create_task(call("admin", Priority.ADMIN)),
+        asyncio.create_task(call("mbti", Priority.MBTI)),
+    ]
+    await asyncio.sleep(0)
+    assert limiter.queue_depth() == 3
+
+    limiter.release(0.01, False)
+    await asyncio.gather(*tasks)
+
+    assert order == ["mbti", "admin", "bulk"]
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_aimd_limit_adjustment():
+    """정상 응답은 조금씩 증가, 과부하 응답은 절반으로 감소"""
+    limiter = AdaptiveLimiter(initial_limit=4, min_limit=1, max_limit=10)
+    for _ in range(40):
+        await asyncio.gather(*(limiter.acquire() for _ in range(limiter.limit)))
+        for _ in range(limiter.limit):
+            limiter.release(0.01, False)
+    assert limiter.limit > 4
+
+    before = limiter.limit
+    await limiter.acquire()
+    limiter.release(0.01, True)
+    assert limiter.limit == max(1, int(before * 0.5))
+
+
+@pytest.mark.asyncio
+async def test_latency_spike_reduces_limit():
+    """응답 시간이 기준보다 크게 늘면 한도 감소"""
+    limiter = AdaptiveLimiter(initial_limit=10, min_limit=1, max_limit=10)
+    await limiter.acquire()
+    limiter.release(0.01, False)
+    await limiter.acquire()
+    limiter.release(1.0, False)
+    assert limiter.limit == 9
+
+
+@pytest.mark.asyncio
+async def test_slot_records_overload_on_network_error():
+    """네트워크 오류는 과부하로 집계"""
+    limiter = AdaptiveLimiter(initial_limit=8, min_limit=1, max_limit=8)
+    with pytest.raises(aiohttp.ClientConnectionError):
+        async with limiter.slot():
+            raise aiohttp.ClientConnectionError()
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_slot():
+    """대기 중 취소된 호출은 대기열에서 빠지고 슬롯을 차지하지 않음"""
+    limiter = AdaptiveLimiter(initial_limit=1, min_limit=1, max_limit=1)
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire(Priority.BULK))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.queue_depth() == 0
+
+    limiter.release(0.01, None)
+    assert limiter.in_flight == 0
+    stats = limiter.stats()
+    assert stats["limit"] == 1
+    assert set(stats["lanes"]) == {"mbti", "admin", "bulk"}
+
+
+@pytest.mark.asyncio
+async def test_latency_baseline_is_per_endpoint():
+    """빠른 토큰 발급 뒤의 느린 파일 업로드는 지연으로 판단하지 않음"""
+    limiter = AdaptiveLimiter(initial_limit=10, min_limit=1, max_limit=10)
+    for _ in range(3):
+        await limiter.acquire()
+        limiter.release(0.01, False, "GET /auth")
+        await limiter.acquire()
+        limiter.release(1.0, False, "POST /file")
+    assert limiter.limit == 10
+
+    await limiter.acquire()
+    limiter.release(5.0, False, "POST /file")
+    assert limiter.limit == 9
+    assert set(limiter.stats()["baseline_latency"]) == {"GET /auth", "POST /file"}
+
+
+@pytest.mark.asyncio
+async def test_wait_time_is_exported():
+    """슬롯 대기 시간은 우선순위별 히스토그램으로 노출"""
+    limiter = AdaptiveLimiter(initial_limit=1, min_limit=1, max_limit=1)
+    before = limiter_wait.count("bulk")
+    await limiter.acquire(Priority.BULK)
+    limiter.release(0.01, False)
+
+    assert limiter_wait.count("bulk") == before + 1
+    assert b"imweb_limiter_wait_seconds_bucket" in registry.render()
@@ -0,0 +1,105 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.common.shared_state import SharedState
+from app.imweb.imweb_member_handler import ImwebMemberHandler
+from app.imweb.member_cache import MemberCache, member_cache
+from app.imweb.old_imweb import ImwebResponse
+
+
+def test_lru_and_ttl():
+    """LRU 제거 및 TTL 만료"""
+    cache = MemberCache(max_size=2, ttl=60, negative_ttl=0)
+    cache.put("a@example.com", {"member_code": "a"})
+    cache.put("b@example.com", {"member_code": "b"})
+    cache.get("A@Example.com ")  # 정규화된 키로 조회 → a가 최근 사용
+    cache.put("c@example.com", {"member_code": "c"})
+
+    assert cache.get("b@example.com") is None
+    assert cache.get("a@example.com").member_code == "a"
+
+    # 유효시간 0인 '회원 없음' 캐시는 바로 만료
+    cache.put("none@example.com", None)
+    assert cache.get("none@example.com") is None
+
+
+def test_save_in_other_worker_invalidates_cache(tmp_path):
+    """다른 워커에서 저장/삭제한 회원은 이 워커의 캐시에서도 제거"""
+    workers = []
+    for _ in range(2):
+        state = SharedState(str(tmp_path / "shared.sqlite3"))
+        state.open()
+        workers.append(MemberCache(ttl=60, state=state))
+    reader, writer = workers
+    for cache in workers:
+        cache.put("a@example.com", {"member_code": "a", "home_page": "ENFJ"})
+        cache.put("b@example.com", {"member_code": "b", "home_page": "ISTP"})
+        assert cache.get("a@example.com").home_page == "ENFJ"
+
+    writer.update_home_page("A@Example.com", "INTP")
+    writer.invalidate("b@example.com")
+
+    assert writer.get("a@example.com").home_page == "INTP"  # 자기 캐시는 그대로 반영
+    assert reader.get("a@example.com") is None  # 다시 조회하도록
+    assert reader.get("b@example.com") is None
+    assert reader.stats()["invalidated"] == 2
+
+    reader.put("a@example.com", {"member_code": "a", "home_page": "INTP"})
+    assert reader.get("a@example.com").home_page == "INTP"
+    for cache in workers:
+        cache.state.close()
+
+
+@pytest.mark.asyncio
+async def test_repeated_read_and_save_use_cache():
+    """반복 조회는 0회, 캐시된 회원 저장은 1회 호출"""
+    member = {"member_code": "m1", "home_page": "ENFJ"}
+    ok = ImwebResponse(status=200, data={"code": 200}, text="")
+
+    with (
+        patch(
+            "app.imweb.old_imweb.imweb_service.get_member_by_email",
+            new_callable=AsyncMock,
+            return_value=member,
+        ) as mock_search,
+        patch(
+            "app.imweb.old_imweb.imweb_service.request",
+            new_callable=AsyncMock,
+            return_value=ok,
+        ) as mock_request,
+    ):
+        handler = ImwebMemberHandler()
+        assert await handler.get_mbti_result("user@example.com") == "ENFJ"
+        assert await handler.get_mbti_result("USER@example.com") == "ENFJ"
+        assert mock_search.await_count == 1
+
+        assert await handler.save_mbti_result("user@example.com", "INTP") is True
+        assert mock_search.await_count == 1
+        assert mock_request.await_count == 1
+
+        # write-through로 저장 결과가 캐시에 반영
+        assert await handler.get_mbti_result("user@example.com") == "INTP"
+        assert mock_search.await_count == 1
+
+    stats = member_cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 3
+
+
+@pytest.mark.asyncio
+async def test_member_not_found_is_negatively_cached_for_reads():
+    """'회원 없음'은 조회 시 캐시, 저장 시에는 다시 검색"""
+    with patch(
+        "app.imweb.old_imweb.imweb_service.get_member_by_email",
+        new_callable=AsyncMock,
+        return_value=None,
+    ) as mock_search:
+        handler = ImwebMemberHandler()
+        assert await handler.get_mbti_result("new@example.com") is None
+        assert await handler.get_mbti_result("new@example.com") is None
+        assert mock_search.await_count == 1
+
+        with pytest.raises(Exception):
+            await handler.save_mbti_result("new@example.com", "ENFJ")
+        assert mock_search.await_count == 2
@@ -0,0 +1,148 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.common.shared_state import SharedState
+from app.imweb.imweb_member_handler import ImwebMemberHandler
+from app.imweb.member_mirror import MemberMirror
+from app.imweb.old_imweb import ImwebResponse
+
+
+def members(total: int, home_page: str = "ENFJ") -> list[dict]:
+    return [
+        {"member_code": f"m{no}", "email": f"User{no}@Example.com", "home_page": home_page}
+        for no in range(1, total + 1)
+    ]
+
+
+def fake_iter(source: list[dict], pages_read: list):
+    async def iter_members():
+        for index, member in enumerate(source):
+            if index % 100 == 0:
+                pages_read.append(index // 100 + 1)
+            yield member
+
+    return iter_members
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = MemberMirror(path=str(tmp_path / "members.sqlite3"))
+    mirror.open()
+    yield mirror
+    mirror.close()
+
+
+@pytest.mark.asyncio
+async def test_full_then_incremental_sync(mirror):
+    """전체 동기화 후 증분 동기화는 변경 없는 첫 페이지에서 중단"""
+    source = members(350)
+    pages_read = []
+    with patch(
+        "app.imweb.old_imweb.imweb_service.iter_members",
+        side_effect=fake_iter(source, pages_read),
+    ):
+        assert await mirror.sync(full=True) == 350
+        assert mirror.is_warm()
+        assert mirror.get("user7@example.com")["member_code"] == "m7"
+
+        pages_read.clear()
+        source[0]["home_page"] = "INTP"
+        assert await mirror.sync() == 1
+        assert pages_read == [1, 2]  # 1페이지 변경 → 2페이지 변경 없음 → 중단
+        assert mirror.get("USER1@example.com")["home_page"] == "INTP"
+
+
+@pytest.mark.asyncio
+async def test_full_sync_removes_deleted_members(mirror):
+    """전체 동기화에서 사라진 회원은 미러에서도 삭제"""
+    source = members(5)
+    with patch(
+        "app.imweb.old_imweb.imweb_service.iter_members",
+        side_effect=fake_iter(source, []),
+    ):
+        await mirror.sync(full=True)
+        del source[2]
+        await mirror.sync(full=True)
+
+    assert mirror.get("user3@example.com") is None
+    assert mirror.stats()["members"] == 4
+
+
+@pytest.mark.asyncio
+async def test_workers_sharing_mirror_sync_once(tmp_path):
+    """같은 미러 파일을 쓰는 워커 중 한 워커만 동기화, 나머지는 동기화 상태만 읽음"""
+    workers = []
+    for _ in range(3):
+        state = SharedState(str(tmp_path / "shared.sqlite3"), poll_interval=0.005)
+        state.open()
+        worker = MemberMirror(path=str(tmp_path / "members.sqlite3"), state=state)
+        worker.open()
+        workers.append(worker)
+    pages_read = []
+
+    with patch(
+        "app.imweb.old_imweb.imweb_service.iter_members",
+        side_effect=fake_iter(members(150), pages_read),
+    ):
+        await asyncio.gather(*(worker.sync_once() for worker in workers))
+
+    assert pages_read == [1, 2]  # 전체 동기화 한 번
+    assert sum(worker.state.fetched for worker in workers) == 1
+    for worker in workers:
+        assert worker.is_warm()
+        assert worker.stats()["members"] == 150
+        worker.close()
+        worker.state.close()
+
+
+@pytest.mark.asyncio
+async def test_handler_reads_from_warm_mirror(mirror):
+    """미러가 최신이면 아임웹 호출 없이 조회, 없으면 아임웹 조회 후 미러에 저장"""
+    mirror.upsert_members(members(1))
+    mirror._state.update(last_full_sync=1, last_sync=9e12)
+    new_member = {"member_code": "m9", "email": "new@example.com", "home_page": "ISTP"}
+
+    with (
+        patch("app.imweb.imweb_member_handler.member_mirror", mirror),
+        patch(
+            "app.imweb.old_imweb.imweb_service.get_member_by_email",
+            new_callable=AsyncMock,
+            return_value=new_member,
+        ) as mock_search,
+    ):
+        handler = ImwebMemberHandler()
+        assert await handler.get_mbti_result("user1@example.com") == "ENFJ"
+        mock_search.assert_not_called()
+
+        assert await handler.get_mbti_result("new@example.com") == "ISTP"
+        mock_search.assert_awaited_once()
+        assert mirror.get("new@example.com")["member_code"] == "m9"
+
+
+@pytest.mark.asyncio
+async def test_handler_uses_mirror_during_outage_and_writes_through(mirror):
+    """아임웹 장애 시 오래된 미러 데이터 사용, 저장 성공 시 미러에 바로 반영"""
+    mirror.upsert_members(members(1))  # 전체 동기화 전 (warm 아님)
+    ok = ImwebResponse(status=200, data={"code": 200}, text="")
+
+    with (
+        patch("app.imweb.imweb_member_handler.member_mirror", mirror),
+        patch(
+            "app.imweb.old_imweb.imweb_service.get_member_by_email",
+            new_callable=AsyncMock,
+            side_effect=HTTPException(status_code=503),
+        ),
+        patch(
+            "app.imweb.old_imweb.imweb_service.request",
+            new_callable=AsyncMock,
+            return_value=ok,
+        ),
+    ):
+        handler = ImwebMemberHandler()
+        assert await handler.get_mbti_result("user1@example.com") == "ENFJ"
+        assert await handler.save_mbti_result("user1@example.com", "ESFP") is True
+
+    assert mirror.get("user1@example.com")["home_page"] == "ESFP"
@@ -0,0 +1,110 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+from fastapi import HTTPException
+
+from app.imweb.old_imweb import ImwebResponse, ImwebService
+
+
+def page_response(page: int, per_page: int, total: int, paging: bool = True):
+    start = (page - 1) * per_page
+    items = [{"no": no} for no in range(start + 1, min(start + per_page, total) + 1)]
+    data = {"list": items}
+    if paging:
+        data["pagenation"] = {"data_count": total, "total_page": -(-total // per_page)}
+    return ImwebResponse(status=200, data={"code": 200, "data": data}, text="")
+
+
+@pytest.mark.asyncio
+async def test_get_all_products_fetches_every_page_in_order():
+    """모든 페이지를 순서대로 병합하는지 테스트"""
+    service = ImwebService()
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_request(method, path, params=None, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # 뒤 페이지가 먼저 끝나도 순서가 유지되어야 함
+        await asyncio.sleep(0.001 * (20 - params["page"]))
+        in_flight -= 1
+        return page_response(params["page"], params["per_page"], 1950)
+
+    with patch.object(service, "request", side_effect=fake_request):
+        products = await service.get_all_products(per_page=100)
+
+    assert [p["no"] for p in products] == list(range(1, 1951))
+    assert max_in_flight <= 5
+
+
+@pytest.mark.asyncio
+async def test_failed_page_is_retried_individually():
+    """실패한 페이지만 재시도하는지 테스트"""
+    service = ImwebService()
+    calls = []
+
+    async def fake_send(method, path, access_token, params=None, **kwargs):
+        calls.append(params["page"])
+        if params["page"] == 3 and calls.count(3) == 1:
+            raise aiohttp.ClientConnectionError("connection reset")
+        return page_response(params["page"], params["per_page"], 450)
+
+    with (
+        patch.object(service, "get_access_token", new=AsyncMock(return_value="t")),
+        patch.object(service, "_send", side_effect=fake_send),
+        patch("app.imweb.resilience.asyncio.sleep", new=AsyncMock()),
+    ):
+        products = await service.get_all_products(per_page=100)
+
+    assert len(products) == 450
+    assert sorted(calls) == [1, 2, 3, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_failed_page_cancels_other_pages():
+    """한 페이지가 최종 실패하면 조회 중인 나머지 페이지 요청은 취소"""
+    service = ImwebService()
+    started, cancelled = [], []
+
+    async def fake_get_product_page(page, per_page):
+        started.append(page)
+        if page == 1:
+            return page_response(1, per_page, 1000).data
+        if page == 3:
+            await asyncio.sleep(0.01)
+            raise HTTPException(status_code=502, detail="상품 목록 3페이지 조회 실패")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(page)
+            raise
+
+    with patch.object(service, "get_product_page", side_effect=fake_get_product_page):
+        with pytest.raises(HTTPException):
+            await service.get_all_products(per_page=100)
+
+    # 시작된 페이지는 모두 취소되고, 세마포어를 기다리던 페이지는 시작하지 않음
+    assert sorted(cancelled) == sorted(page for page in started if page not in (1, 3))
+    assert len(started) < 10
+    assert not [
+        task
+        for task in asyncio.all_tasks()
+        if task is not asyncio.current_task() and not task.done()
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_all_products_without_paging_info():
+    """페이지 정보가 없으면 마지막 페이지까지 조회"""
+    service = ImwebService()
+
+    async def fake_request(method, path, params=None, **kwargs):
+        return page_response(params["page"], params["per_page"], 730, paging=False)
+
+    with patch.object(service, "request", side_effect=fake_request):
+        products = await service.get_all_products(per_page=100)
+
+    assert [p["no"] for p in products] == list(range(1, 731))
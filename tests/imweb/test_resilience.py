@@ -0,0 +1,172 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.common.config import settings
+from app.imweb.client import ImwebClient
+from app.imweb.old_imweb import ImwebService
+from app.imweb.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    DeadlineExceeded,
+    RetryPolicy,
+    deadline,
+    retry_call,
+)
+
+
+class FakeUpstream:
+    """경로별로 정해진 순서대로 장애를 주입하는 가짜 아임웹 서버"""
+
+    def __init__(self):
+        self.script: dict[str, list] = {}
+        self.calls: dict[str, int] = {}
+        app = web.Application()
+        app.router.add_route("*", "/v2/{path:.*}", self.handle)
+        self.server = TestServer(app)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        path = "/" + request.match_info["path"]
+        self.calls[path] = self.calls.get(path, 0) + 1
+        if path == "/auth":
+            return web.json_response({"access_token": "token"})
+
+        steps = self.script.get(path) or ["ok"]
+        step = steps.pop(0) if len(steps) > 1 else steps[0]
+        if step == "timeout":
+            await asyncio.sleep(10)
+        if isinstance(step, int):
+            return web.json_response({"code": step}, status=step)
+        return web.json_response({"code": 200, "data": {"path": path}})
+
+    async def __aenter__(self):
+        await self.server.start_server()
+        self.client = ImwebClient()
+        await self.client.start()
+        self._patch = patch("app.imweb.old_imweb.imweb_client", self.client)
+        self._patch.start()
+        service = ImwebService()
+        service.base_url = str(self.server.make_url("/v2"))
+        service.retry_policy = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.01)
+        service.breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=60)
+        self.service = service
+        return self
+
+    async def __aexit__(self, *exc):
+        self._patch.stop()
+        await self.client.close()
+        await self.server.close()
+
+
+@pytest.mark.asyncio
+async def test_retries_5xx_then_succeeds():
+    """5xx 응답은 재시도 후 성공"""
+    async with FakeUpstream() as upstream:
+        upstream.script["/shop/categories"] = [503, 500, "ok"]
+        response = await upstream.service.request("GET", "/shop/categories")
+
+    assert response.status == 200
+    assert upstream.calls["/shop/categories"] == 3
+
+
+@pytest.mark.asyncio
+async def test_404_is_not_retried():
+    """404는 재시도하지 않고 바로 반환, 서킷 실패로도 집계하지 않음"""
+    async with FakeUpstream() as upstream:
+        upstream.script["/shop/products/1"] = [404]
+        response = await upstream.service.request("GET", "/shop/products/1")
+
+        assert response.status == 404
+        assert upstream.calls["/shop/products/1"] == 1
+        assert upstream.service.breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_post_is_not_retried_on_5xx():
+    """POST는 중복 생성 위험이 있으므로 5xx여도 재시도하지 않음"""
+    async with FakeUpstream() as upstream:
+        upstream.script["/shop/products"] = [500, "ok"]
+        response = await upstream.service.request("POST", "/shop/products", json={})
+
+    assert response.status == 500
+    assert upstream.calls["/shop/products"] == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_respects_deadline(monkeypatch):
+    """응답이 없으면 요청 전체 제한 시간 안에 504로 실패"""
+    monkeypatch.setattr(settings, "IMWEB_REQUEST_DEADLINE", 0.3)
+    async with FakeUpstream() as upstream:
+        upstream.script["/member/members"] = ["timeout"]
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded) as exc_info:
+            await upstream.service.request("GET", "/member/members")
+
+    assert exc_info.value.status_code == 504
+    assert time.monotonic() - started < 1.0
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_and_fails_fast():
+    """연속 장애 후에는 아임웹을 호출하지 않고 바로 503"""
+    async with FakeUpstream() as upstream:
+        upstream.script["/shop/categories"] = [502]
+        response = await upstream.service.request("GET", "/shop/categories")
+        assert response.status == 502
+        assert upstream.service.breaker.state == CircuitBreaker.OPEN
+
+        calls = upstream.calls["/shop/categories"]
+        with pytest.raises(CircuitOpenError) as exc_info:
+            await upstream.service.request("GET", "/shop/categories")
+
+        assert exc_info.value.status_code == 503
+        assert "Retry-After" in exc_info.value.headers
+        assert upstream.calls["/shop/categories"] == calls
+
+
+@pytest.mark.asyncio
+async def test_half_open_probe_closes_circuit():
+    """제한 시간이 지나면 시험 호출 1회로 복구 여부 확인"""
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.01)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    await asyncio.sleep(0.02)
+
+    async def probe():
+        # 시험 호출 중 다른 호출은 거부
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        return "ok"
+
+    result = await retry_call(probe, RetryPolicy(max_attempts=1), breaker=breaker)
+    assert result == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_nested_deadline_uses_earlier_expiry():
+    """중첩된 제한 시간은 더 이른 쪽 적용"""
+    calls = 0
+
+    async def slow():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(1)
+
+    with deadline(0.05):
+        with deadline(10):
+            with pytest.raises(DeadlineExceeded):
+                await retry_call(slow, RetryPolicy(max_attempts=5, base_delay=0.001))
+    assert calls == 1
+
+
+def test_backoff_uses_full_jitter():
+    """백오프는 0 ~ min(max_delay, base * 2^n) 사이"""
+    policy = RetryPolicy(max_attempts=10, base_delay=0.1, max_delay=1.0)
+    delays = [policy.backoff(attempt) for attempt in range(1, 10) for _ in range(20)]
+    assert all(0 <= delay <= 1.0 for delay in delays)
+    assert max(policy.backoff(1) for _ in range(50)) <= 0.1
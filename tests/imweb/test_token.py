@@ -0,0 +1,174 @@
+import asyncio
+import io
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+
+from app.common.shared_state import SharedState
+from app.imweb.old_imweb import ImwebResponse, ImwebService
+
+# asyncio.sleep 패치와 무관하게 사용할 원본 sleep
+_sleep = asyncio.sleep
+
+
+def make_service(auth_calls: list) -> ImwebService:
+    service = ImwebService()
+
+    async def fake_fetch():
+        auth_calls.append(1)
+        await _sleep(0.01)
+        service.access_token = f"token-{len(auth_calls)}"
+        service.token_timestamp = time.time()
+        return service.access_token
+
+    service._fetch_access_token = fake_fetch
+    return service
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_auth_call():
+    """동시 호출 N개가 /auth 1회만 호출하는지 테스트"""
+    auth_calls = []
+    service = make_service(auth_calls)
+
+    tokens = await asyncio.gather(*(service.get_access_token() for _ in range(50)))
+
+    assert len(auth_calls) == 1
+    assert set(tokens) == {"token-1"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_token_errors_trigger_one_reauth():
+    """같은 토큰으로 실패한 요청들은 재발급 1회 후 재요청"""
+    auth_calls = []
+    service = make_service(auth_calls)
+    await service.get_access_token()
+
+    async def fake_send(method, path, access_token, **kwargs):
+        await _sleep(0)
+        if access_token == "token-1":
+            return ImwebResponse(status=200, data={"code": -2}, text="")
+        return ImwebResponse(status=200, data={"code": 200}, text="")
+
+    with patch.object(service, "_send", side_effect=fake_send) as mock_send:
+        responses = await asyncio.gather(
+            *(service.request("GET", "/member/members") for _ in range(20))
+        )
+
+    assert len(auth_calls) == 2  # 최초 발급 1회 + 재발급 1회
+    assert all(r.data == {"code": 200} for r in responses)
+    assert mock_send.call_count == 40
+
+
+@pytest.mark.asyncio
+async def test_upload_replays_with_new_token_and_form():
+    """이미지 업로드도 토큰 에러 시 재발급 후 새로 구성한 본문으로 재전송"""
+    auth_calls = []
+    service = make_service(auth_calls)
+    await service.get_access_token()
+    file = io.BytesIO(b"\x89PNG image")
+    sent = []
+
+    class FakeResponse:
+        def __init__(self, status: int, body: dict):
+            self.status = status
+            self.body = json.dumps(body)
+
+        async def text(self):
+            return self.body
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    class FakeSession:
+        def request(self, method, url, headers=None, data=None, **kwargs):
+            sent.append((headers, data, file.tell()))
+            file.read()  # 전송하면서 파일을 끝까지 읽음
+            if headers["access-token"] == "token-1":
+                return FakeResponse(401, {"code": -2})
+            url = "https://cdn.example.com/a.png"
+            return FakeResponse(200, {"code": 200, "data": {"files": [{"url": url}]}})
+
+    fake_client = type("FakeClient", (), {"session": FakeSession()})()
+    with patch("app.imweb.old_imweb.imweb_client", fake_client):
+        url = await service.upload_image(file, "a.png", "image/png")
+
+    assert url == "https://cdn.example.com/a.png"
+    assert len(auth_calls) == 2
+    assert [headers["access-token"] for headers, _, _ in sent] == ["token-1", "token-2"]
+    assert all("Content-Type" not in headers for headers, _, _ in sent)
+    # 재전송 본문은 새 FormData, 파일은 처음부터 다시 읽음
+    (_, first, first_position), (_, second, second_position) = sent
+    assert isinstance(second, aiohttp.FormData) and second is not first
+    assert first_position == second_position == 0
+
+
+@pytest.mark.asyncio
+async def test_refresher_renews_before_expiry():
+    """만료 임박 토큰은 백그라운드 작업이 미리 갱신"""
+    auth_calls = []
+    service = make_service(auth_calls)
+    await service.get_access_token()
+    service.token_timestamp -= 2900  # 만료 100초 전
+
+    with patch("app.imweb.old_imweb.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+        mock_sleep.side_effect = asyncio.CancelledError
+        with pytest.raises(asyncio.CancelledError):
+            await service._token_refresh_loop()
+
+    assert len(auth_calls) == 2
+    assert service.access_token == "token-2"
+
+
+def make_worker(auth_calls: list, path) -> ImwebService:
+    """같은 공유 상태 파일을 쓰는 워커 프로세스 대역"""
+    service = make_service(auth_calls)
+    service.shared_state = SharedState(str(path), poll_interval=0.005)
+    service.shared_state.open()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_workers_share_one_token(tmp_path):
+    """여러 워커가 동시에 토큰을 요청해도 /auth는 1회, 재시작 후에도 재사용"""
+    auth_calls = []
+    path = tmp_path / "shared.sqlite3"
+    workers = [make_worker(auth_calls, path) for _ in range(4)]
+
+    tokens = await asyncio.gather(*(worker.get_access_token() for worker in workers))
+
+    assert len(auth_calls) == 1
+    assert set(tokens) == {"token-1"}
+    assert len({worker.token_timestamp for worker in workers}) == 1
+    for worker in workers:
+        worker.shared_state.close()
+
+    restarted = make_worker(auth_calls, path)
+    assert await restarted.get_access_token() == "token-1"
+    assert len(auth_calls) == 1
+    restarted.shared_state.close()
+
+
+@pytest.mark.asyncio
+async def test_rejected_shared_token_is_replaced_once(tmp_path):
+    """토큰 에러 시 한 워커만 재발급하고 다른 워커는 새 토큰을 읽음"""
+    auth_calls = []
+    path = tmp_path / "shared.sqlite3"
+    first, second = make_worker(auth_calls, path), make_worker(auth_calls, path)
+    await first.get_access_token()
+    await second.get_access_token()
+
+    tokens = await asyncio.gather(
+        first.refresh_token("token-1"), second.refresh_token("token-1")
+    )
+
+    assert tokens == ["token-2", "token-2"]
+    assert len(auth_calls) == 2
+    first.shared_state.close()
+    second.shared_state.close()
@@ -0,0 +1,108 @@
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.agency_admin.agency_endpoint import router
+from app.mbti.compatibility import (
+    MBTI_MATCH_PATH,
+    SCORE_BEST,
+    SCORE_GOOD,
+    SCORE_NONE,
+    MBTICompatibility,
+    mbti_compatibility,
+)
+
+app = FastAPI()
+app.include_router(router, prefix="/agency")
+client = TestClient(app)
+
+
+def test_matrix_scores():
+    """best/good 데이터가 16x16 점수 행렬로 변환되는지 테스트"""
+    compatibility = MBTICompatibility(
+        [
+            {
+                "mbti": "INFP",
+                "section_match": {"best_match": "ENFJ, ENTJ", "good_match": "INFJ"},
+            }
+        ]
+    )
+
+    assert len(compatibility.matrix) == 16
+    assert compatibility.score("INFP", "ENFJ") == SCORE_BEST
+    assert compatibility.score("INFP", "INFJ") == SCORE_GOOD
+    assert compatibility.score("INFP", "ISTJ") == SCORE_NONE
+    assert compatibility.results["INFP"]["section_match"]["best_match"] == [
+        "ENFJ",
+        "ENTJ",
+    ]
+
+
+def test_match_lists_keep_source_order():
+    """best/good 목록은 MBTI_MAP 순서가 아닌 원본 데이터 순서로 반환"""
+    compatibility = MBTICompatibility(
+        [
+            {
+                "mbti": "INFP",
+                "section_match": {
+                    "best_match": "ENTJ, ENFJ",
+                    "good_match": "ISTJ, INFJ, ENTJ, INFJ",
+                },
+            }
+        ]
+    )
+
+    section = compatibility.results["INFP"]["section_match"]
+    assert section["best_match"] == ["ENTJ", "ENFJ"]
+    assert section["good_match"] == ["ISTJ", "INFJ"]  # best와 중복 / 반복 제외
+
+    with open(MBTI_MATCH_PATH, encoding="utf-8") as f:
+        source = {result["mbti"]: result["section_match"] for result in json.load(f)}
+    for mbti, section in source.items():
+        served = mbti_compatibility.results[mbti]["section_match"]
+        for key in ("best_match", "good_match"):
+            assert ", ".join(served[key]) == section[key]
+
+
+def test_mbti_results_route_is_not_shadowed():
+    """/mbti-results가 /{agency_id}보다 먼저 매칭되는지 테스트"""
+    response = client.get("/agency/mbti-results")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 16
+    assert "best_match" in data["INFP"]["section_match"]
+
+
+def test_single_mbti_result_with_etag():
+    """유형별 조회 및 If-None-Match 304 응답"""
+    response = client.get("/agency/mbti-result/infp")
+    assert response.status_code == 200
+    assert json.loads(response.content)["mbti"] == "INFP"
+    etag = response.headers["etag"]
+    assert etag == mbti_compatibility.etags["INFP"]
+
+    cached = client.get("/agency/mbti-result/INFP", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    # brand 코드로도 조회 가능
+    assert client.get("/agency/mbti-result/0").json()["mbti"] == "INFP"
+    assert client.get("/agency/mbti-result/XXXX").status_code == 404
+
+
+def test_mbti_results_revalidate_compressed_etag():
+    """압축 응답의 약한 ETag로도 304, 캐시 헤더 포함"""
+    headers = {"Accept-Encoding": "gzip"}
+    response = client.get("/agency/mbti-results", headers=headers)
+    assert response.headers["content-encoding"] == "gzip"
+    etag = response.headers["etag"]
+    assert etag == "W/" + mbti_compatibility.all_etag
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "max-age" in response.headers["cache-control"]
+
+    cached = client.get(
+        "/agency/mbti-results", headers={**headers, "If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
@@ -0,0 +1,173 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.mbti.mbti_result import router
+from app.mbti.write_behind import MBTIWriteQueue
+
+
+def make_queue(tmp_path, **kwargs) -> MBTIWriteQueue:
+    options = {"workers": 2, "max_attempts": 3, "retry_base": 0.01, "retry_max": 0.05}
+    options.update(kwargs)
+    return MBTIWriteQueue(path=str(tmp_path / "journal.sqlite3"), **options)
+
+
+async def wait_until_empty(queue: MBTIWriteQueue, timeout: float = 2.0):
+    for _ in range(int(timeout / 0.01)):
+        if queue.pending_count() == 0 and not queue._in_flight:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("저장 대기열이 비워지지 않음")
+
+
+@pytest.mark.asyncio
+async def test_coalesces_pending_writes(tmp_path):
+    """같은 이메일의 연속 요청은 마지막 값으로 한 번만 저장"""
+    queue = make_queue(tmp_path)
+    queue.handler.save_mbti_result = AsyncMock(return_value=True)
+    queue.open()
+    for mbti in ("INTJ", "ENFP", "ISTP"):
+        await queue.enqueue("user@example.com", mbti)
+    assert queue.pending_value("USER@example.com") == "ISTP"
+
+    queue.start()
+    await wait_until_empty(queue)
+    await queue.stop()
+
+    queue.handler.save_mbti_result.assert_awaited_once_with("user@example.com", "ISTP")
+    assert queue.pending_value("user@example.com") is None
+
+
+@pytest.mark.asyncio
+async def test_enqueue_writes_journal_off_event_loop(tmp_path):
+    """저널 쓰기는 이벤트 루프 스레드가 아닌 스레드에서 수행"""
+    queue = make_queue(tmp_path)
+    queue.open()
+    threads = []
+    record = queue._record
+
+    def tracking_record(email, mbti):
+        threads.append(threading.current_thread())
+        record(email, mbti)
+
+    queue._record = tracking_record
+    await queue.enqueue("thread@example.com", "INTP")
+
+    assert threads and threads[0] is not threading.current_thread()
+    assert queue.pending_value("thread@example.com") == "INTP"
+    assert queue.enqueued == 1
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_retries_then_moves_to_failed(tmp_path):
+    """실패 시 백오프 후 재시도, 최대 횟수 초과 시 failed로 이동"""
+    queue = make_queue(tmp_path)
+    queue.handler.save_mbti_result = AsyncMock(side_effect=[False, RuntimeError("x"), True])
+    queue.start()
+    await queue.enqueue("retry@example.com", "INFJ")
+    await wait_until_empty(queue)
+    assert queue.handler.save_mbti_result.await_count == 3
+    assert queue.saved == 1 and queue.retried == 2
+
+    queue.handler.save_mbti_result = AsyncMock(return_value=False)
+    await queue.enqueue("fail@example.com", "INFJ")
+    await wait_until_empty(queue)
+    assert queue.failed == 1
+    assert queue._db.execute("SELECT COUNT(*) FROM failed").fetchone()[0] == 1
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_journal_survives_restart(tmp_path):
+    """저장되지 않은 요청은 재시작 후 다시 처리"""
+    queue = make_queue(tmp_path)
+    queue.handler.save_mbti_result = AsyncMock(return_value=False)
+    queue.open()
+    await queue.enqueue("restart@example.com", "ESTJ")
+    queue.start()
+    await queue.stop(timeout=1)
+    assert queue.handler.save_mbti_result.await_count >= 1
+
+    restarted = make_queue(tmp_path)
+    restarted.handler.save_mbti_result = AsyncMock(return_value=True)
+    restarted.open()
+    assert restarted.pending_value("restart@example.com") == "ESTJ"
+    restarted.start()
+    await wait_until_empty(restarted)
+    await restarted.stop()
+    restarted.handler.save_mbti_result.assert_awaited_with("restart@example.com", "ESTJ")
+
+
+def test_save_route_returns_202(tmp_path):
+    """write-behind 저장은 검증 후 202 응답, 대기 중인 값은 바로 조회"""
+    queue = make_queue(tmp_path)
+    queue.open()
+    app = FastAPI()
+    app.include_router(router, prefix="/mbti")
+
+    with patch("app.mbti.mbti_result.mbti_write_queue", queue):
+        client = TestClient(app)
+        response = client.post(
+            "/mbti/result", json={"email": "route@example.com", "result": "enfp"}
+        )
+        assert response.status_code == 202
+        assert response.json()["mbti"] == "ENFP"
+
+        response = client.get("/mbti/result/route@example.com")
+        assert response.status_code == 200
+        assert response.json()["mbti"] == "ENFP"
+
+        response = client.post(
+            "/mbti/result", json={"email": "route@example.com", "result": "ABCD"}
+        )
+        assert response.status_code == 422
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_workers_share_journal(tmp_path):
+    """다른 워커가 접수한 값도 조회되고, 같은 항목은 한 워커만 처리"""
+    first, second = make_queue(tmp_path), make_queue(tmp_path)
+    first.open()
+    second.open()
+    await first.enqueue("shared@example.com", "INTJ")
+    assert second.pending_value("shared@example.com") == "INTJ"
+
+    job = first._claim()
+    assert job[0] == "shared@example.com"
+    assert second._claim() is None
+    # 처리하던 워커가 사라지면 claim 만료 후 다른 워커가 가져감
+    first._db.execute("UPDATE pending SET claim_expires_at = 0")
+    assert second._claim()[0] == "shared@example.com"
+    first.close()
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_workers_save_each_email_once(tmp_path):
+    saved = []
+
+    async def save(email, mbti):
+        saved.append(email)
+        await asyncio.sleep(0.01)
+        return True
+
+    queues = [make_queue(tmp_path, workers=3) for _ in range(3)]
+    for queue in queues:
+        queue.handler.save_mbti_result = AsyncMock(side_effect=save)
+        queue.open()
+    for no in range(30):
+        await queues[no % 3].enqueue(f"user{no}@example.com", "INFP")
+
+    for queue in queues:
+        queue.start()
+    await wait_until_empty(queues[0])
+    for queue in queues:
+        await queue.stop()
+
+    assert sorted(saved) == sorted(f"user{no}@example.com" for no in range(30))
@@ -0,0 +1,154 @@
+import asyncio
+import csv
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.imweb.old_imweb import ImwebResponse, ImwebService
+from app.member_admin.member_endpoint import router
+
+
+def member(no: int) -> dict:
+    return {
+        "member_code": f"m{no}",
+        "email": f"user{no}@example.com",
+        "name": f"회원{no}",
+        "home_page": "ENFJ",
+        "address": {"city": "서울"},
+    }
+
+
+def member_page(page: int, per_page: int, total: int, paging: bool = True):
+    start = (page - 1) * per_page
+    items = [member(no) for no in range(start + 1, min(start + per_page, total) + 1)]
+    data = {"list": items}
+    if paging:
+        data["pagenation"] = {"data_count": total, "total_page": -(-total // per_page)}
+    return ImwebResponse(status=200, data={"code": 200, "data": data}, text="")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("paging", [True, False])
+async def test_iter_members_prefetches_with_bounded_pages(paging):
+    """전체 회원을 순서대로 반환하고, 미리 요청하는 페이지 수는 제한"""
+    service = ImwebService()
+    requested = []
+    consumed = 0
+    max_ahead = 0
+
+    async def fake_request(method, path, params=None, **kwargs):
+        nonlocal max_ahead
+        requested.append(params["page"])
+        max_ahead = max(max_ahead, params["page"] - (consumed // 10 + 1))
+        await asyncio.sleep(0)
+        return member_page(params["page"], params["limit"], 95, paging=paging)
+
+    with patch.object(service, "request", side_effect=fake_request):
+        codes = []
+        async for item in service.iter_members(per_page=10, prefetch=2):
+            codes.append(item["member_code"])
+            consumed += 1
+
+    assert codes == [f"m{no}" for no in range(1, 96)]
+    assert max_ahead <= 2
+    assert max(requested) <= 12
+
+
+@pytest.mark.asyncio
+async def test_iter_members_cancels_prefetch_when_closed():
+    """소비를 중간에 멈추면 미리 요청한 페이지를 취소"""
+    service = ImwebService()
+    cancelled = []
+
+    async def fake_request(method, path, params=None, **kwargs):
+        if params["page"] > 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(params["page"])
+                raise
+        return member_page(params["page"], params["limit"], 1000)
+
+    with patch.object(service, "request", side_effect=fake_request):
+        members = service.iter_members(per_page=10, prefetch=2)
+        assert (await anext(members))["member_code"] == "m1"
+        await asyncio.sleep(0)  # 미리 요청한 페이지가 시작되도록
+        await members.aclose()
+
+    assert sorted(cancelled) == [2, 3]
+
+
+async def fake_iter_members():
+    for no in range(1, 4):
+        yield member(no)
+
+
+ADMIN_KEY = "test-admin-key"
+
+
+def make_client() -> TestClient:
+    app = FastAPI()
+    app.include_router(router, prefix="/members")
+    return TestClient(app, headers={"X-Admin-Key": ADMIN_KEY})
+
+
+@pytest.fixture(autouse=True)
+def admin_key():
+    with patch("app.common.auth.settings.ADMIN_API_KEY", ADMIN_KEY):
+        yield
+
+
+def test_export_ndjson_with_projection():
+    """NDJSON 내보내기 (선택한 필드만)"""
+    with patch(
+        "app.imweb.old_imweb.imweb_service.iter_members", side_effect=fake_iter_members
+    ):
+        response = make_client().get("/members/export?fields=email,home_page")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows == [
+        {"email": f"user{no}@example.com", "home_page": "ENFJ"} for no in range(1, 4)
+    ]
+
+
+def test_export_csv_uses_first_member_fields():
+    """CSV 내보내기 (필드 미지정 시 첫 회원 필드를 헤더로 사용)"""
+    with patch(
+        "app.imweb.old_imweb.imweb_service.iter_members", side_effect=fake_iter_members
+    ):
+        response = make_client().get("/members/export?format=csv")
+
+    assert response.status_code == 200
+    assert 'filename="members.csv"' in response.headers["content-disposition"]
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == ["member_code", "email", "name", "home_page", "address"]
+    assert rows[1][:3] == ["m1", "user1@example.com", "회원1"]
+    assert json.loads(rows[1][4]) == {"city": "서울"}
+    assert len(rows) == 4
+
+
+@pytest.mark.parametrize("key", [None, "wrong-key"])
+def test_export_requires_admin_key(key):
+    """관리자 키가 없거나 틀리면 401 (아임웹은 호출하지 않음)"""
+    client = make_client()
+    headers = {"X-Admin-Key": key} if key else {}
+    client.headers.pop("X-Admin-Key")
+    with patch("app.imweb.old_imweb.imweb_service.iter_members") as iter_members:
+        response = client.get("/members/export", headers=headers)
+
+    assert response.status_code == 401
+    iter_members.assert_not_called()
+
+
+def test_export_disabled_without_configured_key():
+    """관리자 키가 설정되지 않으면 키와 관계없이 403"""
+    with patch("app.common.auth.settings.ADMIN_API_KEY", None):
+        response = make_client().get("/members/export")
+
+    assert response.status_code == 403